@@ -20,7 +20,7 @@ const endpoints = {
     {
       method: 'GET',
       path: '/api/blueprints',
-      description: 'List all blueprints',
+      description: 'List all blueprints (?fields=summary returns list columns with fieldCount, fieldTypes and fieldPreview). Sends an ETag; If-None-Match returns 304 when unchanged',
       response: `[
   {
     "id": "uuid",
@@ -72,20 +72,37 @@ const endpoints = {
     {
       method: 'GET',
       path: '/api/blueprints/[id]',
-      description: 'Get a single blueprint by ID',
+      description: 'Get a single blueprint by ID (?version=N returns that immutable version). Sends an ETag; If-None-Match returns 304 when unchanged',
       response: `{
   "id": "uuid",
   "name": "Employment Agreement",
   "description": "...",
   "fields": [...],
+  "version": 2,
   "createdAt": "...",
   "updatedAt": "..."
+}`
+    },
+    {
+      method: 'GET',
+      path: '/api/blueprints/cache',
+      description: 'Blueprint cache counters for the serving process',
+      response: `{
+  "size": 12,
+  "maxEntries": 500,
+  "ttlMs": 60000,
+  "watching": false,
+  "hits": 950,
+  "misses": 12,
+  "evictions": 0,
+  "invalidations": 1,
+  "hitRate": 0.9875
 }`
     },
     {
       method: 'PUT',
       path: '/api/blueprints/[id]',
-      description: 'Update a blueprint (fails if contracts exist)',
+      description: 'Update a blueprint by creating a new version (existing contracts keep theirs; 409 on a concurrent edit)',
       body: `{
   "name": "Updated Name",
   "description": "Updated description",
@@ -98,17 +115,33 @@ const endpoints = {
       path: '/api/blueprints/[id]',
       description: 'Delete a blueprint (fails if contracts exist)',
       response: `{ "message": "Blueprint deleted successfully" }`
+    },
+    {
+      method: 'POST',
+      path: '/api/blueprints/repair-counts',
+      description: 'Recompute each blueprint\'s contractCount from the contracts collection; requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "blueprintsChecked": 42, "blueprintsRepaired": 1 }`
+    },
+    {
+      method: 'POST',
+      path: '/api/blueprints/migrate-versions',
+      description: 'Snapshot every blueprint\'s current version and convert legacy contracts to field values keyed by field id; requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "blueprintsVersioned": 42, "contractsMigrated": 1200, "contractsSkipped": 0 }`
     }
   ],
   contracts: [
     {
       method: 'GET',
       path: '/api/contracts',
-      description: 'List contracts with optional filtering',
+      description: 'List contracts with optional filtering. Sends an ETag (except for ?q= searches); If-None-Match returns 304 when unchanged',
       queryParams: [
         { name: 'status', description: 'Filter by exact status (created, approved, sent, signed, locked, revoked)' },
         { name: 'category', description: 'Filter by category (pending, active, signed, revoked)' },
-        { name: 'blueprintId', description: 'Filter by blueprint ID' }
+        { name: 'blueprintId', description: 'Filter by blueprint ID' },
+        { name: 'limit', description: 'Page size (1-500, default 50). Enables cursor pagination: response becomes { contracts, nextCursor }' },
+        { name: 'cursor', description: 'Opaque nextCursor value from the previous page' },
+        { name: 'fields', description: 'summary (list columns + fieldCount, historyLength) or a comma-separated list of fields' },
+        { name: 'q', description: 'Search name, template name and text field values. Every word must match; the last word matches as a prefix unless followed by a space. Ranked by relevance, always paginated (cursor-based, up to 10,000 results deep)' }
       ],
       response: `[
   {
@@ -142,16 +175,38 @@ const endpoints = {
   "name": "John Doe Employment Contract",
   "status": "created",
   ...
+}`
+    },
+    {
+      method: 'POST',
+      path: '/api/contracts/bulk',
+      description: 'Create up to 10,000 contracts from one blueprint (201 if all created, 207 with per-item results otherwise)',
+      body: `{
+  "blueprintId": "blueprint-uuid",
+  "contracts": [
+    { "name": "Acme Corp NDA", "fieldValues": { "field-id-1": "Acme Corp" } },
+    { "name": "Globex NDA" }
+  ]
+}`,
+      response: `{
+  "blueprintId": "blueprint-uuid",
+  "created": 2,
+  "failed": 0,
+  "results": [
+    { "index": 0, "id": "uuid" },
+    { "index": 1, "id": "uuid" }
+  ]
 }`
     },
     {
       method: 'GET',
       path: '/api/contracts/[id]',
-      description: 'Get a single contract by ID',
+      description: 'Get a single contract by ID. Sends an ETag derived from its version; If-None-Match returns 304 when unchanged',
       response: `{
   "id": "uuid",
   "name": "...",
   "blueprintId": "...",
+  "blueprintVersion": 1,
   "blueprintName": "...",
   "status": "created",
   "fields": [
@@ -171,6 +226,8 @@ const endpoints = {
       "note": "Contract created"
     }
   ],
+  "historyCount": 1,
+  "version": 1,
   "createdAt": "...",
   "updatedAt": "..."
 }`
@@ -178,7 +235,7 @@ const endpoints = {
     {
       method: 'PUT',
       path: '/api/contracts/[id]',
-      description: 'Update contract field values (fails for locked/revoked)',
+      description: 'Update the name and/or the submitted field values only (fails for locked/revoked). Optional If-Match with the contract ETag returns 412 if it changed since it was read',
       body: `{
   "name": "Updated Contract Name",
   "fieldValues": {
@@ -196,9 +253,10 @@ const endpoints = {
     {
       method: 'POST',
       path: '/api/contracts/[id]/transition',
-      description: 'Change contract lifecycle status',
+      description: 'Change contract lifecycle status atomically (409 if the status changed concurrently)',
       body: `{
   "newStatus": "approved",
+  "expectedStatus": "created",
   "note": "Optional note about the transition"
 }`,
       response: `{
@@ -208,15 +266,88 @@ const endpoints = {
     { "status": "created", "timestamp": "..." },
     { "status": "approved", "previousStatus": "created", "timestamp": "...", "note": "..." }
   ],
+  "historyCount": 2,
   ...
 }`
+    },
+    {
+      method: 'GET',
+      path: '/api/contracts/[id]/history',
+      description: 'Full lifecycle history, oldest first, from the contract_events collection (contracts embed only the latest 5 entries)',
+      queryParams: [
+        { name: 'limit', description: 'Page size (1-500, default 50)' },
+        { name: 'cursor', description: 'Opaque nextCursor value from the previous page' }
+      ],
+      response: `{
+  "events": [
+    { "id": "uuid", "contractId": "uuid", "blueprintId": "...", "status": "created", "timestamp": "...", "note": "Contract created" },
+    { "id": "uuid", "contractId": "uuid", "blueprintId": "...", "status": "approved", "previousStatus": "created", "timestamp": "...", "note": "..." }
+  ],
+  "total": 2,
+  "nextCursor": null
+}`
+    },
+    {
+      method: 'POST',
+      path: '/api/contracts/reindex-search',
+      description: 'Build ?q= search keys for contracts created before search existed (?all=true rebuilds every contract); requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "contractsIndexed": 1200 }`
+    },
+    {
+      method: 'POST',
+      path: '/api/contracts/migrate-history',
+      description: 'Move the embedded statusHistory of contracts created before contract_events into the collection; requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "contractsMigrated": 120, "entriesCopied": 410 }`
+    },
+    {
+      method: 'POST',
+      path: '/api/contracts/transition/bulk',
+      description: 'Move up to 5,000 contracts to one status in a single bulkWrite, with per-contract outcomes',
+      body: `{
+  "ids": ["uuid-1", "uuid-2", "uuid-3"],
+  "newStatus": "approved",
+  "note": "Optional note"
+}`,
+      response: `{
+  "newStatus": "approved",
+  "applied": 2,
+  "failed": 1,
+  "results": [
+    { "id": "uuid-1", "outcome": "applied", "previousStatus": "created" },
+    { "id": "uuid-2", "outcome": "applied", "previousStatus": "created" },
+    { "id": "uuid-3", "outcome": "rejected", "previousStatus": "locked", "error": "..." }
+  ]
+}`
+    },
+    {
+      method: 'GET',
+      path: '/api/contracts/export',
+      description: 'Stream all matching contracts as NDJSON (default) or CSV with one column per template field (?format=ndjson|csv, ?status=, ?category=, ?blueprintId=). Memory use does not depend on the number of contracts',
+      response: `id,name,blueprintId,blueprintVersion,blueprintName,status,createdAt,updatedAt,Employee Name,Start Date
+uuid,John Doe Contract,...,1,Employment Agreement,signed,...,...,John Doe,2024-02-01`
+    },
+    {
+      method: 'GET',
+      path: '/api/contracts/events',
+      description: 'Server-Sent Events stream of contract status changes. Reconnecting clients resume from Last-Event-ID',
+      queryParams: [
+        { name: 'id', description: 'Only events for one contract' },
+        { name: 'blueprintId', description: 'Only events for contracts of one blueprint' },
+        { name: 'status', description: 'Only events whose new status matches' },
+        { name: 'category', description: 'Only events whose new status is in the category (pending, active, signed, revoked)' }
+      ],
+      response: `retry: 3000
+
+id: cs.8263...
+event: contract
+data: {"id":"uuid","status":"approved","updatedAt":"...","blueprintId":"..."}`
     }
   ],
   stats: [
     {
       method: 'GET',
       path: '/api/stats',
-      description: 'Get dashboard statistics',
+      description: 'Get dashboard statistics (counters maintained on write; ?maxStaleness=0 forces a live aggregate). Sends an ETag; If-None-Match returns 304 when unchanged',
       response: `{
   "totalContracts": 10,
   "totalBlueprints": 3,
@@ -233,8 +364,105 @@ const endpoints = {
     "pending": 3,
     "signed": 3,
     "revoked": 1
+  },
+  "updatedAt": "...",
+  "reconciledAt": "..."
+}`
+    },
+    {
+      method: 'POST',
+      path: '/api/stats/reconcile',
+      description: 'Rebuild the dashboard counters from the live collections; requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "totalContracts": 10, "totalBlueprints": 3, ... }`
+    },
+    {
+      method: 'GET',
+      path: '/api/stats/timeseries',
+      description: 'Transitions per hour or day and time-in-state (?bucket=hour|day, ?from=, ?to=; hour ranges up to 31 days). timeInTransition splits each status by the status it moved to. Daily buckets come from pre-rolled rollups; medians are estimated from ~19%-wide histogram buckets',
+      response: `{
+  "bucket": "day",
+  "from": "2026-09-17T00:00:00.000Z",
+  "to": "2026-10-18T00:00:00.000Z",
+  "series": [
+    { "bucket": "2026-10-17", "counts": { "created": 40, "approved": 31, "sent": 25, "signed": 12, "locked": 9, "revoked": 1 } }
+  ],
+  "timeInState": {
+    "sent": { "count": 12, "medianMs": 153000000, "p90Ms": 431000000 }
+  },
+  "timeInTransition": {
+    "sent": {
+      "signed": { "count": 11, "medianMs": 128000000, "p90Ms": 304000000 },
+      "revoked": { "count": 1, "medianMs": 1210000000, "p90Ms": 1210000000 }
+    }
   }
 }`
+    },
+    {
+      method: 'POST',
+      path: '/api/stats/timeseries/rebuild',
+      description: 'Recompute the daily rollups from contract_events (?from=, ?to=; default all history); requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "from": "...", "to": "...", "daysRebuilt": 180, "eventsScanned": 412000 }`
+    },
+    {
+      method: 'GET',
+      path: '/api/health',
+      description: 'Readiness of the serving process: MongoDB ping and connection pool usage with recent checkout waits (503 while MongoDB is unreachable)',
+      response: `{
+  "status": "ok",
+  "uptimeSeconds": 3600,
+  "memory": { "rssBytes": 183500800, "heapUsedBytes": 61200000 },
+  "mongo": {
+    "pingMs": 0.8,
+    "pool": {
+      "maxPoolSize": 100,
+      "minPoolSize": 10,
+      "open": 12,
+      "inUse": 2,
+      "available": 10,
+      "waiting": 0,
+      "checkoutFailures": 0,
+      "checkoutWaitMs": { "samples": 1000, "p50": 0, "p95": 1, "max": 14 }
+    }
+  }
+}`
+    },
+    {
+      method: 'GET',
+      path: '/api/metrics',
+      description: 'Prometheus metrics of this server process: per-route latency, status, response size and MongoDB time, plus per-collection MongoDB command latency',
+      response: `# TYPE agreementhub_http_request_duration_seconds histogram
+agreementhub_http_request_duration_seconds_bucket{route="/api/contracts",method="GET",status="200",le="0.05"} 118
+...
+agreementhub_mongodb_command_duration_seconds_sum{collection="contracts",command="find"} 0.84`
+    },
+    {
+      method: 'GET',
+      path: '/api/scheduler',
+      description: 'Lifecycle scheduler of this server process: enabled jobs, lease holder and the last run of each job',
+      response: `{
+  "enabled": true,
+  "started": true,
+  "leader": true,
+  "leaseExpiresAt": "...",
+  "intervalMs": 60000,
+  "batchSize": 500,
+  "jobs": [
+    {
+      "name": "auto-lock",
+      "fromStatus": "signed",
+      "toStatus": "locked",
+      "afterDays": 30,
+      "enabled": true,
+      "lastRun": { "batches": 3, "processed": 1200, "outcomes": { "applied": 1200, "conflict": 0, "rejected": 0, "not_found": 0 }, "complete": true, "remaining": 0, "durationMs": 840 }
+    }
+  ]
+}`
+    },
+    {
+      method: 'POST',
+      path: '/api/scheduler',
+      description: 'Run the enabled scheduler jobs now (409 while another instance holds the lease); requires Authorization: Bearer <ADMIN_TOKEN>',
+      response: `{ "runs": { "auto-lock": { "processed": 1200, "complete": true, ... } }, "status": { ... } }`
     }
   ]
 };
@@ -434,7 +662,7 @@ export default function ApiDocsPage() {
   "error": "Human-readable error message"
 }`}
             </pre>
-            <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+            <div className="grid grid-cols-2 md:grid-cols-5 gap-4">
               <div className="flex items-center gap-2">
                 <Badge variant="outline" className="bg-green-50">200</Badge>
                 <span className="text-sm">Success</span>
@@ -451,6 +679,14 @@ export default function ApiDocsPage() {
                 <Badge variant="outline" className="bg-red-50">404</Badge>
                 <span className="text-sm">Not Found</span>
               </div>
+              <div className="flex items-center gap-2">
+                <Badge variant="outline" className="bg-orange-50">409</Badge>
+                <span className="text-sm">Conflict</span>
+              </div>
+              <div className="flex items-center gap-2">
+                <Badge variant="outline" className="bg-orange-50">412</Badge>
+                <span className="text-sm">Precondition Failed</span>
+              </div>
             </div>
           </CardContent>
         </Card>
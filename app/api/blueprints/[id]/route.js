@@ -1,47 +1,69 @@
 import { NextResponse } from 'next/server';
 import { getCollection } from '@/lib/db';
-
-// GET /api/blueprints/[id] - Get a single blueprint
-export async function GET(request, { params }) {
+import { recordBlueprintsChanged } from '@/lib/stats';
+import { getBlueprint, invalidateBlueprint } from '@/lib/blueprint-cache';
+import { writeIfUnreferenced } from '@/lib/blueprint-counts';
+import { getBlueprintVersion, normalizeBlueprintFields, saveBlueprintVersion } from '@/lib/blueprint-versions';
+import { conditionalJson, etagFor } from '@/lib/http';
+import { fieldErrorsBody, validateBlueprintFields } from '@/lib/schema';
+import { withMetrics } from '@/lib/metrics';
+
+// GET /api/blueprints/[id] - Get a single blueprint (supports If-None-Match)
+// ?version=N returns that immutable version instead of the current one.
+export const GET = withMetrics('/api/blueprints/[id]', async function GET(request, { params }) {
   try {
     const { id } = params;
-    const blueprints = await getCollection('blueprints');
-    const blueprint = await blueprints.findOne({ id });
+    const versionParam = new URL(request.url).searchParams.get('version');
+    if (versionParam !== null) {
+      return getVersion(request, id, versionParam);
+    }
+
+    const blueprint = await getBlueprint(id);
 
     if (!blueprint) {
       return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
     }
 
-    return NextResponse.json(blueprint);
+    const { contractCount, ...body } = blueprint;
+    return conditionalJson(request, etagFor(blueprint.id, blueprint.version, blueprint.updatedAt), body);
   } catch (error) {
     console.error('Error fetching blueprint:', error);
     return NextResponse.json({ error: 'Failed to fetch blueprint' }, { status: 500 });
   }
+});
+
+async function getVersion(request, id, versionParam) {
+  const version = /^[1-9]\d*$/.test(versionParam) ? Number(versionParam) : null;
+  if (version === null) {
+    return NextResponse.json({ error: 'Version must be a positive integer' }, { status: 400 });
+  }
+
+  const snapshot = await getBlueprintVersion(id, version);
+  if (!snapshot) {
+    return NextResponse.json({ error: 'Blueprint version not found' }, { status: 404 });
+  }
+
+  const { blueprintId, ...body } = snapshot;
+  // Versions never change, so clients may cache them for good
+  return conditionalJson(
+    request,
+    etagFor(blueprintId, version),
+    { id: blueprintId, ...body },
+    { cacheControl: 'private, max-age=31536000, immutable' }
+  );
 }
 
 // PUT /api/blueprints/[id] - Update a blueprint
-export async function PUT(request, { params }) {
+// Every update creates a new immutable version. Existing contracts keep
+// referencing the version they were created from, so blueprints stay editable
+// while they are in use. The head is swapped with a compare-and-set on its
+// version number; a concurrent edit gets a 409.
+export const PUT = withMetrics('/api/blueprints/[id]', async function PUT(request, { params }) {
   try {
     const { id } = params;
     const body = await request.json();
     const { name, description, fields } = body;
 
-    const blueprints = await getCollection('blueprints');
-    const existing = await blueprints.findOne({ id });
-
-    if (!existing) {
-      return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
-    }
-
-    // Check if blueprint is used in any contracts
-    const contracts = await getCollection('contracts');
-    const contractCount = await contracts.countDocuments({ blueprintId: id });
-    if (contractCount > 0) {
-      return NextResponse.json({ 
-        error: 'Cannot modify blueprint that has existing contracts. Create a new version instead.' 
-      }, { status: 400 });
-    }
-
     // Validation
     if (name !== undefined && (typeof name !== 'string' || name.trim() === '')) {
       return NextResponse.json({ error: 'Name cannot be empty' }, { status: 400 });
@@ -52,67 +74,79 @@ export async function PUT(request, { params }) {
         return NextResponse.json({ error: 'At least one field is required' }, { status: 400 });
       }
 
-      const validFieldTypes = ['text', 'date', 'signature', 'checkbox'];
-      for (const field of fields) {
-        if (!field.type || !validFieldTypes.includes(field.type)) {
-          return NextResponse.json({ error: `Invalid field type: ${field.type}` }, { status: 400 });
-        }
-        if (!field.label || typeof field.label !== 'string') {
-          return NextResponse.json({ error: 'Each field must have a label' }, { status: 400 });
-        }
+      const fieldErrors = validateBlueprintFields(fields);
+      if (fieldErrors.length > 0) {
+        return NextResponse.json(fieldErrorsBody('Invalid fields', fieldErrors), { status: 400 });
       }
     }
 
+    const blueprints = await getCollection('blueprints');
+    const current = await blueprints.findOne({ id }, { projection: { _id: 0, contractCount: 0 } });
+    if (!current) {
+      return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
+    }
+
     const updateData = {
+      name: name !== undefined ? name.trim() : current.name,
+      description: description !== undefined ? description.trim() : (current.description || ''),
+      // Existing field ids are kept for fields submitted without one
+      fields: fields !== undefined ? normalizeBlueprintFields(fields, current.fields) : current.fields,
+      version: (current.version ?? 1) + 1,
       updatedAt: new Date().toISOString()
     };
 
-    if (name !== undefined) updateData.name = name.trim();
-    if (description !== undefined) updateData.description = description.trim();
-    if (fields !== undefined) {
-      updateData.fields = fields.map((f, index) => ({
-        id: f.id || existing.fields[index]?.id || require('uuid').v4(),
-        type: f.type,
-        label: f.label.trim(),
-        position: f.position || { x: 0, y: index * 60 },
-        required: f.required || false
-      }));
-    }
+    // Contracts may still be created from the current version until the head
+    // moves on; make sure it is snapshotted (blueprints predating versioning)
+    await saveBlueprintVersion(current);
 
-    await blueprints.updateOne({ id }, { $set: updateData });
-    const updated = await blueprints.findOne({ id });
+    const updated = await blueprints.findOneAndUpdate(
+      { id, version: current.version ?? null },
+      { $set: updateData },
+      { returnDocument: 'after', projection: { contractCount: 0 } }
+    );
 
+    if (!updated) {
+      return NextResponse.json({ error: 'Blueprint was modified concurrently. Reload and try again.' }, { status: 409 });
+    }
+
+    // If this fails, the snapshot is written from the head on first use
+    await saveBlueprintVersion(updated);
+    invalidateBlueprint(id);
     return NextResponse.json(updated);
   } catch (error) {
     console.error('Error updating blueprint:', error);
     return NextResponse.json({ error: 'Failed to update blueprint' }, { status: 500 });
   }
-}
+});
 
-// DELETE /api/blueprints/[id] - Delete a blueprint
-export async function DELETE(request, { params }) {
+// DELETE /api/blueprints/[id] - Delete a blueprint (only if no contracts reference it)
+export const DELETE = withMetrics('/api/blueprints/[id]', async function DELETE(request, { params }) {
   try {
     const { id } = params;
     const blueprints = await getCollection('blueprints');
-    const existing = await blueprints.findOne({ id });
+    const { result: deleted, notFound } = await writeIfUnreferenced(id, async () => {
+      const { deletedCount } = await blueprints.deleteOne({ id, contractCount: 0 });
+      return deletedCount > 0;
+    });
 
-    if (!existing) {
+    if (notFound) {
       return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
     }
 
-    // Check if blueprint is used in any contracts
-    const contracts = await getCollection('contracts');
-    const contractCount = await contracts.countDocuments({ blueprintId: id });
-    if (contractCount > 0) {
+    if (!deleted) {
       return NextResponse.json({ 
         error: 'Cannot delete blueprint that has existing contracts' 
       }, { status: 400 });
     }
 
-    await blueprints.deleteOne({ id });
+    invalidateBlueprint(id);
+    // Nothing references the versions of a deleted blueprint any more
+    const versions = await getCollection('blueprint_versions');
+    await versions.deleteMany({ blueprintId: id });
+    await recordBlueprintsChanged(-1);
     return NextResponse.json({ message: 'Blueprint deleted successfully' });
   } catch (error) {
     console.error('Error deleting blueprint:', error);
     return NextResponse.json({ error: 'Failed to delete blueprint' }, { status: 500 });
   }
-}
+});
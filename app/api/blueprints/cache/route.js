@@ -0,0 +1,8 @@
+import { NextResponse } from 'next/server';
+import { getBlueprintCacheStats } from '@/lib/blueprint-cache';
+import { withMetrics } from '@/lib/metrics';
+
+// GET /api/blueprints/cache - Blueprint cache counters for this server process
+export const GET = withMetrics('/api/blueprints/cache', async function GET() {
+  return NextResponse.json(getBlueprintCacheStats());
+});
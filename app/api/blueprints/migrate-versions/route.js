@@ -0,0 +1,18 @@
+import { NextResponse } from 'next/server';
+import { migrateBlueprintVersions } from '@/lib/blueprint-versions';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// POST /api/blueprints/migrate-versions - Snapshot blueprint versions and convert legacy contracts to values by field id
+export const POST = withMetrics('/api/blueprints/migrate-versions', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const result = await migrateBlueprintVersions();
+    return NextResponse.json(result);
+  } catch (error) {
+    console.error('Error migrating blueprint versions:', error);
+    return NextResponse.json({ error: 'Failed to migrate blueprint versions' }, { status: 500 });
+  }
+});
@@ -0,0 +1,18 @@
+import { NextResponse } from 'next/server';
+import { repairContractCounts } from '@/lib/blueprint-counts';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// POST /api/blueprints/repair-counts - Recompute blueprint contractCount from the contracts collection
+export const POST = withMetrics('/api/blueprints/repair-counts', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const result = await repairContractCounts();
+    return NextResponse.json(result);
+  } catch (error) {
+    console.error('Error repairing blueprint contract counts:', error);
+    return NextResponse.json({ error: 'Failed to repair contract counts' }, { status: 500 });
+  }
+});
@@ -1,21 +1,38 @@
 import { NextResponse } from 'next/server';
 import { getCollection } from '@/lib/db';
 import { v4 as uuidv4 } from 'uuid';
+import { recordBlueprintsChanged } from '@/lib/stats';
+import { BLUEPRINT_LIST_FIELDS, parseFieldsParam } from '@/lib/projection';
+import { conditionalJson, listEtag } from '@/lib/http';
+import { normalizeBlueprintFields, saveBlueprintVersion } from '@/lib/blueprint-versions';
+import { fieldErrorsBody, validateBlueprintFields } from '@/lib/schema';
+import { withMetrics } from '@/lib/metrics';
 
 // GET /api/blueprints - List all blueprints
-export async function GET(request) {
+// ?fields=summary returns list columns plus fieldCount, fieldTypes and a 6-field preview
+// Supports If-None-Match; the ETag is derived from max(updatedAt) and the count.
+export const GET = withMetrics('/api/blueprints', async function GET(request) {
   try {
+    const { searchParams } = new URL(request.url);
+    const fields = searchParams.get('fields');
+    const { projection, error: fieldsError } = parseFieldsParam(fields, BLUEPRINT_LIST_FIELDS);
+    if (fieldsError) {
+      return NextResponse.json({ error: fieldsError }, { status: 400 });
+    }
+
     const blueprints = await getCollection('blueprints');
-    const result = await blueprints.find({}).sort({ createdAt: -1 }).limit(1000).toArray();
-    return NextResponse.json(result);
+    const etag = await listEtag(blueprints, {}, 'blueprints', fields);
+    return conditionalJson(request, etag, () =>
+      blueprints.find({}, { projection }).sort({ createdAt: -1 }).limit(1000).toArray()
+    );
   } catch (error) {
     console.error('Error fetching blueprints:', error);
     return NextResponse.json({ error: 'Failed to fetch blueprints' }, { status: 500 });
   }
-}
+});
 
 // POST /api/blueprints - Create a new blueprint
-export async function POST(request) {
+export const POST = withMetrics('/api/blueprints', async function POST(request) {
   try {
     const body = await request.json();
     const { name, description, fields } = body;
@@ -29,38 +46,31 @@ export async function POST(request) {
       return NextResponse.json({ error: 'At least one field is required' }, { status: 400 });
     }
 
-    // Validate each field
-    const validFieldTypes = ['text', 'date', 'signature', 'checkbox'];
-    for (const field of fields) {
-      if (!field.type || !validFieldTypes.includes(field.type)) {
-        return NextResponse.json({ error: `Invalid field type: ${field.type}` }, { status: 400 });
-      }
-      if (!field.label || typeof field.label !== 'string') {
-        return NextResponse.json({ error: 'Each field must have a label' }, { status: 400 });
-      }
+    const fieldErrors = validateBlueprintFields(fields);
+    if (fieldErrors.length > 0) {
+      return NextResponse.json(fieldErrorsBody('Invalid fields', fieldErrors), { status: 400 });
     }
 
     const blueprint = {
       id: uuidv4(),
       name: name.trim(),
       description: description?.trim() || '',
-      fields: fields.map((f, index) => ({
-        id: f.id || uuidv4(),
-        type: f.type,
-        label: f.label.trim(),
-        position: f.position || { x: 0, y: index * 60 },
-        required: f.required || false
-      })),
+      fields: normalizeBlueprintFields(fields),
+      version: 1,
+      contractCount: 0,
       createdAt: new Date().toISOString(),
       updatedAt: new Date().toISOString()
     };
 
     const blueprints = await getCollection('blueprints');
     await blueprints.insertOne(blueprint);
+    await saveBlueprintVersion(blueprint);
+    await recordBlueprintsChanged(1);
 
-    return NextResponse.json(blueprint, { status: 201 });
+    const { contractCount, ...created } = blueprint;
+    return NextResponse.json(created, { status: 201 });
   } catch (error) {
     console.error('Error creating blueprint:', error);
     return NextResponse.json({ error: 'Failed to create blueprint' }, { status: 500 });
   }
-}
+});
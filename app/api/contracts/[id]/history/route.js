@@ -0,0 +1,56 @@
+import { NextResponse } from 'next/server';
+import { getCollection } from '@/lib/db';
+import { decodeCursor, encodeCursor, parseLimit } from '@/lib/pagination';
+import { listContractEvents, migrateContractHistory } from '@/lib/contract-events';
+import { withMetrics } from '@/lib/metrics';
+
+// GET /api/contracts/[id]/history - Lifecycle events, oldest first
+// Query: ?limit= (default 50, max 500), ?cursor= (nextCursor of the previous page)
+export const GET = withMetrics('/api/contracts/[id]/history', async function GET(request, { params }) {
+  try {
+    const { id } = params;
+    const { searchParams } = new URL(request.url);
+
+    const limit = parseLimit(searchParams.get('limit'));
+    if (limit === null) {
+      return NextResponse.json({ error: 'limit must be a positive integer' }, { status: 400 });
+    }
+
+    const cursorParam = searchParams.get('cursor');
+    let after;
+    if (cursorParam) {
+      after = decodeCursor(cursorParam, 'timestamp');
+      if (!after) {
+        return NextResponse.json({ error: 'Invalid cursor' }, { status: 400 });
+      }
+    }
+
+    const contracts = await getCollection('contracts');
+    const contract = await contracts.findOne(
+      { id },
+      { projection: { _id: 0, id: 1, blueprintId: 1, statusHistory: 1, historyCount: 1 } }
+    );
+
+    if (!contract) {
+      return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
+    }
+
+    // Contracts created before contract_events existed are moved over on first read
+    if (contract.historyCount === undefined) {
+      await migrateContractHistory(contract);
+    }
+
+    const page = await listContractEvents(id, { limit: limit + 1, after });
+    const hasMore = page.length > limit;
+    const events = hasMore ? page.slice(0, limit) : page;
+
+    return NextResponse.json({
+      events,
+      total: contract.historyCount ?? contract.statusHistory?.length ?? 0,
+      nextCursor: hasMore ? encodeCursor(events[events.length - 1], 'timestamp') : null
+    });
+  } catch (error) {
+    console.error('Error fetching contract history:', error);
+    return NextResponse.json({ error: 'Failed to fetch contract history' }, { status: 500 });
+  }
+});
@@ -1,98 +1,157 @@
 import { NextResponse } from 'next/server';
 import { getCollection } from '@/lib/db';
-import { isImmutable, CONTRACT_STATES } from '@/lib/lifecycle';
-
-// GET /api/contracts/[id] - Get a single contract
-export async function GET(request, { params }) {
+import { isImmutable, CONTRACT_STATES, IMMUTABLE_STATES } from '@/lib/lifecycle';
+import { recordContractDeleted } from '@/lib/stats';
+import { removeContractReferences } from '@/lib/blueprint-counts';
+import { deleteContractEvents } from '@/lib/contract-events';
+import { HIDE_SEARCH_FIELDS, buildSearchFields } from '@/lib/search';
+import { buildFieldValueUpdate, buildValuesUpdate, legacyContractSchema, validateFieldValues } from '@/lib/contracts';
+import { fieldErrorsBody, getSchema } from '@/lib/schema';
+import { getBlueprintVersion, hydrateContract, hydrateStoredContract } from '@/lib/blueprint-versions';
+import { conditionalJson, ifMatchFilter, versionEtag } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// GET /api/contracts/[id] - Get a single contract (supports If-None-Match)
+export const GET = withMetrics('/api/contracts/[id]', async function GET(request, { params }) {
   try {
     const { id } = params;
     const contracts = await getCollection('contracts');
-    const contract = await contracts.findOne({ id });
+    const contract = await contracts.findOne({ id }, { projection: HIDE_SEARCH_FIELDS });
 
     if (!contract) {
       return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
     }
 
-    return NextResponse.json(contract);
+    return conditionalJson(request, versionEtag(contract), () => hydrateStoredContract(contract));
   } catch (error) {
     console.error('Error fetching contract:', error);
     return NextResponse.json({ error: 'Failed to fetch contract' }, { status: 500 });
   }
-}
-
-// PUT /api/contracts/[id] - Update contract field values
-export async function PUT(request, { params }) {
+});
+
+// PUT /api/contracts/[id] - Update contract name and/or field values
+// Only the submitted fields are written (values.<fieldId>, or array filters on
+// fields.id for legacy contracts), in one findOneAndUpdate guarded against
+// immutable states. An optional If-Match with the contract's ETag makes the
+// write conditional on the version it was read at.
+export const PUT = withMetrics('/api/contracts/[id]', async function PUT(request, { params }) {
   try {
     const { id } = params;
     const body = await request.json();
     const { name, fieldValues } = body;
 
-    const contracts = await getCollection('contracts');
-    const existing = await contracts.findOne({ id });
-
-    if (!existing) {
-      return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
-    }
-
-    // Check if contract is immutable
-    if (isImmutable(existing.status)) {
-      return NextResponse.json({ 
-        error: `Cannot modify contract in ${existing.status} state` 
-      }, { status: 400 });
-    }
-
-    const updateData = {
-      updatedAt: new Date().toISOString()
+    const update = {
+      $set: { updatedAt: new Date().toISOString() },
+      $inc: { version: 1 }
     };
+    let arrayFilters = [];
 
     if (name !== undefined) {
       if (typeof name !== 'string' || name.trim() === '') {
         return NextResponse.json({ error: 'Name cannot be empty' }, { status: 400 });
       }
-      updateData.name = name.trim();
+      update.$set.name = name.trim();
+    }
+
+    const fieldValuesError = validateFieldValues(fieldValues);
+    if (fieldValuesError) {
+      return NextResponse.json({ error: fieldValuesError }, { status: 400 });
+    }
+
+    const precondition = ifMatchFilter(request);
+    if (precondition === null) {
+      return NextResponse.json({ error: 'Contract was modified by someone else' }, { status: 412 });
     }
 
+    const contracts = await getCollection('contracts');
+    const filter = { id, status: { $nin: IMMUTABLE_STATES }, ...precondition };
+    let version = null;
+    let schema = null;
+
     if (fieldValues !== undefined) {
-      // Update field values
-      updateData.fields = existing.fields.map(field => {
-        if (fieldValues.hasOwnProperty(field.id)) {
-          const newValue = fieldValues[field.id];
-          let value;
-
-          switch (field.type) {
-            case 'checkbox':
-              value = newValue === true || newValue === 'true';
-              break;
-            case 'date':
-              value = newValue || null;
-              break;
-            case 'signature':
-              value = newValue || null;
-              break;
-            case 'text':
-            default:
-              value = newValue !== undefined ? String(newValue) : '';
-              break;
-          }
-
-          return { ...field, value };
-        }
-        return field;
+      // Values are checked and coerced with the field types of the contract's
+      // blueprint version (or, for legacy contracts, its embedded field
+      // definitions); neither changes under a contract, so this read cannot
+      // race the write
+      const ref = await contracts.findOne({ id }, {
+        projection: { _id: 0, blueprintId: 1, blueprintVersion: 1, 'fields.id': 1, 'fields.type': 1, 'fields.label': 1 }
       });
+      if (!ref) {
+        return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
+      }
+      let fieldUpdate;
+      if (ref.blueprintVersion !== undefined) {
+        version = await getBlueprintVersion(ref.blueprintId, ref.blueprintVersion);
+        if (!version) {
+          throw new Error(`Blueprint ${ref.blueprintId} version ${ref.blueprintVersion} not found`);
+        }
+        schema = getSchema(version);
+        fieldUpdate = buildValuesUpdate(schema, fieldValues);
+        filter.blueprintVersion = ref.blueprintVersion;
+      } else {
+        schema = legacyContractSchema(ref);
+        fieldUpdate = buildFieldValueUpdate(schema, fieldValues);
+        arrayFilters = fieldUpdate.arrayFilters;
+        filter.values = { $exists: false };
+      }
+      if (fieldUpdate.errors.length > 0) {
+        return NextResponse.json(fieldErrorsBody('Invalid field values', fieldUpdate.errors), { status: 400 });
+      }
+      Object.assign(update.$set, fieldUpdate.set);
     }
 
-    await contracts.updateOne({ id }, { $set: updateData });
-    const updated = await contracts.findOne({ id });
+    const stored = await contracts.findOneAndUpdate(
+      filter,
+      update,
+      {
+        returnDocument: 'after',
+        projection: HIDE_SEARCH_FIELDS,
+        ...(arrayFilters.length > 0 ? { arrayFilters } : {})
+      }
+    );
+
+    if (!stored) {
+      return rejectUpdate(contracts, id);
+    }
 
-    return NextResponse.json(updated);
+    const updated = version ? hydrateContract(stored, version) : await hydrateStoredContract(stored);
+
+    const textChanged = schema !== null && schema.hasTextField(Object.keys(fieldValues));
+    if (name !== undefined || textChanged) {
+      // Search keys cover every text field, so they are rebuilt from the updated
+      // document; the version guard leaves a newer concurrent edit's keys alone
+      await contracts.updateOne(
+        { id, version: updated.version },
+        { $set: { search: buildSearchFields(updated) } }
+      );
+    }
+
+    return NextResponse.json(updated, { headers: { ETag: versionEtag(updated) } });
   } catch (error) {
     console.error('Error updating contract:', error);
     return NextResponse.json({ error: 'Failed to update contract' }, { status: 500 });
   }
+});
+
+// Work out why the guarded update matched nothing. Only runs on the failure path.
+async function rejectUpdate(contracts, id) {
+  const existing = await contracts.findOne({ id }, { projection: { _id: 0, status: 1 } });
+
+  if (!existing) {
+    return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
+  }
+
+  if (isImmutable(existing.status)) {
+    return NextResponse.json({ 
+      error: `Cannot modify contract in ${existing.status} state` 
+    }, { status: 400 });
+  }
+
+  return NextResponse.json({ error: 'Contract was modified by someone else' }, { status: 412 });
 }
 
 // DELETE /api/contracts/[id] - Delete a contract (only if in created state)
-export async function DELETE(request, { params }) {
+export const DELETE = withMetrics('/api/contracts/[id]', async function DELETE(request, { params }) {
   try {
     const { id } = params;
     const contracts = await getCollection('contracts');
@@ -109,10 +168,15 @@ export async function DELETE(request, { params }) {
       }, { status: 400 });
     }
 
-    await contracts.deleteOne({ id });
+    const { deletedCount } = await contracts.deleteOne({ id, status: CONTRACT_STATES.CREATED });
+    if (deletedCount > 0) {
+      await removeContractReferences(existing.blueprintId);
+      await deleteContractEvents(id);
+      await recordContractDeleted(CONTRACT_STATES.CREATED);
+    }
     return NextResponse.json({ message: 'Contract deleted successfully' });
   } catch (error) {
     console.error('Error deleting contract:', error);
     return NextResponse.json({ error: 'Failed to delete contract' }, { status: 500 });
   }
-}
+});
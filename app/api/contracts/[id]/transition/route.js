@@ -1,13 +1,30 @@
 import { NextResponse } from 'next/server';
 import { getCollection } from '@/lib/db';
-import { isValidTransition, isImmutable, getValidNextStates, CONTRACT_STATES } from '@/lib/lifecycle';
+import { isValidTransition, getValidSourceStates, CONTRACT_STATES } from '@/lib/lifecycle';
+import {
+  TRANSITION_CHECK_PROJECTION,
+  checkTransition,
+  invalidTransitionMessage,
+  transitionEntry,
+  transitionFilter,
+  transitionUpdate
+} from '@/lib/transitions';
+import { recordTransition } from '@/lib/stats';
+import { buildContractEvent, recordContractEvents } from '@/lib/contract-events';
+import { HIDE_SEARCH_FIELDS } from '@/lib/search';
+import { versionEtag } from '@/lib/http';
+import { getBlueprintVersion, hydrateContract, hydrateStoredContract } from '@/lib/blueprint-versions';
+import { getSchema } from '@/lib/schema';
+import { withMetrics } from '@/lib/metrics';
 
 // POST /api/contracts/[id]/transition - Change contract lifecycle status
-export async function POST(request, { params }) {
+// The update is a single findOneAndUpdate guarded on the source status, so
+// concurrent transitions cannot both succeed; the loser gets a 409.
+export const POST = withMetrics('/api/contracts/[id]/transition', async function POST(request, { params }) {
   try {
     const { id } = params;
     const body = await request.json();
-    const { newStatus, note } = body;
+    const { newStatus, note, expectedStatus } = body;
 
     // Validation
     if (!newStatus) {
@@ -21,60 +38,96 @@ export async function POST(request, { params }) {
       }, { status: 400 });
     }
 
-    const contracts = await getCollection('contracts');
-    const existing = await contracts.findOne({ id });
-
-    if (!existing) {
-      return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
-    }
-
-    // Check if contract is already in a terminal state
-    if (isImmutable(existing.status)) {
+    if (expectedStatus !== undefined && !validStatuses.includes(expectedStatus)) {
       return NextResponse.json({ 
-        error: `Contract is ${existing.status} and cannot be modified` 
+        error: `Invalid expected status. Must be one of: ${validStatuses.join(', ')}` 
       }, { status: 400 });
     }
 
-    // Validate the transition
-    if (!isValidTransition(existing.status, newStatus)) {
-      const validNextStates = getValidNextStates(existing.status);
-      return NextResponse.json({ 
-        error: `Invalid transition from ${existing.status} to ${newStatus}. Valid transitions: ${validNextStates.join(', ') || 'none'}` 
-      }, { status: 400 });
+    if (expectedStatus && !isValidTransition(expectedStatus, newStatus)) {
+      return NextResponse.json({ error: invalidTransitionMessage(expectedStatus, newStatus) }, { status: 400 });
     }
 
-    // For signing, check that all required signature fields have values
-    if (newStatus === CONTRACT_STATES.SIGNED) {
-      const unsignedFields = existing.fields.filter(
-        f => f.type === 'signature' && f.required && !f.value
-      );
-      if (unsignedFields.length > 0) {
-        return NextResponse.json({ 
-          error: `Cannot sign contract. Missing required signatures: ${unsignedFields.map(f => f.label).join(', ')}` 
-        }, { status: 400 });
+    const contracts = await getCollection('contracts');
+
+    // Pin the source status: the one the caller saw, the only state that can
+    // reach newStatus, or (when several can, e.g. revoke) the current status.
+    let fromStatus = expectedStatus;
+    let observed = Boolean(expectedStatus);
+    if (!fromStatus) {
+      const sources = getValidSourceStates(newStatus);
+      if (sources.length === 1) {
+        fromStatus = sources[0];
+      } else {
+        const current = await contracts.findOne({ id }, { projection: { _id: 0, status: 1 } });
+        if (!current) {
+          return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
+        }
+        fromStatus = current.status;
+        observed = true;
       }
     }
 
-    // Create status history entry
-    const historyEntry = {
-      status: newStatus,
-      previousStatus: existing.status,
-      timestamp: new Date().toISOString(),
-      note: note || `Status changed to ${newStatus}`
-    };
+    if (isValidTransition(fromStatus, newStatus)) {
+      // Signing a versioned contract is guarded on the required signature
+      // fields of its blueprint version
+      let version = null;
+      if (newStatus === CONTRACT_STATES.SIGNED) {
+        const ref = await contracts.findOne({ id }, { projection: { _id: 0, blueprintId: 1, blueprintVersion: 1 } });
+        if (ref?.blueprintVersion !== undefined) {
+          version = await getBlueprintVersion(ref.blueprintId, ref.blueprintVersion);
+          if (!version) {
+            throw new Error(`Blueprint ${ref.blueprintId} version ${ref.blueprintVersion} not found`);
+          }
+        }
+      }
 
-    const updateData = {
-      status: newStatus,
-      updatedAt: new Date().toISOString(),
-      statusHistory: [...(existing.statusHistory || []), historyEntry]
-    };
+      const entry = transitionEntry(fromStatus, newStatus, note, new Date().toISOString());
+      const stored = await contracts.findOneAndUpdate(
+        transitionFilter(id, fromStatus, newStatus, version && getSchema(version).signatureIds),
+        transitionUpdate(entry),
+        { returnDocument: 'after', projection: HIDE_SEARCH_FIELDS }
+      );
 
-    await contracts.updateOne({ id }, { $set: updateData });
-    const updated = await contracts.findOne({ id });
+      if (stored) {
+        const updated = version ? hydrateContract(stored, version) : await hydrateStoredContract(stored);
+        await recordContractEvents([buildContractEvent(updated, entry, updated.statusHistory.at(-2)?.timestamp)]);
+        await recordTransition(fromStatus, newStatus);
+        return NextResponse.json(updated, { headers: { ETag: versionEtag(updated) } });
+      }
+    }
 
-    return NextResponse.json(updated);
+    return rejectTransition(contracts, id, newStatus, fromStatus, observed);
   } catch (error) {
     console.error('Error transitioning contract:', error);
     return NextResponse.json({ error: 'Failed to transition contract' }, { status: 500 });
   }
+});
+
+// Work out why the guarded update matched nothing. Only runs on the failure path.
+async function rejectTransition(contracts, id, newStatus, fromStatus, observed) {
+  const existing = await hydrateStoredContract(
+    await contracts.findOne({ id }, { projection: TRANSITION_CHECK_PROJECTION })
+  );
+
+  if (!existing) {
+    return NextResponse.json({ error: 'Contract not found' }, { status: 404 });
+  }
+
+  // The status moved after the caller (or our own read) saw it, or a
+  // concurrent request already applied this exact transition
+  if (existing.status !== fromStatus && (observed || existing.status === newStatus)) {
+    return NextResponse.json({ 
+      error: `Contract status changed concurrently (now ${existing.status})` 
+    }, { status: 409 });
+  }
+
+  const error = checkTransition(existing, newStatus);
+  if (error) {
+    return NextResponse.json({ error }, { status: 400 });
+  }
+
+  return NextResponse.json({ 
+    error: `Contract status changed concurrently (now ${existing.status})` 
+  }, { status: 409 });
 }
@@ -0,0 +1,117 @@
+import { NextResponse } from 'next/server';
+import { getCollection } from '@/lib/db';
+import { buildContract, buildContractValues, validateContractName, validateFieldValues } from '@/lib/contracts';
+import { getBlueprint, invalidateBlueprint } from '@/lib/blueprint-cache';
+import { addContractReferences, removeContractReferences } from '@/lib/blueprint-counts';
+import { recordContractsCreated } from '@/lib/stats';
+import { buildContractEvent, recordContractEvents } from '@/lib/contract-events';
+import { withMetrics } from '@/lib/metrics';
+
+const MAX_BULK_CONTRACTS = 10000;
+const INSERT_CHUNK_SIZE = 1000;
+
+// POST /api/contracts/bulk - Create many contracts from one blueprint
+// Body: { blueprintId, contracts: [{ name, fieldValues }] }
+// Responds 201 when every item was created, 207 with per-item results otherwise.
+export const POST = withMetrics('/api/contracts/bulk', async function POST(request) {
+  try {
+    const body = await request.json();
+    const { blueprintId, contracts: items } = body;
+
+    // Validation
+    if (!blueprintId) {
+      return NextResponse.json({ error: 'Blueprint ID is required' }, { status: 400 });
+    }
+
+    if (!Array.isArray(items) || items.length === 0) {
+      return NextResponse.json({ error: 'At least one contract is required' }, { status: 400 });
+    }
+
+    if (items.length > MAX_BULK_CONTRACTS) {
+      return NextResponse.json({ 
+        error: `At most ${MAX_BULK_CONTRACTS} contracts can be created per request` 
+      }, { status: 400 });
+    }
+
+    // Resolve the blueprint once for the whole batch
+    const blueprint = await getBlueprint(blueprintId);
+
+    if (!blueprint) {
+      return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
+    }
+
+    const now = new Date().toISOString();
+    const results = new Array(items.length);
+    const docs = [];
+    const docIndexes = [];
+
+    items.forEach((item, index) => {
+      const itemError = validateContractName(item?.name) || validateFieldValues(item.fieldValues);
+      if (itemError) {
+        results[index] = { index, error: itemError };
+        return;
+      }
+      const { values, errors } = buildContractValues(blueprint, item.fieldValues);
+      if (errors.length > 0) {
+        results[index] = { index, error: 'Invalid field values', errors };
+        return;
+      }
+      const contract = buildContract(blueprint, { name: item.name, values }, now);
+      results[index] = { index, id: contract.id };
+      docs.push(contract);
+      docIndexes.push(index);
+    });
+
+    // Reference the blueprint for the whole batch up front; unused references are released below
+    if (docs.length > 0 && !(await addContractReferences(blueprint.id, docs.length))) {
+      invalidateBlueprint(blueprint.id);
+      return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
+    }
+
+    const contracts = await getCollection('contracts');
+    let created = 0;
+    const events = [];
+
+    try {
+      for (let start = 0; start < docs.length; start += INSERT_CHUNK_SIZE) {
+        const chunk = docs.slice(start, start + INSERT_CHUNK_SIZE);
+        try {
+          const result = await contracts.insertMany(chunk, { ordered: false });
+          created += result.insertedCount;
+          chunk.forEach(doc => events.push(buildContractEvent(doc, doc.statusHistory[0])));
+        } catch (error) {
+          if (!error.writeErrors) throw error;
+          // Unordered insert: everything except the reported write errors landed
+          const writeErrors = Array.isArray(error.writeErrors) ? error.writeErrors : [error.writeErrors];
+          const failedOffsets = new Set();
+          writeErrors.forEach(writeError => {
+            const index = docIndexes[start + writeError.index];
+            results[index] = { index, error: writeError.errmsg || 'Failed to create contract' };
+            failedOffsets.add(writeError.index);
+          });
+          created += chunk.length - writeErrors.length;
+          chunk.forEach((doc, offset) => {
+            if (!failedOffsets.has(offset)) events.push(buildContractEvent(doc, doc.statusHistory[0]));
+          });
+        }
+      }
+    } finally {
+      await removeContractReferences(blueprint.id, docs.length - created);
+      await recordContractEvents(events);
+      if (created > 0) {
+        await recordContractsCreated(created);
+      }
+    }
+
+    const failed = items.length - created;
+    return NextResponse.json({
+      blueprintId: blueprint.id,
+      created,
+      failed,
+      results
+    }, { status: failed === 0 ? 201 : 207 });
+  } catch (error) {
+    console.error('Error bulk creating contracts:', error);
+    return NextResponse.json({ error: 'Failed to create contracts' }, { status: 500 });
+  }
+});
@@ -0,0 +1,87 @@
+import { NextResponse } from 'next/server';
+import { getCategoryStatuses, CONTRACT_STATES } from '@/lib/lifecycle';
+import { followContractChanges } from '@/lib/change-feed';
+import { withMetrics } from '@/lib/metrics';
+
+export const dynamic = 'force-dynamic';
+
+const HEARTBEAT_MS = 15000;
+
+// GET /api/contracts/events - Server-Sent Events stream of contract status changes
+// Each event is a compact { id, status, updatedAt, blueprintId } delta.
+// Filters: ?id=, ?blueprintId=, ?status= or ?category=. Reconnecting clients
+// resume from the Last-Event-ID header (or ?lastEventId=).
+export const GET = withMetrics('/api/contracts/events', async function GET(request) {
+  const { searchParams } = new URL(request.url);
+  const id = searchParams.get('id');
+  const blueprintId = searchParams.get('blueprintId');
+  const status = searchParams.get('status');
+  const category = searchParams.get('category');
+
+  const filter = {};
+  if (id) filter.id = id;
+  if (blueprintId) filter.blueprintId = blueprintId;
+  if (status) {
+    if (!Object.values(CONTRACT_STATES).includes(status)) {
+      return NextResponse.json({ error: `Invalid status: ${status}` }, { status: 400 });
+    }
+    filter.statuses = [status];
+  } else if (category) {
+    const statuses = getCategoryStatuses(category);
+    if (!statuses) {
+      return NextResponse.json({ error: `Invalid category: ${category}` }, { status: 400 });
+    }
+    filter.statuses = statuses;
+  }
+
+  const resumeFrom = request.headers.get('last-event-id') || searchParams.get('lastEventId');
+  const abort = new AbortController();
+  request.signal?.addEventListener('abort', () => abort.abort(), { once: true });
+
+  const encoder = new TextEncoder();
+  const stream = new ReadableStream({
+    start(controller) {
+      const send = chunk => {
+        if (!abort.signal.aborted) controller.enqueue(encoder.encode(chunk));
+      };
+
+      // Tell EventSource how quickly to reconnect, then keep proxies from idling us out
+      send('retry: 3000\n\n');
+      const heartbeat = setInterval(() => send(': heartbeat\n\n'), HEARTBEAT_MS);
+
+      followContractChanges({
+        filter,
+        resumeFrom,
+        signal: abort.signal,
+        onDelta: (delta, position) => {
+          send(`id: ${position}\nevent: contract\ndata: ${JSON.stringify(delta)}\n\n`);
+        }
+      })
+        .catch(error => {
+          console.error('Error streaming contract events:', error);
+          send(`event: error\ndata: ${JSON.stringify({ error: 'Event stream failed' })}\n\n`);
+        })
+        .finally(() => {
+          clearInterval(heartbeat);
+          abort.abort();
+          try {
+            controller.close();
+          } catch {
+            // Already closed by the client
+          }
+        });
+    },
+    cancel() {
+      abort.abort();
+    }
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      Connection: 'keep-alive',
+      'X-Accel-Buffering': 'no'
+    }
+  });
+});
@@ -0,0 +1,33 @@
+import { NextResponse } from 'next/server';
+import { contractListFilter } from '@/lib/contracts';
+import { EXPORT_FORMATS, exportContracts } from '@/lib/export';
+import { withMetrics } from '@/lib/metrics';
+
+export const dynamic = 'force-dynamic';
+
+// GET /api/contracts/export - Stream every matching contract as NDJSON or CSV
+// ?format=ndjson (default) or csv; filters: ?status=, ?category=, ?blueprintId=.
+// Rows are streamed from a cursor, so memory use does not grow with the export.
+export const GET = withMetrics('/api/contracts/export', async function GET(request) {
+  try {
+    const { searchParams } = new URL(request.url);
+    const format = searchParams.get('format') || 'ndjson';
+    if (!Object.hasOwn(EXPORT_FORMATS, format)) {
+      return NextResponse.json({ error: 'format must be ndjson or csv' }, { status: 400 });
+    }
+
+    const stream = await exportContracts(contractListFilter(searchParams), format);
+    const filename = `contracts-${new Date().toISOString().slice(0, 10)}.${EXPORT_FORMATS[format].extension}`;
+    return new Response(stream, {
+      headers: {
+        'Content-Type': EXPORT_FORMATS[format].contentType,
+        'Content-Disposition': `attachment; filename="${filename}"`,
+        'Cache-Control': 'no-store',
+        'X-Accel-Buffering': 'no'
+      }
+    });
+  } catch (error) {
+    console.error('Error exporting contracts:', error);
+    return NextResponse.json({ error: 'Failed to export contracts' }, { status: 500 });
+  }
+});
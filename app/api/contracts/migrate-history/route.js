@@ -0,0 +1,18 @@
+import { NextResponse } from 'next/server';
+import { migrateAllContractHistory } from '@/lib/contract-events';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// POST /api/contracts/migrate-history - Move embedded statusHistory of legacy contracts into contract_events
+export const POST = withMetrics('/api/contracts/migrate-history', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const result = await migrateAllContractHistory();
+    return NextResponse.json(result);
+  } catch (error) {
+    console.error('Error migrating contract history:', error);
+    return NextResponse.json({ error: 'Failed to migrate contract history' }, { status: 500 });
+  }
+});
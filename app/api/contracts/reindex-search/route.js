@@ -0,0 +1,20 @@
+import { NextResponse } from 'next/server';
+import { reindexContractSearch } from '@/lib/search';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// POST /api/contracts/reindex-search - Build the search keys of contracts that lack them
+// ?all=true rebuilds them for every contract
+export const POST = withMetrics('/api/contracts/reindex-search', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const { searchParams } = new URL(request.url);
+    const result = await reindexContractSearch({ all: searchParams.get('all') === 'true' });
+    return NextResponse.json(result);
+  } catch (error) {
+    console.error('Error reindexing contract search:', error);
+    return NextResponse.json({ error: 'Failed to reindex contract search' }, { status: 500 });
+  }
+});
@@ -1,126 +1,189 @@
 import { NextResponse } from 'next/server';
 import { getCollection } from '@/lib/db';
-import { v4 as uuidv4 } from 'uuid';
-import { CONTRACT_STATES } from '@/lib/lifecycle';
+import { buildContract, buildContractValues, contractListFilter, validateContractName, validateFieldValues } from '@/lib/contracts';
+import { fieldErrorsBody } from '@/lib/schema';
+import { getBlueprint, invalidateBlueprint } from '@/lib/blueprint-cache';
+import { addContractReferences, removeContractReferences } from '@/lib/blueprint-counts';
+import { recordContractsCreated } from '@/lib/stats';
+import { buildContractEvent, recordContractEvents } from '@/lib/contract-events';
+import { afterCursor, decodeCursor, encodeCursor, parseLimit } from '@/lib/pagination';
+import { CONTRACT_LIST_FIELDS, parseFieldsParam } from '@/lib/projection';
+import { conditionalJson, listEtag } from '@/lib/http';
+import {
+  MAX_SEARCH_OFFSET,
+  buildSearchQuery,
+  decodeSearchCursor,
+  encodeSearchCursor
+} from '@/lib/search';
+import { hydrateContract, hydrateContracts } from '@/lib/blueprint-versions';
+import { withMetrics } from '@/lib/metrics';
 
 // GET /api/contracts - List all contracts with optional filtering
-export async function GET(request) {
+// Passing ?limit= and/or ?cursor= switches to keyset pagination:
+// the response becomes { contracts, nextCursor } instead of a bare array.
+// ?fields=summary (or ?fields=name,status,...) returns only list columns.
+// ?q= searches names and text field values (always paginated, ranked by relevance).
+// Non-search lists support If-None-Match; the ETag is derived from the filter's
+// max(updatedAt) and count without reading documents.
+export const GET = withMetrics('/api/contracts', async function GET(request) {
   try {
     const { searchParams } = new URL(request.url);
-    const status = searchParams.get('status');
-    const category = searchParams.get('category');
-    const blueprintId = searchParams.get('blueprintId');
+    const cursorParam = searchParams.get('cursor');
+    const limitParam = searchParams.get('limit');
+    const q = searchParams.get('q');
+    const paginated = cursorParam !== null || limitParam !== null || Boolean(q);
+
+    const { projection, error: fieldsError } = parseFieldsParam(searchParams.get('fields'), CONTRACT_LIST_FIELDS);
+    if (fieldsError) {
+      return NextResponse.json({ error: fieldsError }, { status: 400 });
+    }
 
-    const query = {};
+    const query = contractListFilter(searchParams);
+    const contracts = await getCollection('contracts');
 
-    if (status) {
-      query.status = status;
+    if (q) {
+      return searchContracts(contracts, q, query, projection, limitParam, cursorParam);
     }
 
-    if (category) {
-      // Map category to statuses
-      const categoryMap = {
-        'active': [CONTRACT_STATES.SENT],
-        'pending': [CONTRACT_STATES.CREATED, CONTRACT_STATES.APPROVED],
-        'signed': [CONTRACT_STATES.SIGNED, CONTRACT_STATES.LOCKED],
-        'revoked': [CONTRACT_STATES.REVOKED]
-      };
-      if (categoryMap[category]) {
-        query.status = { $in: categoryMap[category] };
-      }
+    const etag = await listEtag(contracts, query, 'contracts', searchParams.toString());
+
+    if (!paginated) {
+      return conditionalJson(request, etag, async () =>
+        hydrateContracts(await contracts.find(query, { projection }).sort({ createdAt: -1, id: -1 }).limit(1000).toArray())
+      );
     }
 
-    if (blueprintId) {
-      query.blueprintId = blueprintId;
+    const limit = parseLimit(limitParam);
+    if (limit === null) {
+      return NextResponse.json({ error: 'Limit must be a positive integer' }, { status: 400 });
     }
 
-    const contracts = await getCollection('contracts');
-    const result = await contracts.find(query).sort({ createdAt: -1 }).limit(1000).toArray();
-    return NextResponse.json(result);
+    let pageQuery = query;
+    if (cursorParam) {
+      const cursor = decodeCursor(cursorParam);
+      if (!cursor) {
+        return NextResponse.json({ error: 'Invalid cursor' }, { status: 400 });
+      }
+      pageQuery = { $and: [query, afterCursor(cursor)] };
+    }
+
+    return conditionalJson(request, etag, async () => {
+      // Fetch one extra row to know whether another page exists
+      const rows = await contracts.find(pageQuery, { projection }).sort({ createdAt: -1, id: -1 }).limit(limit + 1).toArray();
+      const hasMore = rows.length > limit;
+      const page = hasMore ? rows.slice(0, limit) : rows;
+      return {
+        contracts: await hydrateContracts(page),
+        nextCursor: hasMore ? encodeCursor(page[page.length - 1]) : null
+      };
+    });
   } catch (error) {
     console.error('Error fetching contracts:', error);
     return NextResponse.json({ error: 'Failed to fetch contracts' }, { status: 500 });
   }
+});
+
+// One page of ?q= results. Ranked results cannot use a keyset cursor, so the
+// cursor carries an offset (capped at MAX_SEARCH_OFFSET).
+async function searchContracts(contracts, q, query, projection, limitParam, cursorParam) {
+  const limit = parseLimit(limitParam);
+  if (limit === null) {
+    return NextResponse.json({ error: 'Limit must be a positive integer' }, { status: 400 });
+  }
+
+  let offset = 0;
+  if (cursorParam) {
+    offset = decodeSearchCursor(cursorParam);
+    if (offset === null) {
+      return NextResponse.json({ error: 'Invalid cursor' }, { status: 400 });
+    }
+  }
+  if (offset > MAX_SEARCH_OFFSET) {
+    return NextResponse.json({ error: 'Refine the search to see more results' }, { status: 400 });
+  }
+
+  const search = buildSearchQuery(q);
+  if (!search) {
+    return NextResponse.json({ contracts: [], nextCursor: null });
+  }
+
+  const filter = Object.keys(query).length > 0 ? { ...search.filter, ...query } : search.filter;
+  let sort = { createdAt: -1, id: -1 };
+  let searchProjection = projection;
+  if (search.ranked) {
+    sort = { score: { $meta: 'textScore' }, ...sort };
+    searchProjection = { ...projection, score: { $meta: 'textScore' } };
+  }
+
+  // Fetch one extra row to know whether another page exists
+  const rows = await contracts
+    .find(filter, { projection: searchProjection })
+    .sort(sort)
+    .skip(offset)
+    .limit(limit + 1)
+    .toArray();
+  const hasMore = rows.length > limit;
+
+  return NextResponse.json({
+    contracts: await hydrateContracts(hasMore ? rows.slice(0, limit) : rows),
+    nextCursor: hasMore ? encodeSearchCursor(offset + limit) : null
+  });
 }
 
 // POST /api/contracts - Create a new contract from a blueprint
-export async function POST(request) {
+export const POST = withMetrics('/api/contracts', async function POST(request) {
   try {
     const body = await request.json();
     const { name, blueprintId, fieldValues } = body;
 
     // Validation
-    if (!name || typeof name !== 'string' || name.trim() === '') {
-      return NextResponse.json({ error: 'Contract name is required' }, { status: 400 });
+    const nameError = validateContractName(name);
+    if (nameError) {
+      return NextResponse.json({ error: nameError }, { status: 400 });
     }
 
     if (!blueprintId) {
       return NextResponse.json({ error: 'Blueprint ID is required' }, { status: 400 });
     }
 
-    // Fetch the blueprint
-    const blueprints = await getCollection('blueprints');
-    const blueprint = await blueprints.findOne({ id: blueprintId });
+    const blueprint = await getBlueprint(blueprintId);
 
     if (!blueprint) {
       return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
     }
 
-    // Create contract fields from blueprint, with optional initial values
-    const contractFields = blueprint.fields.map(field => {
-      const initialValue = fieldValues?.[field.id];
-      let value = null;
-
-      switch (field.type) {
-        case 'checkbox':
-          value = initialValue === true || initialValue === 'true' ? true : false;
-          break;
-        case 'date':
-          value = initialValue || null;
-          break;
-        case 'signature':
-          value = initialValue || null;
-          break;
-        case 'text':
-        default:
-          value = initialValue || '';
-          break;
-      }
+    const fieldValuesError = validateFieldValues(fieldValues);
+    if (fieldValuesError) {
+      return NextResponse.json({ error: fieldValuesError }, { status: 400 });
+    }
 
-      return {
-        id: field.id,
-        type: field.type,
-        label: field.label,
-        position: field.position,
-        required: field.required,
-        value
-      };
-    });
+    const { values, errors } = buildContractValues(blueprint, fieldValues);
+    if (errors.length > 0) {
+      return NextResponse.json(fieldErrorsBody('Invalid field values', errors), { status: 400 });
+    }
+
+    // Reference the blueprint first so it cannot be deleted underneath us
+    if (!(await addContractReferences(blueprint.id))) {
+      invalidateBlueprint(blueprint.id);
+      return NextResponse.json({ error: 'Blueprint not found' }, { status: 404 });
+    }
 
-    const contract = {
-      id: uuidv4(),
-      name: name.trim(),
-      blueprintId: blueprint.id,
-      blueprintName: blueprint.name,
-      status: CONTRACT_STATES.CREATED,
-      fields: contractFields,
-      statusHistory: [
-        {
-          status: CONTRACT_STATES.CREATED,
-          timestamp: new Date().toISOString(),
-          note: 'Contract created'
-        }
-      ],
-      createdAt: new Date().toISOString(),
-      updatedAt: new Date().toISOString()
-    };
+    const contract = buildContract(blueprint, { name, values });
 
     const contracts = await getCollection('contracts');
-    await contracts.insertOne(contract);
+    try {
+      await contracts.insertOne(contract);
+    } catch (error) {
+      await removeContractReferences(blueprint.id);
+      throw error;
+    }
+    await recordContractEvents([buildContractEvent(contract, contract.statusHistory[0])]);
+    await recordContractsCreated();
 
-    return NextResponse.json(contract, { status: 201 });
+    const { search, ...created } = contract;
+    return NextResponse.json(hydrateContract(created, blueprint), { status: 201 });
   } catch (error) {
     console.error('Error creating contract:', error);
     return NextResponse.json({ error: 'Failed to create contract' }, { status: 500 });
   }
-}
+});
@@ -0,0 +1,51 @@
+import { NextResponse } from 'next/server';
+import { CONTRACT_STATES } from '@/lib/lifecycle';
+import { applyBulkTransition } from '@/lib/transitions';
+import { withMetrics } from '@/lib/metrics';
+
+const MAX_BULK_TRANSITIONS = 5000;
+
+// POST /api/contracts/transition/bulk - Move many contracts to one status
+// Body: { ids: [...], newStatus, note? }
+export const POST = withMetrics('/api/contracts/transition/bulk', async function POST(request) {
+  try {
+    const body = await request.json();
+    const { ids, newStatus, note } = body;
+
+    // Validation
+    if (!newStatus) {
+      return NextResponse.json({ error: 'New status is required' }, { status: 400 });
+    }
+
+    const validStatuses = Object.values(CONTRACT_STATES);
+    if (!validStatuses.includes(newStatus)) {
+      return NextResponse.json({ 
+        error: `Invalid status. Must be one of: ${validStatuses.join(', ')}` 
+      }, { status: 400 });
+    }
+
+    if (!Array.isArray(ids) || ids.length === 0 || ids.some(id => typeof id !== 'string')) {
+      return NextResponse.json({ error: 'ids must be a non-empty array of contract IDs' }, { status: 400 });
+    }
+
+    const uniqueIds = [...new Set(ids)];
+    if (uniqueIds.length > MAX_BULK_TRANSITIONS) {
+      return NextResponse.json({ 
+        error: `At most ${MAX_BULK_TRANSITIONS} contracts can be transitioned per request` 
+      }, { status: 400 });
+    }
+
+    const { results } = await applyBulkTransition(uniqueIds, newStatus, { note });
+    const applied = results.filter(result => result.outcome === 'applied').length;
+
+    return NextResponse.json({
+      newStatus,
+      applied,
+      failed: results.length - applied,
+      results
+    });
+  } catch (error) {
+    console.error('Error bulk transitioning contracts:', error);
+    return NextResponse.json({ error: 'Failed to transition contracts' }, { status: 500 });
+  }
+});
@@ -0,0 +1,28 @@
+import { NextResponse } from 'next/server';
+import { getDb, getPoolStats } from '@/lib/db';
+import { withMetrics } from '@/lib/metrics';
+
+export const dynamic = 'force-dynamic';
+
+// GET /api/health - Readiness of this server process: MongoDB round trip and
+// connection pool usage. 503 until MongoDB is reachable and indexes are built.
+export const GET = withMetrics('/api/health', async function GET() {
+  const started = performance.now();
+  try {
+    const db = await getDb();
+    await db.command({ ping: 1 });
+    return NextResponse.json({
+      status: 'ok',
+      uptimeSeconds: Math.round(process.uptime()),
+      memory: { rssBytes: process.memoryUsage.rss(), heapUsedBytes: process.memoryUsage().heapUsed },
+      mongo: { pingMs: Math.round((performance.now() - started) * 10) / 10, pool: getPoolStats() }
+    }, { headers: { 'Cache-Control': 'no-store' } });
+  } catch (error) {
+    console.error('Health check failed:', error);
+    return NextResponse.json({
+      status: 'unavailable',
+      error: 'MongoDB is unreachable',
+      mongo: { pool: getPoolStats() }
+    }, { status: 503, headers: { 'Cache-Control': 'no-store' } });
+  }
+});
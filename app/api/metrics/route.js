@@ -0,0 +1,13 @@
+import { renderMetrics } from '@/lib/metrics';
+
+export const dynamic = 'force-dynamic';
+
+// GET /api/metrics - Request and MongoDB command metrics of this server process (Prometheus text format)
+export async function GET() {
+  return new Response(renderMetrics(), {
+    headers: {
+      'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+      'Cache-Control': 'no-store'
+    }
+  });
+}
@@ -0,0 +1,29 @@
+import { NextResponse } from 'next/server';
+import { getSchedulerStatus, runScheduledJobs } from '@/lib/scheduler';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+export const dynamic = 'force-dynamic';
+
+// GET /api/scheduler - Scheduled lifecycle jobs of this server process: lease
+// state and the duration and outcome counts of each job's last run
+export const GET = withMetrics('/api/scheduler', async function GET() {
+  return NextResponse.json(getSchedulerStatus(), { headers: { 'Cache-Control': 'no-store' } });
+});
+
+// POST /api/scheduler - Run the enabled jobs now (409 if another instance holds the lease)
+export const POST = withMetrics('/api/scheduler', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const runs = await runScheduledJobs();
+    if (!runs) {
+      return NextResponse.json({ error: 'Another instance holds the scheduler lease' }, { status: 409 });
+    }
+    return NextResponse.json({ runs, status: getSchedulerStatus() });
+  } catch (error) {
+    console.error('Error running scheduled jobs:', error);
+    return NextResponse.json({ error: 'Failed to run scheduled jobs' }, { status: 500 });
+  }
+});
@@ -0,0 +1,18 @@
+import { NextResponse } from 'next/server';
+import { formatStats, reconcileStats } from '@/lib/stats';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// POST /api/stats/reconcile - Rebuild the dashboard counters from the live collections
+export const POST = withMetrics('/api/stats/reconcile', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const doc = await reconcileStats();
+    return NextResponse.json(formatStats(doc));
+  } catch (error) {
+    console.error('Error reconciling stats:', error);
+    return NextResponse.json({ error: 'Failed to reconcile stats' }, { status: 500 });
+  }
+});
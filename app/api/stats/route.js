@@ -1,52 +1,30 @@
 import { NextResponse } from 'next/server';
-import { getCollection } from '@/lib/db';
-import { CONTRACT_STATES } from '@/lib/lifecycle';
+import { formatStats, readStats } from '@/lib/stats';
+import { conditionalJson, etagFor } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
 
-// GET /api/stats - Get dashboard statistics
-export async function GET() {
+// GET /api/stats - Get dashboard statistics (supports If-None-Match)
+// ?maxStaleness=<ms> overrides how old the counters may be before a live rebuild (0 = always live)
+export const GET = withMetrics('/api/stats', async function GET(request) {
   try {
-    const contracts = await getCollection('contracts');
-    const blueprints = await getCollection('blueprints');
+    const { searchParams } = new URL(request.url);
+    const maxStalenessParam = searchParams.get('maxStaleness');
 
-    const [contractStats, blueprintCount] = await Promise.all([
-      contracts.aggregate([
-        {
-          $group: {
-            _id: '$status',
-            count: { $sum: 1 }
-          }
-        }
-      ]).toArray(),
-      blueprints.countDocuments({})
-    ]);
+    const options = {};
+    if (maxStalenessParam !== null) {
+      const maxStalenessMs = Number.parseInt(maxStalenessParam, 10);
+      if (!Number.isFinite(maxStalenessMs) || maxStalenessMs < 0) {
+        return NextResponse.json({ error: 'maxStaleness must be a non-negative integer' }, { status: 400 });
+      }
+      options.maxStalenessMs = maxStalenessMs;
+    }
 
-    // Convert to object
-    const statsByStatus = {};
-    Object.values(CONTRACT_STATES).forEach(status => {
-      statsByStatus[status] = 0;
-    });
-    contractStats.forEach(stat => {
-      statsByStatus[stat._id] = stat.count;
-    });
-
-    const totalContracts = Object.values(statsByStatus).reduce((a, b) => a + b, 0);
-
-    // Calculate category counts
-    const categories = {
-      active: statsByStatus[CONTRACT_STATES.SENT] || 0,
-      pending: (statsByStatus[CONTRACT_STATES.CREATED] || 0) + (statsByStatus[CONTRACT_STATES.APPROVED] || 0),
-      signed: (statsByStatus[CONTRACT_STATES.SIGNED] || 0) + (statsByStatus[CONTRACT_STATES.LOCKED] || 0),
-      revoked: statsByStatus[CONTRACT_STATES.REVOKED] || 0
-    };
-
-    return NextResponse.json({
-      totalContracts,
-      totalBlueprints: blueprintCount,
-      byStatus: statsByStatus,
-      byCategory: categories
-    });
+    // The counters document is small; its formatted form (which carries
+    // updatedAt and reconciledAt) is the validator
+    const stats = formatStats(await readStats(options));
+    return conditionalJson(request, etagFor('stats', stats), stats);
   } catch (error) {
     console.error('Error fetching stats:', error);
     return NextResponse.json({ error: 'Failed to fetch stats' }, { status: 500 });
   }
-}
+});
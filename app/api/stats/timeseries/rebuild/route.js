@@ -0,0 +1,26 @@
+import { NextResponse } from 'next/server';
+import { parseTimestampParam, rebuildDailyRollups } from '@/lib/timeseries';
+import { requireAdmin } from '@/lib/http';
+import { withMetrics } from '@/lib/metrics';
+
+// POST /api/stats/timeseries/rebuild - Recompute the daily rollups from contract_events
+// Query: ?from=, ?to= (ISO dates, default everything up to now)
+export const POST = withMetrics('/api/stats/timeseries/rebuild', async function POST(request) {
+  const denied = requireAdmin(request);
+  if (denied) return denied;
+
+  try {
+    const { searchParams } = new URL(request.url);
+    const from = parseTimestampParam(searchParams.get('from'));
+    const to = parseTimestampParam(searchParams.get('to'));
+    if (from === null || to === null) {
+      return NextResponse.json({ error: 'from and to must be ISO dates' }, { status: 400 });
+    }
+
+    const result = await rebuildDailyRollups(from || '1970-01-01T00:00:00.000Z', to || new Date().toISOString());
+    return NextResponse.json(result);
+  } catch (error) {
+    console.error('Error rebuilding daily rollups:', error);
+    return NextResponse.json({ error: 'Failed to rebuild daily rollups' }, { status: 500 });
+  }
+});
@@ -0,0 +1,46 @@
+import { NextResponse } from 'next/server';
+import {
+  BUCKETS,
+  MAX_DAY_RANGE_MS,
+  MAX_HOUR_RANGE_MS,
+  parseTimestampParam,
+  readTimeseries
+} from '@/lib/timeseries';
+import { withMetrics } from '@/lib/metrics';
+
+const MAX_RANGE_MS = { hour: MAX_HOUR_RANGE_MS, day: MAX_DAY_RANGE_MS };
+
+// GET /api/stats/timeseries - Transitions per hour/day and time-in-state
+// Query: ?bucket=hour|day (default day), ?from=, ?to= (ISO dates, default the last 48 hours / 30 days)
+export const GET = withMetrics('/api/stats/timeseries', async function GET(request) {
+  try {
+    const { searchParams } = new URL(request.url);
+    const bucket = searchParams.get('bucket') || 'day';
+
+    if (!BUCKETS[bucket]) {
+      return NextResponse.json({ error: 'bucket must be one of: hour, day' }, { status: 400 });
+    }
+
+    const from = parseTimestampParam(searchParams.get('from'));
+    const to = parseTimestampParam(searchParams.get('to'));
+    if (from === null || to === null) {
+      return NextResponse.json({ error: 'from and to must be ISO dates' }, { status: 400 });
+    }
+
+    const end = to || new Date().toISOString();
+    const start = from || new Date(Date.parse(end) - BUCKETS[bucket].defaultRangeMs).toISOString();
+    if (start >= end) {
+      return NextResponse.json({ error: 'from must be before to' }, { status: 400 });
+    }
+    if (Date.parse(end) - Date.parse(start) > MAX_RANGE_MS[bucket]) {
+      return NextResponse.json({ 
+        error: `Range too large for ${bucket} buckets (max ${MAX_RANGE_MS[bucket] / BUCKETS.day.stepMs} days)` 
+      }, { status: 400 });
+    }
+
+    return NextResponse.json(await readTimeseries(bucket, start, end));
+  } catch (error) {
+    console.error('Error fetching timeseries stats:', error);
+    return NextResponse.json({ error: 'Failed to fetch timeseries stats' }, { status: 500 });
+  }
+});
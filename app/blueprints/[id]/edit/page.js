@@ -151,7 +151,12 @@ export default function EditBlueprintPage() {
                   <ArrowLeft className="h-5 w-5" />
                 </Button>
               </Link>
-              <h1 className="text-xl font-bold bg-gradient-to-r from-indigo-600 to-teal-600 bg-clip-text text-transparent">Edit Template</h1>
+              <div>
+                <h1 className="text-xl font-bold bg-gradient-to-r from-indigo-600 to-teal-600 bg-clip-text text-transparent">Edit Template</h1>
+                <p className="text-xs text-muted-foreground">
+                  Version {blueprint.version ?? 1} · saving creates version {(blueprint.version ?? 1) + 1}; existing documents keep theirs
+                </p>
+              </div>
             </div>
             <Button onClick={handleSubmit} disabled={saving} className="gap-2">
               <Save className="h-4 w-4" />
@@ -46,7 +46,7 @@ export default function BlueprintsPage() {
   const fetchBlueprints = async () => {
     try {
       setLoading(true);
-      const res = await fetch('/api/blueprints');
+      const res = await fetch('/api/blueprints?fields=summary');
       if (res.ok) {
         setBlueprints(await res.json());
       }
@@ -101,7 +101,7 @@ export default function BlueprintsPage() {
     })
     .filter((b) => {
       if (fieldType === 'all') return true;
-      return (b.fields || []).some((f) => f.type === fieldType);
+      return (b.fieldTypes || []).includes(fieldType);
     });
 
   const actions = (
@@ -235,7 +235,7 @@ export default function BlueprintsPage() {
                   </div>
 
                   <div className="mt-3 flex flex-wrap gap-2">
-                    {(blueprint.fields || []).slice(0, 6).map((field) => {
+                    {(blueprint.fieldPreview || []).map((field) => {
                       const Icon = getFieldIcon(field.type);
                       return (
                         <Badge key={field.id} variant="secondary" className="gap-1">
@@ -244,8 +244,8 @@ export default function BlueprintsPage() {
                         </Badge>
                       );
                     })}
-                    {(blueprint.fields || []).length > 6 && (
-                      <Badge variant="outline">+{blueprint.fields.length - 6} more</Badge>
+                    {blueprint.fieldCount > 6 && (
+                      <Badge variant="outline">+{blueprint.fieldCount - 6} more</Badge>
                     )}
                   </div>
 
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useRouter, useParams } from 'next/navigation';
 import Link from 'next/link';
 import { Button } from '@/components/ui/button';
@@ -82,23 +82,57 @@ export default function ContractDetailPage() {
   const [hasChanges, setHasChanges] = useState(false);
   const [transitionDialog, setTransitionDialog] = useState({ open: false, targetStatus: null });
 
+  const hasChangesRef = useRef(false);
+  const contractRef = useRef(null);
+  // Version the unsaved edits are based on; saves send it as If-Match
+  const etagRef = useRef(null);
+
+  useEffect(() => {
+    hasChangesRef.current = hasChanges;
+  }, [hasChanges]);
+
+  useEffect(() => {
+    contractRef.current = contract;
+  }, [contract]);
+
   useEffect(() => {
     fetchContract();
   }, [params.id]);
 
-  const fetchContract = async () => {
+  // Pick up colleagues' changes without a manual refresh
+  useEffect(() => {
+    const source = new EventSource(`/api/contracts/events?id=${encodeURIComponent(params.id)}`);
+    source.addEventListener('contract', (event) => {
+      // Our own saves already updated the page
+      const delta = JSON.parse(event.data);
+      if (delta.updatedAt === contractRef.current?.updatedAt) return;
+      if (hasChangesRef.current) {
+        toast.info('This document was updated by someone else');
+      } else {
+        fetchContract({ silent: true });
+      }
+    });
+    return () => source.close();
+  }, [params.id]);
+
+  const fetchContract = async ({ silent = false, keepEdits = false } = {}) => {
     try {
-      setLoading(true);
+      if (!silent) setLoading(true);
       const res = await fetch(`/api/contracts/${params.id}`);
       if (res.ok) {
         const data = await res.json();
+        etagRef.current = res.headers.get('ETag');
+        const saved = new Map((contractRef.current?.fields || []).map(field => [field.id, field.value]));
         setContract(data);
-        // Initialize field values
-        const values = {};
-        data.fields.forEach(field => {
-          values[field.id] = field.value;
+        // Initialize field values, keeping unsaved edits when asked to
+        setFieldValues(prev => {
+          const values = {};
+          data.fields.forEach(field => {
+            const edited = keepEdits && saved.has(field.id) && prev[field.id] !== saved.get(field.id);
+            values[field.id] = edited ? prev[field.id] : field.value;
+          });
+          return values;
         });
-        setFieldValues(values);
       } else {
         toast.error('Contract not found');
         router.push('/');
@@ -122,17 +156,29 @@ export default function ContractDetailPage() {
   const handleSave = async () => {
     try {
       setSaving(true);
+      // Send only the fields that differ from the saved document
+      const changed = {};
+      contract.fields.forEach(field => {
+        if (fieldValues[field.id] !== field.value) changed[field.id] = fieldValues[field.id];
+      });
+      const headers = { 'Content-Type': 'application/json' };
+      if (etagRef.current) headers['If-Match'] = etagRef.current;
       const res = await fetch(`/api/contracts/${params.id}`, {
         method: 'PUT',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ fieldValues })
+        headers,
+        body: JSON.stringify({ fieldValues: changed })
       });
 
       if (res.ok) {
         const updated = await res.json();
+        etagRef.current = res.headers.get('ETag');
         setContract(updated);
         setHasChanges(false);
         toast.success('Document saved successfully');
+      } else if (res.status === 412) {
+        // Keep the edits; saving again applies them on top of the latest version
+        toast.error('This document was changed by someone else. Review it and save again.');
+        fetchContract({ silent: true, keepEdits: true });
       } else {
         const error = await res.json();
         toast.error(error.error || 'Failed to save document');
@@ -153,13 +199,18 @@ export default function ContractDetailPage() {
       const res = await fetch(`/api/contracts/${params.id}/transition`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ newStatus: targetStatus })
+        body: JSON.stringify({ newStatus: targetStatus, expectedStatus: contract.status })
       });
 
       if (res.ok) {
         const updated = await res.json();
+        etagRef.current = res.headers.get('ETag');
         setContract(updated);
         toast.success(`Document ${targetStatus} successfully`);
+      } else if (res.status === 409) {
+        const error = await res.json();
+        toast.error(error.error || 'Document was changed by someone else');
+        fetchContract();
       } else {
         const error = await res.json();
         toast.error(error.error || 'Failed to update document status');
@@ -298,7 +349,9 @@ export default function ContractDetailPage() {
               </Link>
               <div>
                 <h1 className="text-xl font-bold text-gray-900">{contract.name}</h1>
-                <p className="text-sm text-muted-foreground">Template: {contract.blueprintName}</p>
+                <p className="text-sm text-muted-foreground">
+                  Template: {contract.blueprintName}{contract.blueprintVersion ? ` (v${contract.blueprintVersion})` : ''}
+                </p>
               </div>
             </div>
             <div className="flex items-center gap-3">
@@ -407,6 +460,11 @@ export default function ContractDetailPage() {
                     );
                   })}
                 </div>
+                {contract.historyCount > (contract.statusHistory?.length || 0) && (
+                  <p className="text-xs text-muted-foreground mt-3">
+                    Latest {contract.statusHistory.length} of {contract.historyCount} changes
+                  </p>
+                )}
               </CardContent>
             </Card>
 
@@ -32,23 +32,58 @@ const getStatusInfo = (status) => {
 };
 
 const LIFECYCLE_ORDER = ['created', 'approved', 'sent', 'signed', 'locked'];
+const HISTORY_PAGE_SIZE = 50;
 
 export default function ContractTimelinePage() {
   const router = useRouter();
   const params = useParams();
   const [loading, setLoading] = useState(true);
   const [contract, setContract] = useState(null);
+  const [history, setHistory] = useState([]);
+  const [historyCursor, setHistoryCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     fetchContract();
   }, [params.id]);
 
-  const fetchContract = async () => {
+  // Refresh the timeline when the contract changes elsewhere
+  useEffect(() => {
+    const source = new EventSource(`/api/contracts/events?id=${encodeURIComponent(params.id)}`);
+    source.addEventListener('contract', () => fetchContract({ silent: true }));
+    return () => source.close();
+  }, [params.id]);
+
+  // Pages of the contract's history; without a cursor the list starts over
+  const fetchHistory = async (cursor = null) => {
+    const query = new URLSearchParams({ limit: String(HISTORY_PAGE_SIZE) });
+    if (cursor) query.set('cursor', cursor);
+    const res = await fetch(`/api/contracts/${params.id}/history?${query}`);
+    if (!res.ok) throw new Error('Failed to load history');
+    const page = await res.json();
+    setHistory(prev => (cursor ? [...prev, ...page.events] : page.events));
+    setHistoryCursor(page.nextCursor);
+  };
+
+  const loadMoreHistory = async () => {
     try {
-      setLoading(true);
+      setLoadingMore(true);
+      await fetchHistory(historyCursor);
+    } catch (error) {
+      console.error('Error fetching history:', error);
+      toast.error('Failed to load more history');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const fetchContract = async ({ silent = false } = {}) => {
+    try {
+      if (!silent) setLoading(true);
       const res = await fetch(`/api/contracts/${params.id}`);
       if (res.ok) {
         setContract(await res.json());
+        await fetchHistory();
       } else {
         toast.error('Contract not found');
         router.push('/');
@@ -137,7 +172,7 @@ export default function ContractTimelinePage() {
                   const Icon = info.icon;
                   const isPast = index <= currentStatusIndex && !isRevoked;
                   const isCurrent = index === currentStatusIndex && !isRevoked;
-                  const historyEntry = contract.statusHistory?.find(h => h.status === status);
+                  const historyEntry = history.find(h => h.status === status);
 
                   return (
                     <div key={status} className="flex flex-col items-center">
@@ -193,13 +228,13 @@ export default function ContractTimelinePage() {
 
               {/* Timeline Items */}
               <div className="space-y-6">
-                {contract.statusHistory?.map((entry, index) => {
+                {history.map((entry, index) => {
                   const info = getStatusInfo(entry.status);
                   const Icon = info.icon;
-                  const isLatest = index === contract.statusHistory.length - 1;
+                  const isLatest = !historyCursor && index === history.length - 1;
 
                   return (
-                    <div key={index} className="relative flex gap-4">
+                    <div key={entry.id} className="relative flex gap-4">
                       {/* Icon */}
                       <div className={`relative z-10 w-12 h-12 rounded-full flex items-center justify-center ${info.color} ${isLatest ? 'ring-4 ring-opacity-30 ring-current' : ''}`}>
                         <Icon className="h-5 w-5 text-white" />
@@ -231,6 +266,13 @@ export default function ContractTimelinePage() {
                 })}
               </div>
             </div>
+            {historyCursor && (
+              <div className="flex justify-center mt-2">
+                <Button variant="outline" size="sm" onClick={loadMoreHistory} disabled={loadingMore}>
+                  {loadingMore ? 'Loading...' : 'Load more'}
+                </Button>
+              </div>
+            )}
           </CardContent>
         </Card>
 
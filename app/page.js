@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import Link from 'next/link';
 import { AppShell } from '@/components/app-shell';
 import { Button } from '@/components/ui/button';
@@ -23,7 +23,8 @@ import {
   Layers,
   Sparkles,
   ArrowUpRight,
-  TrendingUp
+  TrendingUp,
+  Download
 } from 'lucide-react';
 
 const CONTRACT_STATES = {
@@ -35,6 +36,13 @@ const CONTRACT_STATES = {
   REVOKED: 'revoked'
 };
 
+const CATEGORY_STATUSES = {
+  active: ['sent'],
+  pending: ['created', 'approved'],
+  signed: ['signed', 'locked'],
+  revoked: ['revoked']
+};
+
 const getStatusInfo = (status) => {
   const statusMap = {
     created: { label: 'Created', color: 'bg-indigo-100 text-indigo-800 border-indigo-200' },
@@ -76,23 +84,98 @@ export default function Dashboard() {
   const [stats, setStats] = useState(null);
   const [loading, setLoading] = useState(true);
   const [filter, setFilter] = useState('all');
+  const [search, setSearch] = useState('');
+  const [query, setQuery] = useState('');
   const [transitionDialog, setTransitionDialog] = useState({ open: false, contract: null, targetStatus: null });
+  const contractsRef = useRef([]);
+  const fetchContractsRef = useRef(null);
+  const queryRef = useRef('');
+
+  useEffect(() => {
+    contractsRef.current = contracts;
+  }, [contracts]);
 
   useEffect(() => {
     fetchData();
   }, [filter]);
 
+  // Debounce typing in the search box; the first keystroke does not hit the API
+  useEffect(() => {
+    const timer = setTimeout(() => setQuery(search.trim() ? search : ''), 250);
+    return () => clearTimeout(timer);
+  }, [search]);
+
+  useEffect(() => {
+    queryRef.current = query;
+    if (!loading) fetchContracts();
+  }, [query]);
+
+  // Live updates: patch rows from the change feed instead of refetching after every action
+  useEffect(() => {
+    const source = new EventSource('/api/contracts/events');
+    let statsTimer;
+    let reloadTimer;
+    const scheduleReload = () => {
+      clearTimeout(reloadTimer);
+      reloadTimer = setTimeout(() => fetchContractsRef.current(), 500);
+    };
+
+    source.addEventListener('contract', (event) => {
+      const delta = JSON.parse(event.data);
+      const inFilter = filter === 'all' || CATEGORY_STATUSES[filter]?.includes(delta.status);
+      const known = contractsRef.current.some((c) => c.id === delta.id);
+
+      if (queryRef.current) {
+        // Deltas carry no searchable text, so let the server apply the search
+        if (inFilter || known) scheduleReload();
+      } else if (!known) {
+        // A contract we have not seen yet (e.g. created by a colleague)
+        if (inFilter) scheduleReload();
+      } else if (!inFilter) {
+        setContracts((prev) => prev.filter((c) => c.id !== delta.id));
+      } else {
+        setContracts((prev) =>
+          prev.map((c) => (c.id === delta.id ? { ...c, status: delta.status, updatedAt: delta.updatedAt } : c))
+        );
+      }
+
+      clearTimeout(statsTimer);
+      statsTimer = setTimeout(fetchStats, 500);
+    });
+
+    return () => {
+      source.close();
+      clearTimeout(statsTimer);
+      clearTimeout(reloadTimer);
+    };
+  }, [filter]);
+
+  const contractsUrl = () => {
+    const params = new URLSearchParams({ fields: 'summary' });
+    if (filter !== 'all') params.set('category', filter);
+    if (query) {
+      params.set('q', query);
+      params.set('limit', '100');
+    }
+    return `/api/contracts?${params}`;
+  };
+
+  // Search responses are paginated ({ contracts, nextCursor }); plain lists are arrays
+  const readContracts = async (res) => {
+    const body = await res.json();
+    return Array.isArray(body) ? body : body.contracts;
+  };
+
   const fetchData = async () => {
     try {
       setLoading(true);
-      const params = filter !== 'all' ? `?category=${filter}` : '';
       const [contractsRes, blueprintsRes, statsRes] = await Promise.all([
-        fetch(`/api/contracts${params}`),
-        fetch('/api/blueprints'),
+        fetch(contractsUrl()),
+        fetch('/api/blueprints?fields=summary'),
         fetch('/api/stats')
       ]);
 
-      if (contractsRes.ok) setContracts(await contractsRes.json());
+      if (contractsRes.ok) setContracts(await readContracts(contractsRes));
       if (blueprintsRes.ok) setBlueprints(await blueprintsRes.json());
       if (statsRes.ok) setStats(await statsRes.json());
     } catch (error) {
@@ -103,6 +186,27 @@ export default function Dashboard() {
     }
   };
 
+  const fetchContracts = async () => {
+    try {
+      const res = await fetch(contractsUrl());
+      if (res.ok) setContracts(await readContracts(res));
+    } catch (error) {
+      console.error('Error fetching contracts:', error);
+    }
+  };
+
+  // The change-feed handler outlives renders; always reload with the current search
+  fetchContractsRef.current = fetchContracts;
+
+  const fetchStats = async () => {
+    try {
+      const res = await fetch('/api/stats');
+      if (res.ok) setStats(await res.json());
+    } catch (error) {
+      console.error('Error fetching stats:', error);
+    }
+  };
+
   const handleTransition = async () => {
     const { contract, targetStatus } = transitionDialog;
     if (!contract || !targetStatus) return;
@@ -111,12 +215,23 @@ export default function Dashboard() {
       const res = await fetch(`/api/contracts/${contract.id}/transition`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ newStatus: targetStatus })
+        body: JSON.stringify({ newStatus: targetStatus, expectedStatus: contract.status })
       });
 
       if (res.ok) {
+        const updated = await res.json();
+        const inFilter = filter === 'all' || CATEGORY_STATUSES[filter]?.includes(updated.status);
+        setContracts((prev) =>
+          inFilter
+            ? prev.map((c) => (c.id === updated.id ? { ...c, status: updated.status, updatedAt: updated.updatedAt } : c))
+            : prev.filter((c) => c.id !== updated.id)
+        );
+        fetchStats();
         toast.success(`Document ${targetStatus} successfully`);
-        fetchData();
+      } else if (res.status === 409) {
+        const error = await res.json();
+        toast.error(error.error || 'Document was changed by someone else');
+        fetchContracts();
       } else {
         const error = await res.json();
         toast.error(error.error || 'Failed to update document status');
@@ -163,6 +278,8 @@ export default function Dashboard() {
       title="Overview"
       subtitle="Documents, templates, and lifecycle at a glance"
       actions={actions}
+      search={search}
+      onSearchChange={setSearch}
     >
       <div className="grid grid-cols-1 gap-4 lg:grid-cols-3">
         {/* Hero */}
@@ -270,6 +387,13 @@ export default function Dashboard() {
                     <SelectItem value="revoked">Revoked</SelectItem>
                   </SelectContent>
                 </Select>
+                {/* Streamed by the server; the browser saves it as a download */}
+                <a href={`/api/contracts/export?format=csv${filter !== 'all' ? `&category=${filter}` : ''}`} download>
+                  <Button variant="outline" className="gap-2">
+                    <Download className="h-4 w-4" />
+                    Export CSV
+                  </Button>
+                </a>
               </div>
             </div>
           </CardHeader>
@@ -278,6 +402,14 @@ export default function Dashboard() {
               <div className="flex items-center justify-center py-10 text-sm text-muted-foreground">
                 Loading…
               </div>
+            ) : contracts.length === 0 && query ? (
+              <div className="rounded-xl border border-dashed border-slate-300 bg-white p-10 text-center">
+                <FileStack className="mx-auto h-12 w-12 text-slate-400" />
+                <div className="mt-3 text-lg font-semibold text-slate-900">No matching documents</div>
+                <div className="mt-1 text-sm text-slate-600">
+                  Nothing matches “{query.trim()}”. Try fewer or shorter words.
+                </div>
+              </div>
             ) : contracts.length === 0 ? (
               <div className="rounded-xl border border-dashed border-slate-300 bg-white p-10 text-center">
                 <FileStack className="mx-auto h-12 w-12 text-slate-400" />
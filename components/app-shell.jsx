@@ -55,7 +55,7 @@ function NavLinks({ onNavigate }) {
     );
 }
 
-export function AppShell({ title, subtitle, actions, children }) {
+export function AppShell({ title, subtitle, actions, search, onSearchChange, children }) {
     return (
         <div className="min-h-screen bg-[radial-gradient(ellipse_at_top,_var(--tw-gradient-stops))] from-indigo-50 via-white to-teal-50">
             <div className="mx-auto max-w-screen-2xl px-2 sm:px-3 lg:px-4">
@@ -114,15 +114,20 @@ export function AppShell({ title, subtitle, actions, children }) {
                                     {subtitle ? <div className="truncate text-xs text-slate-500">{subtitle}</div> : null}
                                 </div>
 
-                                <div className="ml-auto hidden w-[380px] max-w-[42vw] items-center gap-2 rounded-xl border border-slate-200 bg-white px-3 py-2 lg:flex">
-                                    <Search className="h-4 w-4 text-slate-400" />
-                                    <Input
-                                        className="h-6 border-0 p-0 text-sm shadow-none focus-visible:ring-0"
-                                        placeholder="Search documents, templates…"
-                                    />
-                                </div>
+                                {/* Only pages that handle the search show the box */}
+                                {onSearchChange ? (
+                                    <div className="ml-auto hidden w-[380px] max-w-[42vw] items-center gap-2 rounded-xl border border-slate-200 bg-white px-3 py-2 lg:flex">
+                                        <Search className="h-4 w-4 text-slate-400" />
+                                        <Input
+                                            className="h-6 border-0 p-0 text-sm shadow-none focus-visible:ring-0"
+                                            placeholder="Search documents, templates…"
+                                            value={search}
+                                            onChange={(e) => onSearchChange(e.target.value)}
+                                        />
+                                    </div>
+                                ) : null}
 
-                                <div className="ml-auto flex items-center gap-2 lg:ml-3">
+                                <div className={cn('ml-auto flex items-center gap-2', onSearchChange && 'lg:ml-3')}>
                                     {actions}
                                 </div>
                             </div>
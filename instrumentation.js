@@ -0,0 +1,19 @@
+// Runs once when the Next.js server starts (experimental.instrumentationHook)
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs') return;
+  const { warmUp } = await import('@/lib/db');
+  try {
+    const started = Date.now();
+    const connections = await warmUp();
+    console.log(`MongoDB ready: indexes built, ${connections} connection(s) open in ${Date.now() - started}ms`);
+  } catch (error) {
+    // Requests retry through getDb(); /api/health reports 503 meanwhile
+    console.error('Error warming up MongoDB:', error);
+  }
+
+  // Lifecycle jobs (auto-lock, expiry) when SCHEDULER_* settings enable any
+  const { startScheduler } = await import('@/lib/scheduler');
+  if (startScheduler()) {
+    console.log('Lifecycle scheduler started');
+  }
+}
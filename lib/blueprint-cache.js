@@ -0,0 +1,125 @@
+import { getCollection } from '@/lib/db';
+
+// Bounded in-process LRU of blueprint documents keyed by blueprint id.
+// Entries expire after a TTL so other instances' edits become visible; local
+// PUT/DELETE invalidate immediately. With BLUEPRINT_CACHE_WATCH=true a change
+// stream on `blueprints` (replica set only) invalidates across instances too.
+// Cached documents are shared: callers must not mutate them.
+
+const MAX_ENTRIES = Number.parseInt(process.env.BLUEPRINT_CACHE_SIZE || '500', 10);
+const TTL_MS = Number.parseInt(process.env.BLUEPRINT_CACHE_TTL_MS || '60000', 10);
+const WATCH = process.env.BLUEPRINT_CACHE_WATCH === 'true';
+
+function createCache() {
+  return {
+    entries: new Map(), // id -> { blueprint, expiresAt }
+    objectIds: new Map(), // String(_id) -> id, for change stream deletes
+    inflight: new Map(), // id -> Promise, de-duplicates concurrent misses
+    counters: { hits: 0, misses: 0, evictions: 0, invalidations: 0 },
+    watching: false
+  };
+}
+
+if (!global._blueprintCache) {
+  global._blueprintCache = createCache();
+}
+const cache = global._blueprintCache;
+
+function remove(id) {
+  const entry = cache.entries.get(id);
+  if (!entry) return false;
+  cache.entries.delete(id);
+  if (entry.blueprint._id) cache.objectIds.delete(String(entry.blueprint._id));
+  return true;
+}
+
+function store(blueprint) {
+  remove(blueprint.id);
+  cache.entries.set(blueprint.id, { blueprint, expiresAt: Date.now() + TTL_MS });
+  if (blueprint._id) cache.objectIds.set(String(blueprint._id), blueprint.id);
+
+  // Map iteration order is insertion order, so the first key is least recently used
+  while (cache.entries.size > MAX_ENTRIES) {
+    remove(cache.entries.keys().next().value);
+    cache.counters.evictions++;
+  }
+}
+
+async function startWatching() {
+  if (!WATCH || cache.watching) return;
+  cache.watching = true;
+  try {
+    const blueprints = await getCollection('blueprints');
+    const stream = blueprints.watch([
+      { $match: { operationType: { $in: ['update', 'replace', 'delete'] } } }
+    ]);
+    stream.on('change', change => {
+      const id = cache.objectIds.get(String(change.documentKey._id));
+      if (id) invalidateBlueprint(id);
+    });
+    stream.on('error', error => {
+      console.error('Blueprint cache change stream failed; relying on TTL:', error);
+      cache.watching = false;
+    });
+  } catch (error) {
+    console.error('Blueprint cache change stream unavailable; relying on TTL:', error);
+    cache.watching = false;
+  }
+}
+
+// Get a blueprint by id, from the cache when fresh. Returns null if not found.
+export async function getBlueprint(id) {
+  startWatching();
+
+  const entry = cache.entries.get(id);
+  if (entry && entry.expiresAt > Date.now()) {
+    // Refresh recency
+    cache.entries.delete(id);
+    cache.entries.set(id, entry);
+    cache.counters.hits++;
+    return entry.blueprint;
+  }
+
+  cache.counters.misses++;
+  // Concurrent misses for one id share a single read
+  const pending = cache.inflight.get(id);
+  if (pending) return pending;
+
+  const load = (async () => {
+    const blueprints = await getCollection('blueprints');
+    const blueprint = await blueprints.findOne({ id });
+    // An invalidation while loading removed this load from `inflight`: its
+    // read may predate the write, so it must not go back into the cache
+    if (blueprint && cache.inflight.get(id) === load) {
+      store(blueprint);
+    }
+    return blueprint;
+  })();
+
+  cache.inflight.set(id, load);
+  const settle = () => {
+    // A newer load may have replaced this one after an invalidation
+    if (cache.inflight.get(id) === load) cache.inflight.delete(id);
+  };
+  load.then(settle, settle);
+  return load;
+}
+
+// Drop a blueprint after it was changed or deleted; loads already in flight
+// are detached so their results are not cached
+export function invalidateBlueprint(id) {
+  cache.inflight.delete(id);
+  if (remove(id)) cache.counters.invalidations++;
+}
+
+export function getBlueprintCacheStats() {
+  const { hits, misses } = cache.counters;
+  return {
+    size: cache.entries.size,
+    maxEntries: MAX_ENTRIES,
+    ttlMs: TTL_MS,
+    watching: cache.watching,
+    ...cache.counters,
+    hitRate: hits + misses > 0 ? hits / (hits + misses) : 0
+  };
+}
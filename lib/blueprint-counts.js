@@ -0,0 +1,89 @@
+import { getCollection } from '@/lib/db';
+
+// Blueprints carry a contractCount maintained with $inc by every path that
+// creates or deletes contracts. Delete protection is then a guarded filter
+// ({ contractCount: 0 }) instead of a countDocuments on contracts. Counts are
+// taken before contracts are inserted, so a blueprint can never be deleted
+// while a contract referencing it is being created. (Edits create a new
+// version instead, see lib/blueprint-versions.js.)
+
+// Add n references; returns false if the blueprint no longer exists
+export async function addContractReferences(blueprintId, n = 1) {
+  const blueprints = await getCollection('blueprints');
+  const { matchedCount } = await blueprints.updateOne(
+    { id: blueprintId },
+    { $inc: { contractCount: n } }
+  );
+  return matchedCount > 0;
+}
+
+export async function removeContractReferences(blueprintId, n = 1) {
+  if (n <= 0) return;
+  const blueprints = await getCollection('blueprints');
+  await blueprints.updateOne({ id: blueprintId }, { $inc: { contractCount: -n } });
+}
+
+// Blueprints created before contractCount existed get it on first use
+export async function backfillContractCount(blueprintId) {
+  const contracts = await getCollection('contracts');
+  const blueprints = await getCollection('blueprints');
+  const contractCount = await contracts.countDocuments({ blueprintId });
+  await blueprints.updateOne(
+    { id: blueprintId, contractCount: { $exists: false } },
+    { $set: { contractCount } }
+  );
+  return contractCount;
+}
+
+// Recompute every blueprint's contractCount from the contracts collection
+export async function repairContractCounts() {
+  const contracts = await getCollection('contracts');
+  const blueprints = await getCollection('blueprints');
+
+  const counts = await contracts.aggregate([
+    { $group: { _id: '$blueprintId', count: { $sum: 1 } } }
+  ]).toArray();
+  const countById = new Map(counts.map(entry => [entry._id, entry.count]));
+
+  const operations = [];
+  let changed = 0;
+  const cursor = blueprints.find({}, { projection: { _id: 0, id: 1, contractCount: 1 } });
+  for await (const blueprint of cursor) {
+    const contractCount = countById.get(blueprint.id) || 0;
+    if (blueprint.contractCount !== contractCount) {
+      changed++;
+      operations.push({
+        updateOne: { filter: { id: blueprint.id }, update: { $set: { contractCount } } }
+      });
+    }
+    if (operations.length >= 1000) {
+      await blueprints.bulkWrite(operations.splice(0), { ordered: false });
+    }
+  }
+  if (operations.length > 0) {
+    await blueprints.bulkWrite(operations, { ordered: false });
+  }
+
+  return { blueprintsChecked: await blueprints.estimatedDocumentCount(), blueprintsRepaired: changed };
+}
+
+// Run a write guarded on { contractCount: 0 } (write returns a falsy value when
+// the guard did not match). Legacy blueprints without a counter are backfilled
+// and the write retried once. Returns { result } | { notFound } | { inUse }.
+export async function writeIfUnreferenced(blueprintId, write) {
+  let result = await write();
+  if (result) return { result };
+
+  const blueprints = await getCollection('blueprints');
+  const existing = await blueprints.findOne(
+    { id: blueprintId },
+    { projection: { _id: 0, contractCount: 1 } }
+  );
+  if (!existing) return { notFound: true };
+
+  if (existing.contractCount === undefined && (await backfillContractCount(blueprintId)) === 0) {
+    result = await write();
+    if (result) return { result };
+  }
+  return { inUse: true };
+}
@@ -0,0 +1,238 @@
+import { v4 as uuidv4 } from 'uuid';
+import { getCollection } from '@/lib/db';
+import { getBlueprint } from '@/lib/blueprint-cache';
+import { defaultFieldValue } from '@/lib/schema';
+
+// Immutable blueprint versions.
+//
+// The `blueprints` document is the head: the latest name, description and
+// fields plus their version number. Every edit bumps the version and writes a
+// snapshot to `blueprint_versions` ({ blueprintId, version, name, description,
+// fields, createdAt }) that is never changed afterwards. Contracts reference
+// { blueprintId, blueprintVersion } and keep only `values` keyed by field id;
+// API responses are hydrated back into the `fields` array from the snapshot.
+// Contracts created before versioning embed their field definitions and are
+// passed through unchanged until migrateBlueprintVersions() converts them.
+//
+// Snapshots never change, so they are cached in-process without expiry.
+
+const MAX_CACHED_VERSIONS = Number.parseInt(process.env.BLUEPRINT_VERSION_CACHE_SIZE || '2000', 10);
+const MIGRATION_BATCH_SIZE = 1000;
+
+// Field ids become keys of contract `values`, so they cannot contain dots or start with $
+const FIELD_ID_PATTERN = /^[A-Za-z0-9_-]{1,64}$/;
+
+if (!global._blueprintVersionCache) {
+  global._blueprintVersionCache = new Map(); // `${blueprintId}@${version}` -> snapshot
+}
+const cache = global._blueprintVersionCache;
+
+export function versionKey(blueprintId, version) {
+  return `${blueprintId}@${version}`;
+}
+
+function remember(snapshot) {
+  const key = versionKey(snapshot.blueprintId, snapshot.version);
+  cache.delete(key);
+  cache.set(key, snapshot);
+  while (cache.size > MAX_CACHED_VERSIONS) {
+    cache.delete(cache.keys().next().value);
+  }
+}
+
+// Field definitions for a new version. Submitted ids are kept when valid and
+// unique; fields without one reuse the id at the same position in the
+// previous version, so values of unchanged fields carry over by id.
+export function normalizeBlueprintFields(fields, previousFields = []) {
+  const used = new Set();
+  return fields.map((f, index) => {
+    const id = [f.id, previousFields[index]?.id].find(
+      candidate => typeof candidate === 'string' && FIELD_ID_PATTERN.test(candidate) && !used.has(candidate)
+    ) || uuidv4();
+    used.add(id);
+    return {
+      id,
+      type: f.type,
+      label: f.label.trim(),
+      position: f.position || { x: 0, y: index * 60 },
+      required: f.required || false
+    };
+  });
+}
+
+// Snapshot of a blueprint head (blueprints created before versioning are version 1)
+export function versionSnapshot(blueprint) {
+  return {
+    blueprintId: blueprint.id,
+    version: blueprint.version ?? 1,
+    name: blueprint.name,
+    description: blueprint.description || '',
+    fields: blueprint.fields,
+    createdAt: blueprint.updatedAt || blueprint.createdAt || new Date().toISOString()
+  };
+}
+
+// Write the snapshot of a blueprint head unless that version already exists
+export async function saveBlueprintVersion(blueprint) {
+  const snapshot = versionSnapshot(blueprint);
+  const versions = await getCollection('blueprint_versions');
+  try {
+    await versions.updateOne(
+      { blueprintId: snapshot.blueprintId, version: snapshot.version },
+      { $setOnInsert: snapshot },
+      { upsert: true }
+    );
+  } catch (error) {
+    // A concurrent upsert of the same version won the unique index
+    if (error.code !== 11000) throw error;
+  }
+  return snapshot;
+}
+
+// Resolve many { blueprintId, version } references with one query for the
+// uncached ones. A head whose snapshot was never written (a crash between the
+// head update and the snapshot, or a blueprint predating versioning) is
+// snapshotted on first use. Returns a Map keyed by `${blueprintId}@${version}`.
+export async function getBlueprintVersions(refs) {
+  const found = new Map();
+  const missing = new Map();
+  for (const { blueprintId, version } of refs) {
+    const key = versionKey(blueprintId, version);
+    if (found.has(key) || missing.has(key)) continue;
+    const snapshot = cache.get(key);
+    if (snapshot) {
+      found.set(key, snapshot);
+    } else {
+      missing.set(key, { blueprintId, version });
+    }
+  }
+  if (missing.size === 0) return found;
+
+  const versions = await getCollection('blueprint_versions');
+  const docs = await versions
+    .find({ $or: [...missing.values()] }, { projection: { _id: 0 } })
+    .toArray();
+  for (const snapshot of docs) {
+    const key = versionKey(snapshot.blueprintId, snapshot.version);
+    remember(snapshot);
+    found.set(key, snapshot);
+    missing.delete(key);
+  }
+
+  for (const [key, { blueprintId, version }] of missing) {
+    const head = await getBlueprint(blueprintId);
+    if (head && (head.version ?? 1) === version) {
+      const snapshot = await saveBlueprintVersion(head);
+      remember(snapshot);
+      found.set(key, snapshot);
+    }
+  }
+  return found;
+}
+
+// One blueprint version, or null if it does not exist
+export async function getBlueprintVersion(blueprintId, version) {
+  const found = await getBlueprintVersions([{ blueprintId, version }]);
+  return found.get(versionKey(blueprintId, version)) || null;
+}
+
+// Field values of a contract keyed by field id, for both document shapes
+export function contractValues(contract) {
+  if (contract.values) return contract.values;
+  return Object.fromEntries((contract.fields || []).map(field => [field.id, field.value]));
+}
+
+// Turn a versioned contract's `values` into the `fields` array of the API,
+// using the field definitions of `version` (a snapshot or the head it was
+// built from). Contracts without `values` are returned unchanged.
+export function hydrateContract(contract, version) {
+  if (!contract || contract.values === undefined) return contract;
+  const { values, ...rest } = contract;
+  return {
+    ...rest,
+    fields: (version?.fields || []).map(field => ({
+      ...field,
+      value: Object.hasOwn(values, field.id) ? values[field.id] : defaultFieldValue(field)
+    }))
+  };
+}
+
+// Hydrate one contract read from the database
+export async function hydrateStoredContract(contract) {
+  if (!contract || contract.values === undefined) return contract;
+  return hydrateContract(contract, await getBlueprintVersion(contract.blueprintId, contract.blueprintVersion));
+}
+
+// Hydrate a list of contracts, loading the versions they reference in one go
+export async function hydrateContracts(contracts) {
+  const refs = contracts
+    .filter(contract => contract.values !== undefined)
+    .map(contract => ({ blueprintId: contract.blueprintId, version: contract.blueprintVersion }));
+  if (refs.length === 0) return contracts;
+  const found = await getBlueprintVersions(refs);
+  return contracts.map(contract =>
+    hydrateContract(contract, found.get(versionKey(contract.blueprintId, contract.blueprintVersion)))
+  );
+}
+
+function sameDefinitions(contractFields, versionFields) {
+  return contractFields.length === versionFields.length && contractFields.every((field, index) => {
+    const definition = versionFields[index];
+    return field.id === definition.id && field.type === definition.type && field.label === definition.label;
+  });
+}
+
+// Snapshot every blueprint's current version and convert contracts that embed
+// field definitions to { blueprintVersion, values }. Contracts whose fields no
+// longer match their blueprint (they cannot be attributed to a version) are
+// left as they are and reported. Safe to run repeatedly.
+export async function migrateBlueprintVersions() {
+  const blueprints = await getCollection('blueprints');
+  const contracts = await getCollection('contracts');
+
+  const heads = new Map();
+  let blueprintsVersioned = 0;
+  for await (const blueprint of blueprints.find({}, { projection: { _id: 0, contractCount: 0 } })) {
+    if (blueprint.version === undefined) {
+      await blueprints.updateOne({ id: blueprint.id, version: { $exists: false } }, { $set: { version: 1 } });
+    }
+    heads.set(blueprint.id, await saveBlueprintVersion(blueprint));
+    blueprintsVersioned++;
+  }
+
+  const cursor = contracts.find(
+    { values: { $exists: false } },
+    { projection: { _id: 0, id: 1, blueprintId: 1, fields: 1, version: 1 } }
+  );
+  let operations = [];
+  let contractsMigrated = 0;
+  let contractsSkipped = 0;
+  const flush = async () => {
+    if (operations.length === 0) return;
+    const { modifiedCount } = await contracts.bulkWrite(operations, { ordered: false });
+    contractsMigrated += modifiedCount;
+    operations = [];
+  };
+
+  for await (const contract of cursor) {
+    const head = heads.get(contract.blueprintId);
+    if (!head || !sameDefinitions(contract.fields || [], head.fields)) {
+      contractsSkipped++;
+      continue;
+    }
+    operations.push({
+      updateOne: {
+        // Guarded on the contract's version so a concurrent edit is not overwritten
+        filter: { id: contract.id, version: contract.version ?? null, values: { $exists: false } },
+        update: {
+          $set: { blueprintVersion: head.version, values: contractValues(contract) },
+          $unset: { fields: '' }
+        }
+      }
+    });
+    if (operations.length >= MIGRATION_BATCH_SIZE) await flush();
+  }
+  await flush();
+
+  return { blueprintsVersioned, contractsMigrated, contractsSkipped };
+}
@@ -0,0 +1,159 @@
+import { getCollection } from '@/lib/db';
+
+// Compact contract status-change feed ({ id, status, updatedAt } deltas) for
+// SSE. Only inserts and writes that set `status` are reported; name and field
+// edits are not. Uses a change stream when MongoDB runs as a replica set and
+// falls back to polling the { statusChangedAt, id } index on a standalone
+// mongod. Each delta carries an opaque position that can be passed back as
+// `resumeFrom` to continue.
+//
+// Timestamps are taken before a write commits, so a poll can miss a write that
+// commits after a later-stamped one was already read. Each poll therefore
+// re-reads the last POLL_OVERLAP_MS before the newest change it has seen and
+// skips the changes it already sent.
+
+const POLL_INTERVAL_MS = Number.parseInt(process.env.SSE_POLL_INTERVAL_MS || '1000', 10);
+const POLL_OVERLAP_MS = Number.parseInt(process.env.SSE_POLL_OVERLAP_MS || '5000', 10);
+const POLL_BATCH_SIZE = 500;
+
+// Server error codes meaning change streams are unavailable on this deployment
+const CHANGE_STREAM_UNSUPPORTED = new Set([40573, 40324]);
+
+function encodePosition(kind, value) {
+  return `${kind}.${Buffer.from(JSON.stringify(value)).toString('base64url')}`;
+}
+
+function decodePosition(position) {
+  if (!position || typeof position !== 'string') return null;
+  const separator = position.indexOf('.');
+  if (separator < 0) return null;
+  try {
+    const value = JSON.parse(Buffer.from(position.slice(separator + 1), 'base64url').toString('utf8'));
+    return { kind: position.slice(0, separator), value };
+  } catch {
+    return null;
+  }
+}
+
+function matchesFilter(delta, { blueprintId, statuses, id }) {
+  if (id && delta.id !== id) return false;
+  if (blueprintId && delta.blueprintId !== blueprintId) return false;
+  if (statuses && !statuses.includes(delta.status)) return false;
+  return true;
+}
+
+function toDelta(doc) {
+  return { id: doc.id, status: doc.status, updatedAt: doc.updatedAt, blueprintId: doc.blueprintId };
+}
+
+async function streamChanges(contracts, filter, resumeToken, onDelta, signal) {
+  const match = {
+    $or: [
+      { operationType: { $in: ['insert', 'replace'] } },
+      { operationType: 'update', 'updateDescription.updatedFields.status': { $exists: true } }
+    ]
+  };
+  if (filter.id) match['fullDocument.id'] = filter.id;
+  if (filter.blueprintId) match['fullDocument.blueprintId'] = filter.blueprintId;
+  if (filter.statuses) match['fullDocument.status'] = { $in: filter.statuses };
+
+  const changeStream = contracts.watch(
+    [
+      { $match: match },
+      {
+        $project: {
+          'fullDocument.id': 1,
+          'fullDocument.status': 1,
+          'fullDocument.updatedAt': 1,
+          'fullDocument.blueprintId': 1
+        }
+      }
+    ],
+    { fullDocument: 'updateLookup', ...(resumeToken ? { resumeAfter: resumeToken } : {}) }
+  );
+
+  const close = () => changeStream.close().catch(() => {});
+  signal.addEventListener('abort', close, { once: true });
+  try {
+    for await (const change of changeStream) {
+      if (!change.fullDocument) continue;
+      onDelta(toDelta(change.fullDocument), encodePosition('cs', change._id));
+    }
+  } finally {
+    signal.removeEventListener('abort', close);
+    close();
+  }
+}
+
+function isAfter(row, position) {
+  return row.statusChangedAt > position.at || (row.statusChangedAt === position.at && row.id > position.id);
+}
+
+async function pollChanges(contracts, filter, since, onDelta, signal) {
+  // Changes at or before the starting position are never sent; positions
+  // written before the feed keyed on statusChangedAt carry updatedAt
+  const start = since
+    ? { at: since.at ?? since.updatedAt, id: since.id || '' }
+    : { at: new Date().toISOString(), id: '' };
+  let position = start;
+  const sent = new Map(); // `${id}@${statusChangedAt}` -> statusChangedAt, within the overlap window
+
+  while (!signal.aborted) {
+    const from = new Date(Date.parse(position.at) - POLL_OVERLAP_MS).toISOString();
+    const query = { statusChangedAt: { $gte: from } };
+    if (filter.id) query.id = filter.id;
+    if (filter.blueprintId) query.blueprintId = filter.blueprintId;
+
+    const cursor = contracts
+      .find(query, { projection: { _id: 0, id: 1, status: 1, statusChangedAt: 1, updatedAt: 1, blueprintId: 1 } })
+      .sort({ statusChangedAt: 1, id: 1 })
+      .batchSize(POLL_BATCH_SIZE);
+
+    for await (const row of cursor) {
+      if (signal.aborted) break;
+      const key = `${row.id}@${row.statusChangedAt}`;
+      if (!isAfter(row, start) || sent.has(key)) continue;
+      sent.set(key, row.statusChangedAt);
+      if (isAfter(row, position)) position = { at: row.statusChangedAt, id: row.id };
+
+      const delta = toDelta(row);
+      if (matchesFilter(delta, filter)) {
+        onDelta(delta, encodePosition('p', { at: row.statusChangedAt, id: row.id }));
+      }
+    }
+
+    // Forget changes that have left the overlap window
+    for (const [key, at] of sent) {
+      if (at < from) sent.delete(key);
+    }
+
+    if (!signal.aborted) {
+      await new Promise(resolve => {
+        const timer = setTimeout(resolve, POLL_INTERVAL_MS);
+        signal.addEventListener('abort', () => {
+          clearTimeout(timer);
+          resolve();
+        }, { once: true });
+      });
+    }
+  }
+}
+
+// Follow contract changes until `signal` aborts.
+// filter: { id?, blueprintId?, statuses? }; onDelta(delta, position) per change.
+export async function followContractChanges({ filter = {}, resumeFrom, onDelta, signal }) {
+  const contracts = await getCollection('contracts');
+  const resume = decodePosition(resumeFrom);
+
+  if (resume?.kind !== 'p') {
+    try {
+      await streamChanges(contracts, filter, resume?.kind === 'cs' ? resume.value : null, onDelta, signal);
+      return;
+    } catch (error) {
+      if (signal.aborted) return;
+      if (!CHANGE_STREAM_UNSUPPORTED.has(error.code)) throw error;
+    }
+  }
+
+  await pollChanges(contracts, filter, resume?.kind === 'p' ? resume.value : null, onDelta, signal);
+}
@@ -0,0 +1,138 @@
+import { v4 as uuidv4 } from 'uuid';
+import { getCollection } from '@/lib/db';
+import { afterCursor } from '@/lib/pagination';
+import { rollupEvents } from '@/lib/timeseries';
+
+// Lifecycle history lives in the append-only contract_events collection.
+// Contracts keep only a denormalized tail of the latest entries in
+// statusHistory (for the detail page) plus historyCount, so their size stays
+// bounded however many transitions they go through.
+//
+// Contracts written before the events collection existed have no
+// historyCount and still embed their full history; they are migrated on first
+// read of their history or in bulk via POST /api/contracts/migrate-history.
+
+export const HISTORY_TAIL_SIZE = 5;
+
+// True (as an aggregation expression) once a contract's history lives in contract_events
+const MIGRATED = { $ne: [{ $type: '$historyCount' }, 'missing'] };
+
+export function historyEntry(status, previousStatus, note, timestamp) {
+  const entry = { status, timestamp, note };
+  if (previousStatus) entry.previousStatus = previousStatus;
+  return entry;
+}
+
+// enteredPreviousAt is when the contract entered entry.previousStatus; it
+// gives the time-in-state used by the analytics rollups
+export function buildContractEvent(contract, entry, enteredPreviousAt) {
+  const event = {
+    id: uuidv4(),
+    contractId: contract.id,
+    blueprintId: contract.blueprintId,
+    ...entry
+  };
+  if (entry.previousStatus && enteredPreviousAt) {
+    event.durationInPreviousMs = Date.parse(entry.timestamp) - Date.parse(enteredPreviousAt);
+  }
+  return event;
+}
+
+// Pipeline stage appending entry to the tail (legacy contracts keep their full
+// embedded history untouched until they are migrated)
+export function appendHistoryStage(entry) {
+  return {
+    $set: {
+      statusHistory: {
+        $let: {
+          vars: { history: { $concatArrays: [{ $ifNull: ['$statusHistory', []] }, [{ $literal: entry }]] } },
+          in: { $cond: [MIGRATED, { $slice: ['$$history', -HISTORY_TAIL_SIZE] }, '$$history'] }
+        }
+      },
+      historyCount: { $cond: [MIGRATED, { $add: ['$historyCount', 1] }, '$$REMOVE'] }
+    }
+  };
+}
+
+export async function recordContractEvents(events) {
+  if (events.length === 0) return;
+  try {
+    const collection = await getCollection('contract_events');
+    await collection.insertMany(events, { ordered: false });
+  } catch (error) {
+    // The contract write already succeeded; a lost event only affects the timeline
+    console.error('Error recording contract events:', error);
+    return;
+  }
+  await rollupEvents(events);
+}
+
+// Delete a contract's events and take them out of the daily rollups
+export async function deleteContractEvents(contractId) {
+  const collection = await getCollection('contract_events');
+  const events = await collection
+    .find({ contractId }, { projection: { _id: 0, timestamp: 1, status: 1, previousStatus: 1, durationInPreviousMs: 1 } })
+    .toArray();
+  await collection.deleteMany({ contractId });
+  await rollupEvents(events, -1);
+}
+
+// One page of a contract's events, oldest first, after an optional { timestamp, id } position
+export async function listContractEvents(contractId, { limit, after } = {}) {
+  const collection = await getCollection('contract_events');
+  const query = after
+    ? { $and: [{ contractId }, afterCursor(after, 'timestamp', 1)] }
+    : { contractId };
+  return collection
+    .find(query, { projection: { _id: 0 } })
+    .sort({ timestamp: 1, id: 1 })
+    .limit(limit)
+    .toArray();
+}
+
+// Copy a legacy contract's embedded history into contract_events and trim it
+// to the tail. Upserts keyed on (contractId, timestamp, status) make reruns and
+// events already written by the transition routes safe. Copied events are not
+// rolled up; rebuild the daily rollups afterwards (lib/timeseries.js).
+export async function migrateContractHistory(contract) {
+  const history = contract.statusHistory || [];
+  if (history.length > 0) {
+    const collection = await getCollection('contract_events');
+    await collection.bulkWrite(
+      history.map((entry, index) => ({
+        updateOne: {
+          filter: { contractId: contract.id, timestamp: entry.timestamp, status: entry.status },
+          update: { $setOnInsert: buildContractEvent(contract, entry, history[index - 1]?.timestamp) },
+          upsert: true
+        }
+      })),
+      { ordered: false }
+    );
+  }
+
+  const contracts = await getCollection('contracts');
+  await contracts.updateOne({ id: contract.id, historyCount: { $exists: false } }, [
+    {
+      $set: {
+        historyCount: { $size: { $ifNull: ['$statusHistory', []] } },
+        statusHistory: { $slice: [{ $ifNull: ['$statusHistory', []] }, -HISTORY_TAIL_SIZE] }
+      }
+    }
+  ]);
+  return history.length;
+}
+
+export async function migrateAllContractHistory() {
+  const contracts = await getCollection('contracts');
+  let contractsMigrated = 0;
+  let entriesCopied = 0;
+  const cursor = contracts.find(
+    { historyCount: { $exists: false } },
+    { projection: { _id: 0, id: 1, blueprintId: 1, statusHistory: 1 } }
+  );
+  for await (const contract of cursor) {
+    entriesCopied += await migrateContractHistory(contract);
+    contractsMigrated++;
+  }
+  return { contractsMigrated, entriesCopied };
+}
@@ -0,0 +1,109 @@
+import { v4 as uuidv4 } from 'uuid';
+import { CONTRACT_STATES, getCategoryStatuses } from '@/lib/lifecycle';
+import { historyEntry } from '@/lib/contract-events';
+import { buildSearchFields } from '@/lib/search';
+import { compileSchema, getSchema } from '@/lib/schema';
+
+// Schema of a legacy contract (one that still embeds its field definitions),
+// compiled from those definitions so its values are checked like any other.
+// Uncached: every read returns new field arrays, so there is nothing shared to
+// key a cache on; migrate-versions moves these contracts onto cached versions.
+export function legacyContractSchema(contract) {
+  return compileSchema({ fields: contract.fields || [] });
+}
+
+// $set paths and arrayFilters updating the embedded field values of a legacy
+// contract. Returns { set, arrayFilters, errors }; only the submitted field
+// ids are visited.
+export function buildFieldValueUpdate(schema, fieldValues) {
+  const { values, errors } = schema.coerceSubmitted(fieldValues);
+  const set = {};
+  const arrayFilters = [];
+  Object.entries(values).forEach(([fieldId, value], index) => {
+    set[`fields.$[f${index}].value`] = value;
+    arrayFilters.push({ [`f${index}.id`]: fieldId });
+  });
+  return { set, arrayFilters, errors };
+}
+
+// $set paths updating the values of a versioned contract from the compiled
+// schema of its blueprint version. Returns { set, errors }; only the
+// submitted field ids are visited.
+export function buildValuesUpdate(schema, fieldValues) {
+  const { values, errors } = schema.coerceSubmitted(fieldValues);
+  const set = {};
+  for (const [fieldId, value] of Object.entries(values)) {
+    set[`values.${fieldId}`] = value;
+  }
+  return { set, errors };
+}
+
+// Initial field values of a new contract keyed by field id: { values, errors }
+export function buildContractValues(blueprint, fieldValues) {
+  return getSchema(blueprint).initialValues(fieldValues);
+}
+
+// Filter of the ?status=, ?category= and ?blueprintId= list parameters
+export function contractListFilter(searchParams) {
+  const query = {};
+  const status = searchParams.get('status');
+  const category = searchParams.get('category');
+  const blueprintId = searchParams.get('blueprintId');
+
+  if (status) {
+    query.status = status;
+  }
+
+  if (category) {
+    const categoryStatuses = getCategoryStatuses(category);
+    if (categoryStatuses) {
+      query.status = { $in: categoryStatuses };
+    }
+  }
+
+  if (blueprintId) {
+    query.blueprintId = blueprintId;
+  }
+  return query;
+}
+
+// Validate a contract name; returns an error message or null
+export function validateContractName(name) {
+  if (!name || typeof name !== 'string' || name.trim() === '') {
+    return 'Contract name is required';
+  }
+  return null;
+}
+
+// Validate submitted field values (optional); returns an error message or null
+export function validateFieldValues(fieldValues) {
+  if (fieldValues !== undefined && (!fieldValues || typeof fieldValues !== 'object' || Array.isArray(fieldValues))) {
+    return 'fieldValues must be an object';
+  }
+  return null;
+}
+
+// Build a new contract document in the created state from values returned by
+// buildContractValues. The contract references the blueprint's current
+// version and stores only the values of its fields.
+export function buildContract(blueprint, { name, values }, now = new Date().toISOString()) {
+  const fields = blueprint.fields.map(field => ({ type: field.type, value: values[field.id] }));
+  return {
+    id: uuidv4(),
+    name: name.trim(),
+    blueprintId: blueprint.id,
+    blueprintVersion: blueprint.version ?? 1,
+    blueprintName: blueprint.name,
+    status: CONTRACT_STATES.CREATED,
+    values,
+    // Tail of the history kept in contract_events (see lib/contract-events.js)
+    statusHistory: [historyEntry(CONTRACT_STATES.CREATED, null, 'Contract created', now)],
+    historyCount: 1,
+    statusChangedAt: now,
+    search: buildSearchFields({ name, blueprintName: blueprint.name, fields }),
+    // Incremented by every write; part of the ETag
+    version: 1,
+    createdAt: now,
+    updatedAt: now
+  };
+}
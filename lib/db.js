@@ -1,19 +1,203 @@
 import { MongoClient } from 'mongodb';
+import { currentRequestTimings, increment, observe } from '@/lib/metrics';
 
 const MONGO_URL = process.env.MONGO_URL || 'mongodb://localhost:27017';
 const DB_NAME = process.env.DB_NAME || 'contract_management';
+const SLOW_COMMAND_MS = Number.parseInt(process.env.MONGO_SLOW_COMMAND_MS || '100', 10);
 
-let client;
-let clientPromise;
+function intEnv(name) {
+  const value = Number.parseInt(process.env[name] ?? '', 10);
+  return Number.isFinite(value) ? value : undefined;
+}
+
+// Pool, timeout, read preference and write concern settings; unset variables
+// keep the driver defaults (maxPoolSize 100, minPoolSize 0, primary, w: 1)
+const CLIENT_OPTIONS = Object.fromEntries(
+  Object.entries({
+    maxPoolSize: intEnv('MONGO_MAX_POOL_SIZE'),
+    minPoolSize: intEnv('MONGO_MIN_POOL_SIZE'),
+    maxIdleTimeMS: intEnv('MONGO_MAX_IDLE_TIME_MS'),
+    waitQueueTimeoutMS: intEnv('MONGO_WAIT_QUEUE_TIMEOUT_MS'),
+    connectTimeoutMS: intEnv('MONGO_CONNECT_TIMEOUT_MS'),
+    serverSelectionTimeoutMS: intEnv('MONGO_SERVER_SELECTION_TIMEOUT_MS'),
+    socketTimeoutMS: intEnv('MONGO_SOCKET_TIMEOUT_MS'),
+    readPreference: process.env.MONGO_READ_PREFERENCE || undefined,
+    w: process.env.MONGO_WRITE_CONCERN
+      ? (/^\d+$/.test(process.env.MONGO_WRITE_CONCERN) ? Number(process.env.MONGO_WRITE_CONCERN) : process.env.MONGO_WRITE_CONCERN)
+      : undefined,
+    wtimeoutMS: intEnv('MONGO_WRITE_CONCERN_TIMEOUT_MS')
+  }).filter(([, value]) => value !== undefined)
+);
+
+// Indexes created once per process on first connect
+const INDEXES = {
+  contracts: [
+    { key: { id: 1 }, name: 'id_unique', unique: true },
+    { key: { status: 1, createdAt: -1, id: -1 }, name: 'status_createdAt' },
+    { key: { blueprintId: 1, createdAt: -1, id: -1 }, name: 'blueprintId_createdAt' },
+    { key: { createdAt: -1, id: -1 }, name: 'createdAt' },
+    { key: { updatedAt: 1, id: 1 }, name: 'updatedAt' },
+    // Covered max(updatedAt) for filtered list ETags (lib/http.js)
+    { key: { status: 1, updatedAt: -1 }, name: 'status_updatedAt' },
+    { key: { blueprintId: 1, updatedAt: -1 }, name: 'blueprintId_updatedAt' },
+    // Time in the current status, for scheduled jobs (lib/scheduler.js)
+    { key: { status: 1, statusChangedAt: 1 }, name: 'status_statusChangedAt' },
+    // Polling status-change feed (lib/change-feed.js)
+    { key: { statusChangedAt: 1, id: 1 }, name: 'statusChangedAt' },
+    // ?q= search (lib/search.js)
+    {
+      key: { name: 'text', blueprintName: 'text', 'search.text': 'text' },
+      name: 'contract_text',
+      weights: { name: 10, blueprintName: 3, 'search.text': 1 },
+      default_language: 'none'
+    },
+    { key: { 'search.tokens': 1, createdAt: -1, id: -1 }, name: 'search_tokens' }
+  ],
+  // Append-only lifecycle history (lib/contract-events.js)
+  contract_events: [
+    { key: { contractId: 1, timestamp: 1, id: 1 }, name: 'contractId_timestamp' },
+    { key: { timestamp: 1, status: 1 }, name: 'timestamp_status' }
+  ],
+  blueprints: [
+    { key: { id: 1 }, name: 'id_unique', unique: true },
+    { key: { createdAt: -1 }, name: 'createdAt' },
+    { key: { updatedAt: -1 }, name: 'updatedAt' }
+  ],
+  // Immutable snapshots referenced by contracts (lib/blueprint-versions.js)
+  blueprint_versions: [
+    { key: { blueprintId: 1, version: 1 }, name: 'blueprintId_version_unique', unique: true }
+  ]
+};
+
+async function ensureIndexes(client) {
+  const db = client.db(DB_NAME);
+  try {
+    await Promise.all(
+      Object.entries(INDEXES).map(([collectionName, specs]) =>
+        db.collection(collectionName).createIndexes(specs)
+      )
+    );
+  } catch (error) {
+    // Keep serving requests; a failed build (e.g. duplicate ids) only costs performance
+    console.error('Error creating indexes:', error);
+  }
+  return client;
+}
+
+// Commands whose first field does not name a collection
+const NO_COLLECTION = new Set(['ping', 'hello', 'isMaster', 'buildInfo', 'endSessions', 'killCursors']);
 
-if (!global._mongoClientPromise) {
-  client = new MongoClient(MONGO_URL);
-  global._mongoClientPromise = client.connect();
+// Per-command timings for lib/metrics.js, plus a log line for slow commands.
+// Started commands are remembered by requestId until they finish; the
+// request's timings are captured at start, while its async context is current.
+function monitorCommands(client) {
+  const started = new Map();
+
+  client.on('commandStarted', event => {
+    const value = event.command[event.commandName];
+    const collection = event.commandName === 'getMore'
+      ? event.command.collection
+      : (NO_COLLECTION.has(event.commandName) || typeof value !== 'string' ? '' : value);
+    started.set(event.requestId, { collection, filter: event.command.filter, timings: currentRequestTimings() });
+  });
+
+  const finish = (event, failed) => {
+    const command = started.get(event.requestId);
+    if (!command) return;
+    started.delete(event.requestId);
+    const labels = { collection: command.collection, command: event.commandName };
+    const seconds = event.duration / 1000;
+    observe('mongodb_command_duration_seconds', labels, seconds);
+    if (failed) increment('mongodb_command_failures_total', labels);
+    if (command.timings) command.timings.dbSeconds += seconds;
+    if (event.duration >= SLOW_COMMAND_MS) {
+      increment('mongodb_slow_commands_total', labels);
+      console.warn(JSON.stringify({
+        msg: 'slow mongodb command',
+        ...labels,
+        durationMs: event.duration,
+        filterKeys: command.filter ? Object.keys(command.filter) : undefined
+      }));
+    }
+  };
+  client.on('commandSucceeded', event => finish(event, false));
+  client.on('commandFailed', event => finish(event, true));
+  return client;
+}
+
+// Connection pool counters for GET /api/health. Checkout waits are kept in a
+// small ring so the health check can report recent percentiles.
+const CHECKOUT_WAIT_SAMPLES = 1000;
+
+if (!global._mongoPool) {
+  global._mongoPool = { open: 0, inUse: 0, waiting: 0, checkoutFailures: 0, waits: [], nextWait: 0 };
 }
-clientPromise = global._mongoClientPromise;
+const pool = global._mongoPool;
+
+function recordCheckoutWait(durationMS) {
+  if (pool.waits.length < CHECKOUT_WAIT_SAMPLES) {
+    pool.waits.push(durationMS);
+  } else {
+    pool.waits[pool.nextWait] = durationMS;
+    pool.nextWait = (pool.nextWait + 1) % CHECKOUT_WAIT_SAMPLES;
+  }
+  observe('mongodb_pool_checkout_wait_seconds', {}, durationMS / 1000);
+}
+
+function monitorPool(client) {
+  client.on('connectionCreated', () => { pool.open += 1; });
+  client.on('connectionClosed', () => { pool.open -= 1; });
+  client.on('connectionCheckOutStarted', () => { pool.waiting += 1; });
+  client.on('connectionCheckedOut', event => {
+    pool.waiting -= 1;
+    pool.inUse += 1;
+    recordCheckoutWait(event.durationMS);
+  });
+  client.on('connectionCheckOutFailed', event => {
+    pool.waiting -= 1;
+    pool.checkoutFailures += 1;
+    recordCheckoutWait(event.durationMS);
+  });
+  client.on('connectionCheckedIn', () => { pool.inUse -= 1; });
+  return client;
+}
+
+// Snapshot of the pool and of recent checkout waits (milliseconds)
+export function getPoolStats() {
+  const waits = [...pool.waits].sort((a, b) => a - b);
+  const at = q => (waits.length > 0 ? waits[Math.min(waits.length - 1, Math.floor(q * waits.length))] : null);
+  return {
+    maxPoolSize: CLIENT_OPTIONS.maxPoolSize ?? 100,
+    minPoolSize: CLIENT_OPTIONS.minPoolSize ?? 0,
+    open: pool.open,
+    inUse: pool.inUse,
+    available: pool.open - pool.inUse,
+    waiting: pool.waiting,
+    checkoutFailures: pool.checkoutFailures,
+    checkoutWaitMs: { samples: waits.length, p50: at(0.5), p95: at(0.95), max: waits.length > 0 ? waits[waits.length - 1] : null }
+  };
+}
+
+// One client per process. A failed connect is not cached, so the next caller
+// (a request or the health check) tries again.
+function connect() {
+  if (!global._mongoClientPromise) {
+    const client = monitorPool(monitorCommands(new MongoClient(MONGO_URL, { ...CLIENT_OPTIONS, monitorCommands: true })));
+    global._mongoClientPromise = client.connect().then(ensureIndexes).catch(error => {
+      global._mongoClientPromise = undefined;
+      client.close().catch(() => {});
+      throw error;
+    });
+  }
+  return global._mongoClientPromise;
+}
+
+const clientPromise = connect();
+// Failures surface to the callers of getDb(); do not crash the process here
+clientPromise.catch(() => {});
 
 export async function getDb() {
-  const client = await clientPromise;
+  const client = await connect();
   return client.db(DB_NAME);
 }
 
@@ -22,4 +206,14 @@ export async function getCollection(collectionName) {
   return db.collection(collectionName);
 }
 
+// Connect, build indexes and open minPoolSize connections before the first
+// request arrives (called from instrumentation.js at server start)
+export async function warmUp() {
+  const db = await getDb();
+  const connections = Math.max(CLIENT_OPTIONS.minPoolSize ?? 0, 1);
+  // Concurrent pings each check out their own connection
+  await Promise.all(Array.from({ length: connections }, () => db.command({ ping: 1 })));
+  return connections;
+}
+
 export default clientPromise;
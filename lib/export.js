@@ -0,0 +1,148 @@
+import { getCollection } from '@/lib/db';
+import { HIDE_SEARCH_FIELDS } from '@/lib/search';
+import { contractValues, hydrateContracts } from '@/lib/blueprint-versions';
+
+// Streaming contract export (GET /api/contracts/export).
+//
+// Rows are read from a MongoDB cursor with a bounded batch size and encoded
+// one batch per pull of the response stream, so a slow client slows the
+// cursor down instead of buffering rows in memory. CSV flattens field values
+// into one column per blueprint field; the columns come from every version of
+// the blueprints of the matching contracts, so the header is known before the
+// first row. NDJSON rows are hydrated like API responses, one batch at a time.
+
+export const EXPORT_FORMATS = {
+  ndjson: { contentType: 'application/x-ndjson; charset=utf-8', extension: 'ndjson' },
+  csv: { contentType: 'text/csv; charset=utf-8', extension: 'csv' }
+};
+
+export const EXPORT_BATCH_SIZE = Number.parseInt(process.env.EXPORT_BATCH_SIZE || '500', 10);
+
+const CSV_CONTRACT_COLUMNS = ['id', 'name', 'blueprintId', 'blueprintVersion', 'blueprintName', 'status', 'createdAt', 'updatedAt'];
+
+// Spreadsheet apps evaluate cells starting with these characters as formulas
+const FORMULA_PREFIX = /^[=+\-@\t\r]/;
+
+function csvCell(value) {
+  if (value === null || value === undefined) return '';
+  let text = String(value);
+  if (FORMULA_PREFIX.test(text)) text = `'${text}`;
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function csvLine(cells) {
+  return `${cells.map(csvCell).join(',')}\r\n`;
+}
+
+// One column per field of the given blueprints: the current fields first,
+// then fields that only older versions have. Labels shared by several
+// blueprints are prefixed with the blueprint name to keep headers unique.
+export async function csvFieldColumns(blueprintIds) {
+  const blueprints = await getCollection('blueprints');
+  const versions = await getCollection('blueprint_versions');
+  const fieldProjection = { _id: 0, 'fields.id': 1, 'fields.label': 1 };
+  const [docs, snapshots] = await Promise.all([
+    blueprints
+      .find({ id: { $in: blueprintIds } }, { projection: { ...fieldProjection, id: 1, name: 1 } })
+      .sort({ name: 1, id: 1 })
+      .toArray(),
+    versions
+      .find({ blueprintId: { $in: blueprintIds } }, { projection: { ...fieldProjection, blueprintId: 1 } })
+      .sort({ blueprintId: 1, version: -1 })
+      .toArray()
+  ]);
+
+  const fieldsOf = new Map(docs.map(blueprint => [blueprint.id, [...(blueprint.fields || [])]]));
+  for (const snapshot of snapshots) {
+    const fields = fieldsOf.get(snapshot.blueprintId);
+    if (!fields) continue;
+    for (const field of snapshot.fields || []) {
+      if (!fields.some(known => known.id === field.id)) fields.push(field);
+    }
+  }
+
+  const labelUses = new Map();
+  for (const fields of fieldsOf.values()) {
+    for (const field of fields) {
+      labelUses.set(field.label, (labelUses.get(field.label) || 0) + 1);
+    }
+  }
+  return docs.flatMap(blueprint =>
+    fieldsOf.get(blueprint.id).map(field => ({
+      fieldId: field.id,
+      header: labelUses.get(field.label) > 1 ? `${blueprint.name} / ${field.label}` : field.label
+    }))
+  );
+}
+
+function csvEncoder(fieldColumns) {
+  return {
+    header: csvLine([...CSV_CONTRACT_COLUMNS, ...fieldColumns.map(column => column.header)]),
+    hydrate: false,
+    row(contract) {
+      const values = contractValues(contract);
+      return csvLine([
+        ...CSV_CONTRACT_COLUMNS.map(column => contract[column]),
+        ...fieldColumns.map(column => values[column.fieldId])
+      ]);
+    }
+  };
+}
+
+const ndjsonEncoder = {
+  header: '',
+  hydrate: true,
+  row(contract) {
+    return `${JSON.stringify(contract)}\n`;
+  }
+};
+
+// ReadableStream of the contracts matching `query`, oldest first
+export async function exportContracts(query, format) {
+  const contracts = await getCollection('contracts');
+  let encoder = ndjsonEncoder;
+  if (format === 'csv') {
+    const blueprintIds = typeof query.blueprintId === 'string'
+      ? [query.blueprintId]
+      : await contracts.distinct('blueprintId', query);
+    encoder = csvEncoder(await csvFieldColumns(blueprintIds));
+  }
+
+  const cursor = contracts
+    .find(query, { projection: { _id: 0, ...HIDE_SEARCH_FIELDS } })
+    .sort({ createdAt: 1, id: 1 })
+    .batchSize(EXPORT_BATCH_SIZE);
+  const bytes = new TextEncoder();
+  let headerSent = false;
+
+  return new ReadableStream({
+    async pull(controller) {
+      try {
+        let chunk = headerSent ? '' : encoder.header;
+        headerSent = true;
+        // Encode whatever the last getMore returned, then yield to the client
+        const contract = await cursor.next();
+        if (!contract) {
+          if (chunk) controller.enqueue(bytes.encode(chunk));
+          controller.close();
+          return;
+        }
+        const batch = [contract];
+        while (cursor.bufferedCount() > 0) {
+          batch.push(await cursor.next());
+        }
+        for (const row of encoder.hydrate ? await hydrateContracts(batch) : batch) {
+          chunk += encoder.row(row);
+        }
+        controller.enqueue(bytes.encode(chunk));
+      } catch (error) {
+        console.error('Error exporting contracts:', error);
+        await cursor.close().catch(() => {});
+        controller.error(error);
+      }
+    },
+    async cancel() {
+      await cursor.close();
+    }
+  }, { highWaterMark: 1 });
+}
@@ -0,0 +1,99 @@
+import { createHash, timingSafeEqual } from 'crypto';
+import { NextResponse } from 'next/server';
+
+// Conditional GET helpers. Validators are strong ETags hashed from whatever
+// identifies a representation (id + version + updatedAt for documents, the
+// query plus max updatedAt and count for lists). Responses use
+// `Cache-Control: private, no-cache`: browsers keep them but revalidate on
+// every use, so an unchanged resource costs a 304 with no body.
+
+export const REVALIDATE = 'private, no-cache';
+
+export function etagFor(...parts) {
+  const hash = createHash('sha1').update(JSON.stringify(parts)).digest('base64url');
+  return `"${hash.slice(0, 27)}"`;
+}
+
+// True if the request's If-None-Match already names this ETag
+export function isNotModified(request, etag) {
+  const header = request.headers.get('if-none-match');
+  if (!header) return false;
+  if (header.trim() === '*') return true;
+  // If-None-Match uses weak comparison, so W/"x" matches "x"
+  return header.split(',').some(tag => tag.trim().replace(/^W\//, '') === etag);
+}
+
+// Validator of a document with a version counter. Unlike etagFor it can be
+// decoded again, so If-Match becomes part of the write's filter. Documents
+// written before the counter existed report version 0.
+export function versionEtag(doc) {
+  return `"${doc.version ?? 0}.${Date.parse(doc.updatedAt).toString(36)}"`;
+}
+
+// Filter equivalent of the request's If-Match for versionEtag validators:
+// undefined without the header, {} for "*", null when no listed tag can match
+export function ifMatchFilter(request) {
+  const header = request.headers.get('if-match');
+  if (!header) return undefined;
+  if (header.trim() === '*') return {};
+  const conditions = [];
+  for (const tag of header.split(',')) {
+    // If-Match uses strong comparison, so weak tags never match
+    const match = /^"(\d+)\.([0-9a-z]+)"$/.exec(tag.trim());
+    const time = match ? Number.parseInt(match[2], 36) : NaN;
+    if (!Number.isSafeInteger(time) || Number.isNaN(new Date(time).getTime())) continue;
+    const version = Number(match[1]);
+    conditions.push({
+      version: version === 0 ? { $exists: false } : version,
+      updatedAt: new Date(time).toISOString()
+    });
+  }
+  if (conditions.length === 0) return null;
+  return conditions.length === 1 ? conditions[0] : { $or: conditions };
+}
+
+// 304 when the client's copy is current, otherwise the JSON body with validators.
+// body may be a function so callers can skip building it on a 304.
+export async function conditionalJson(request, etag, body, { cacheControl = REVALIDATE, status = 200 } = {}) {
+  const headers = { ETag: etag, 'Cache-Control': cacheControl };
+  if (isNotModified(request, etag)) {
+    return new NextResponse(null, { status: 304, headers });
+  }
+  const payload = typeof body === 'function' ? await body() : body;
+  return NextResponse.json(payload, { status, headers });
+}
+
+// Validator of a list: query identity + max(updatedAt) + count. Both come
+// from index-only queries when the collection has an index on the filter
+// fields followed by updatedAt, so no documents are read (an unfiltered count
+// is the collection's metadata count).
+export async function listEtag(collection, query, ...identity) {
+  const unfiltered = Object.keys(query).length === 0;
+  const [latest, count] = await Promise.all([
+    collection
+      .find(query, { projection: { _id: 0, updatedAt: 1 } })
+      .sort({ updatedAt: -1 })
+      .limit(1)
+      .next(),
+    unfiltered ? collection.estimatedDocumentCount() : collection.countDocuments(query)
+  ]);
+  return etagFor(...identity, latest?.updatedAt ?? null, count);
+}
+
+// Maintenance routes (reconciles, rebuilds, migrations, scheduler runs) rewrite
+// whole collections, so they require `Authorization: Bearer <ADMIN_TOKEN>` and
+// are disabled while ADMIN_TOKEN is unset. Returns the error response to send,
+// or null when the request may proceed.
+export function requireAdmin(request) {
+  const token = process.env.ADMIN_TOKEN;
+  if (!token) {
+    return NextResponse.json({ error: 'Maintenance routes are disabled (ADMIN_TOKEN is not set)' }, { status: 403 });
+  }
+  const match = /^Bearer\s+(.+)$/i.exec(request.headers.get('authorization') || '');
+  const expected = createHash('sha256').update(token).digest();
+  const given = createHash('sha256').update(match ? match[1].trim() : '').digest();
+  if (!match || !timingSafeEqual(expected, given)) {
+    return NextResponse.json({ error: 'Admin token required' }, { status: 401 });
+  }
+  return null;
+}
@@ -31,9 +31,30 @@ export function getValidNextStates(currentState) {
   return VALID_TRANSITIONS[currentState] || [];
 }
 
+// Get the states from which a given state can be reached
+export function getValidSourceStates(targetState) {
+  return Object.keys(VALID_TRANSITIONS).filter(state => VALID_TRANSITIONS[state].includes(targetState));
+}
+
+// Map dashboard categories to statuses
+const CATEGORY_STATUSES = {
+  active: [CONTRACT_STATES.SENT],
+  pending: [CONTRACT_STATES.CREATED, CONTRACT_STATES.APPROVED],
+  signed: [CONTRACT_STATES.SIGNED, CONTRACT_STATES.LOCKED],
+  revoked: [CONTRACT_STATES.REVOKED]
+};
+
+// Get the statuses in a category (null for unknown categories)
+export function getCategoryStatuses(category) {
+  return CATEGORY_STATUSES[category] || null;
+}
+
+// States in which a contract can no longer be edited
+export const IMMUTABLE_STATES = [CONTRACT_STATES.LOCKED, CONTRACT_STATES.REVOKED];
+
 // Check if contract is immutable (locked or revoked)
 export function isImmutable(state) {
-  return state === CONTRACT_STATES.LOCKED || state === CONTRACT_STATES.REVOKED;
+  return IMMUTABLE_STATES.includes(state);
 }
 
 // Get status display info
@@ -0,0 +1,175 @@
+import { AsyncLocalStorage } from 'async_hooks';
+import { NextResponse } from 'next/server';
+
+// In-process request and MongoDB metrics, rendered in the Prometheus text
+// format by GET /api/metrics. Route handlers are wrapped with withMetrics();
+// lib/db.js feeds command timings from the driver's command monitoring. The
+// MongoDB time spent inside each request is tracked through an
+// AsyncLocalStorage so handler latency can be split into DB and other time.
+// Counters are per server process and reset on restart.
+
+const DURATION_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+const SIZE_BUCKETS = [128, 512, 2048, 8192, 32768, 131072, 524288, 2097152, 8388608];
+
+const METRICS = {
+  http_request_duration_seconds: {
+    type: 'histogram',
+    help: 'Route handler latency until the response is returned',
+    buckets: DURATION_BUCKETS
+  },
+  http_request_db_seconds: {
+    type: 'histogram',
+    help: 'Time spent in MongoDB commands per request',
+    buckets: DURATION_BUCKETS
+  },
+  http_response_size_bytes: {
+    type: 'histogram',
+    help: 'Response body size (streamed responses are counted when they finish)',
+    buckets: SIZE_BUCKETS
+  },
+  mongodb_command_duration_seconds: {
+    type: 'histogram',
+    help: 'MongoDB command latency by collection and command',
+    buckets: DURATION_BUCKETS
+  },
+  mongodb_pool_checkout_wait_seconds: {
+    type: 'histogram',
+    help: 'Time spent waiting for a pooled MongoDB connection',
+    buckets: DURATION_BUCKETS
+  },
+  mongodb_command_failures_total: {
+    type: 'counter',
+    help: 'MongoDB commands that returned an error'
+  },
+  mongodb_slow_commands_total: {
+    type: 'counter',
+    help: 'MongoDB commands slower than MONGO_SLOW_COMMAND_MS'
+  },
+  scheduler_job_duration_seconds: {
+    type: 'histogram',
+    help: 'Duration of scheduled lifecycle job runs (lib/scheduler.js)',
+    buckets: [0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120]
+  },
+  scheduler_contracts_processed_total: {
+    type: 'counter',
+    help: 'Contracts handled by scheduled lifecycle jobs by outcome'
+  }
+};
+
+const PREFIX = 'agreementhub_';
+
+if (!global._metrics) {
+  global._metrics = {
+    series: new Map(), // metric name -> Map(label key -> { labels, counts, sum, count } | { labels, value })
+    requests: new AsyncLocalStorage()
+  };
+}
+const registry = global._metrics;
+
+function seriesFor(name, labels) {
+  if (!registry.series.has(name)) registry.series.set(name, new Map());
+  const byLabels = registry.series.get(name);
+  const key = JSON.stringify(labels);
+  let series = byLabels.get(key);
+  if (!series) {
+    series = METRICS[name].type === 'histogram'
+      ? { labels, counts: new Array(METRICS[name].buckets.length).fill(0), sum: 0, count: 0 }
+      : { labels, value: 0 };
+    byLabels.set(key, series);
+  }
+  return series;
+}
+
+export function observe(name, labels, value) {
+  const series = seriesFor(name, labels);
+  const { buckets } = METRICS[name];
+  for (let i = 0; i < buckets.length; i++) {
+    if (value <= buckets[i]) series.counts[i] += 1;
+  }
+  series.sum += value;
+  series.count += 1;
+}
+
+export function increment(name, labels, amount = 1) {
+  seriesFor(name, labels).value += amount;
+}
+
+// Timings of the request currently being handled (undefined outside withMetrics)
+export function currentRequestTimings() {
+  return registry.requests.getStore();
+}
+
+// Count the bytes of a response body as it is sent; calls onDone with the total.
+// Event streams are left alone since they only end when the client leaves.
+function measureBody(response, onDone) {
+  if (!response.body || (response.headers.get('content-type') || '').startsWith('text/event-stream')) {
+    if (!response.body) onDone(0);
+    return response;
+  }
+  let bytes = 0;
+  const counter = new TransformStream({
+    transform(chunk, controller) {
+      bytes += chunk.byteLength;
+      controller.enqueue(chunk);
+    },
+    flush() {
+      onDone(bytes);
+    }
+  });
+  return new NextResponse(response.body.pipeThrough(counter), {
+    status: response.status,
+    statusText: response.statusText,
+    headers: response.headers
+  });
+}
+
+// Wrap a route handler to record its latency, status, response size and DB time.
+// `route` is the route's path pattern, e.g. '/api/contracts/[id]'.
+export function withMetrics(route, handler) {
+  return async function instrumented(request, context) {
+    const method = request.method;
+    const timings = { dbSeconds: 0 };
+    const started = process.hrtime.bigint();
+    let status = 500;
+    try {
+      const response = await registry.requests.run(timings, () => handler(request, context));
+      status = response.status;
+      return measureBody(response, bytes => observe('http_response_size_bytes', { route, method }, bytes));
+    } finally {
+      const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+      observe('http_request_duration_seconds', { route, method, status: String(status) }, seconds);
+      observe('http_request_db_seconds', { route, method }, timings.dbSeconds);
+    }
+  };
+}
+
+function escapeLabel(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+}
+
+function formatLabels(labels, extra = {}) {
+  const pairs = Object.entries({ ...labels, ...extra }).map(([key, value]) => `${key}="${escapeLabel(value)}"`);
+  return pairs.length > 0 ? `{${pairs.join(',')}}` : '';
+}
+
+// Every metric in the Prometheus text exposition format (version 0.0.4)
+export function renderMetrics() {
+  const lines = [];
+  for (const [name, { type, help, buckets }] of Object.entries(METRICS)) {
+    const fullName = PREFIX + name;
+    lines.push(`# HELP ${fullName} ${help}`, `# TYPE ${fullName} ${type}`);
+    for (const series of registry.series.get(name)?.values() || []) {
+      if (type === 'counter') {
+        lines.push(`${fullName}${formatLabels(series.labels)} ${series.value}`);
+        continue;
+      }
+      buckets.forEach((bound, i) => {
+        lines.push(`${fullName}_bucket${formatLabels(series.labels, { le: bound })} ${series.counts[i]}`);
+      });
+      lines.push(`${fullName}_bucket${formatLabels(series.labels, { le: '+Inf' })} ${series.count}`);
+      lines.push(`${fullName}_sum${formatLabels(series.labels)} ${series.sum}`);
+      lines.push(`${fullName}_count${formatLabels(series.labels)} ${series.count}`);
+    }
+  }
+  return `${lines.join('\n')}\n`;
+}
@@ -0,0 +1,42 @@
+// Opaque keyset cursors. Lists default to newest-first { createdAt: -1, id: -1 };
+// other keys (e.g. contract events by timestamp) pass the field and direction.
+
+export const DEFAULT_PAGE_SIZE = 50;
+export const MAX_PAGE_SIZE = 500;
+
+export function encodeCursor(doc, field = 'createdAt') {
+  return Buffer.from(JSON.stringify([doc[field], doc.id])).toString('base64url');
+}
+
+// Returns { [field], id } or null if the cursor is malformed
+export function decodeCursor(cursor, field = 'createdAt') {
+  try {
+    const decoded = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    if (!Array.isArray(decoded) || decoded.length !== 2) return null;
+    const [value, id] = decoded;
+    if (typeof value !== 'string' || typeof id !== 'string') return null;
+    return { [field]: value, id };
+  } catch {
+    return null;
+  }
+}
+
+// Parse the ?limit= parameter, clamped to [1, MAX_PAGE_SIZE]; null if invalid
+export function parseLimit(value) {
+  if (value === null || value === undefined || value === '') return DEFAULT_PAGE_SIZE;
+  const limit = Number.parseInt(value, 10);
+  if (!Number.isFinite(limit) || limit < 1) return null;
+  return Math.min(limit, MAX_PAGE_SIZE);
+}
+
+// Filter selecting documents strictly after the cursor position
+// (direction -1 = descending sort, 1 = ascending)
+export function afterCursor(position, field = 'createdAt', direction = -1) {
+  const op = direction < 0 ? '$lt' : '$gt';
+  return {
+    $or: [
+      { [field]: { [op]: position[field] } },
+      { [field]: position[field], id: { [op]: position.id } }
+    ]
+  };
+}
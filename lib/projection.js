@@ -0,0 +1,69 @@
+// Response projections for list endpoints: ?fields=summary or ?fields=a,b,c
+
+export const CONTRACT_LIST_FIELDS = {
+  stored: ['id', 'name', 'blueprintId', 'blueprintVersion', 'blueprintName', 'status', 'fields', 'statusHistory', 'historyCount', 'createdAt', 'updatedAt'],
+  derived: {
+    // Versioned contracts keep one entry in `values` per field; legacy ones embed `fields`
+    fieldCount: {
+      $cond: [
+        { $isArray: '$fields' },
+        { $size: '$fields' },
+        { $size: { $objectToArray: { $ifNull: ['$values', {}] } } }
+      ]
+    },
+    // statusHistory is only a tail; legacy contracts without historyCount embed the full history
+    historyLength: { $ifNull: ['$historyCount', { $size: { $ifNull: ['$statusHistory', []] } }] }
+  },
+  summary: ['id', 'name', 'blueprintId', 'blueprintName', 'status', 'createdAt', 'updatedAt', 'fieldCount', 'historyLength'],
+  // Needed to build pagination cursors
+  always: ['id', 'createdAt'],
+  // Stored fields that a requested field is built from (fields are hydrated from values)
+  sources: { fields: ['values', 'blueprintId', 'blueprintVersion'] },
+  // Internal fields left out of full documents
+  hidden: { search: 0 }
+};
+
+export const BLUEPRINT_LIST_FIELDS = {
+  stored: ['id', 'name', 'description', 'fields', 'version', 'createdAt', 'updatedAt'],
+  derived: {
+    fieldCount: { $size: { $ifNull: ['$fields', []] } },
+    fieldTypes: { $setUnion: [{ $ifNull: ['$fields.type', []] }] },
+    fieldPreview: {
+      $map: {
+        input: { $slice: [{ $ifNull: ['$fields', []] }, 6] },
+        as: 'field',
+        in: { id: '$$field.id', type: '$$field.type', label: '$$field.label' }
+      }
+    }
+  },
+  summary: ['id', 'name', 'description', 'version', 'createdAt', 'updatedAt', 'fieldCount', 'fieldTypes', 'fieldPreview'],
+  always: ['id'],
+  // Reference counter for delete protection; changes without touching updatedAt
+  hidden: { contractCount: 0 }
+};
+
+// Build a find() projection from the ?fields= parameter.
+// Returns { projection } (full documents when nothing is requested) or { error }.
+export function parseFieldsParam(value, spec) {
+  if (value === null || value === undefined || value === '' || value === 'full') {
+    return { projection: spec.hidden };
+  }
+
+  const requested = value === 'summary'
+    ? spec.summary
+    : value.split(',').map(name => name.trim()).filter(Boolean);
+
+  const unknown = requested.filter(name => !spec.stored.includes(name) && !(name in spec.derived));
+  if (unknown.length > 0) {
+    return { error: `Unknown fields: ${unknown.join(', ')}` };
+  }
+
+  const projection = { _id: 0 };
+  for (const name of [...spec.always, ...requested]) {
+    projection[name] = spec.derived[name] || 1;
+    for (const source of spec.sources?.[name] || []) {
+      projection[source] = 1;
+    }
+  }
+  return { projection };
+}
@@ -0,0 +1,223 @@
+import os from 'os';
+import { v4 as uuidv4 } from 'uuid';
+import { getCollection } from '@/lib/db';
+import { CONTRACT_STATES, isValidTransition } from '@/lib/lifecycle';
+import { applyBulkTransition } from '@/lib/transitions';
+import { increment, observe } from '@/lib/metrics';
+
+// Background lifecycle jobs (started from instrumentation.js).
+//
+// Each job moves contracts that have been in one status for longer than a
+// configured age to another status: signed contracts are locked after
+// SCHEDULER_AUTO_LOCK_DAYS, sent contracts are revoked after
+// SCHEDULER_SENT_EXPIRY_DAYS. A job is disabled while its setting is unset or 0.
+//
+// Candidates come from an indexed range query on (status, statusChangedAt)
+// and go through applyBulkTransition, so the lifecycle rules, concurrency
+// guards, contract_events and dashboard counters are the same as for the
+// bulk transition API. Batches are small and separated by a pause, so a large
+// backlog is worked off over several batches without starving API requests
+// of connections or event loop time.
+//
+// Only one instance runs jobs: the leader holds a lease document in
+// scheduler_leases and renews it between batches; other instances take over
+// once the lease has expired (SCHEDULER_LEASE_MS after the last renewal).
+
+function numberEnv(name, fallback) {
+  const value = Number.parseFloat(process.env[name] ?? '');
+  return Number.isFinite(value) ? value : fallback;
+}
+
+const ENABLED = process.env.SCHEDULER_ENABLED !== 'false';
+const INTERVAL_MS = numberEnv('SCHEDULER_INTERVAL_MS', 60000);
+const BATCH_SIZE = numberEnv('SCHEDULER_BATCH_SIZE', 500);
+const BATCH_PAUSE_MS = numberEnv('SCHEDULER_BATCH_PAUSE_MS', 50);
+const MAX_RUN_MS = numberEnv('SCHEDULER_MAX_RUN_MS', 50000);
+const LEASE_MS = numberEnv('SCHEDULER_LEASE_MS', 2 * INTERVAL_MS);
+const DAY_MS = 24 * 60 * 60 * 1000;
+const LEASE_ID = 'lifecycle-scheduler';
+
+export const SCHEDULED_JOBS = [
+  {
+    name: 'auto-lock',
+    fromStatus: CONTRACT_STATES.SIGNED,
+    toStatus: CONTRACT_STATES.LOCKED,
+    afterDays: numberEnv('SCHEDULER_AUTO_LOCK_DAYS', 0),
+    note: days => `Locked automatically ${days} day(s) after signing`
+  },
+  {
+    name: 'expire-sent',
+    fromStatus: CONTRACT_STATES.SENT,
+    toStatus: CONTRACT_STATES.REVOKED,
+    afterDays: numberEnv('SCHEDULER_SENT_EXPIRY_DAYS', 0),
+    note: days => `Revoked automatically: not signed within ${days} day(s)`
+  }
+].filter(job => isValidTransition(job.fromStatus, job.toStatus));
+
+if (!global._scheduler) {
+  global._scheduler = {
+    owner: `${os.hostname()}:${process.pid}:${uuidv4().slice(0, 8)}`,
+    timer: null,
+    running: null, // Promise of the tick in progress
+    leader: false,
+    leaseExpiresAt: null,
+    lastRuns: {} // job name -> summary of its last run
+  };
+}
+const state = global._scheduler;
+
+function enabledJobs() {
+  return SCHEDULED_JOBS.filter(job => job.afterDays > 0);
+}
+
+// Take or renew the lease; returns true while this instance is the leader
+async function acquireLease() {
+  const leases = await getCollection('scheduler_leases');
+  const now = new Date();
+  const expiresAt = new Date(now.getTime() + LEASE_MS);
+  try {
+    const lease = await leases.findOneAndUpdate(
+      { _id: LEASE_ID, $or: [{ expiresAt: { $lt: now } }, { owner: state.owner }] },
+      { $set: { owner: state.owner, expiresAt, renewedAt: now } },
+      { upsert: true, returnDocument: 'after' }
+    );
+    state.leader = lease?.owner === state.owner;
+  } catch (error) {
+    // The upsert raced with a live lease held by another instance
+    if (error.code !== 11000) throw error;
+    state.leader = false;
+  }
+  state.leaseExpiresAt = state.leader ? expiresAt.toISOString() : null;
+  return state.leader;
+}
+
+// Contracts that reached their status before statusChangedAt existed get it
+// from the tail of their history (indexed: { status, statusChangedAt: null })
+async function backfillStatusChangedAt(contracts, status) {
+  await contracts.updateMany(
+    { status, statusChangedAt: null },
+    [{
+      $set: {
+        statusChangedAt: { $ifNull: [{ $arrayElemAt: ['$statusHistory.timestamp', -1] }, '$updatedAt'] }
+      }
+    }]
+  );
+}
+
+const pause = ms => new Promise(resolve => setTimeout(resolve, ms));
+
+// Work off one job's backlog in batches until it is empty, the run budget is
+// spent or the lease is lost
+async function runJob(job, deadline) {
+  const contracts = await getCollection('contracts');
+  const started = process.hrtime.bigint();
+  const cutoff = new Date(Date.now() - job.afterDays * DAY_MS).toISOString();
+  const run = {
+    startedAt: new Date().toISOString(),
+    cutoff,
+    batches: 0,
+    processed: 0,
+    outcomes: { applied: 0, conflict: 0, rejected: 0, not_found: 0 },
+    complete: false
+  };
+
+  const eligible = { status: job.fromStatus, statusChangedAt: { $lte: cutoff } };
+
+  try {
+    await backfillStatusChangedAt(contracts, job.fromStatus);
+    while (true) {
+      const batch = await contracts
+        .find(eligible, { projection: { _id: 0, id: 1 } })
+        .sort({ statusChangedAt: 1 })
+        .limit(BATCH_SIZE)
+        .toArray();
+      if (batch.length === 0) {
+        run.complete = true;
+        break;
+      }
+
+      const { results } = await applyBulkTransition(batch.map(contract => contract.id), job.toStatus, {
+        note: job.note(job.afterDays)
+      });
+      run.batches += 1;
+      run.processed += results.length;
+      let applied = 0;
+      for (const { outcome } of results) {
+        run.outcomes[outcome] = (run.outcomes[outcome] || 0) + 1;
+        increment('scheduler_contracts_processed_total', { job: job.name, outcome });
+        if (outcome === 'applied') applied += 1;
+      }
+
+      if (batch.length < BATCH_SIZE) {
+        run.complete = true;
+        break;
+      }
+      // Nothing moved: stop instead of fetching the same candidates again
+      if (applied === 0) break;
+      if (Date.now() >= deadline || !(await acquireLease())) break;
+      await pause(BATCH_PAUSE_MS);
+    }
+    // Backlog left for the next tick
+    run.remaining = run.complete ? 0 : await contracts.countDocuments(eligible);
+  } catch (error) {
+    console.error(`Scheduler job ${job.name} failed:`, error);
+    run.error = error.message;
+  }
+
+  const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+  observe('scheduler_job_duration_seconds', { job: job.name }, seconds);
+  run.durationMs = Math.round(seconds * 1000);
+  state.lastRuns[job.name] = run;
+  return run;
+}
+
+// Run every enabled job once if this instance holds the lease. Concurrent
+// calls share the tick in progress. Returns the runs, or null when another
+// instance is the leader.
+export function runScheduledJobs() {
+  if (!state.running) {
+    state.running = (async () => {
+      if (!(await acquireLease())) return null;
+      const deadline = Date.now() + MAX_RUN_MS;
+      const runs = {};
+      for (const job of enabledJobs()) {
+        runs[job.name] = await runJob(job, deadline);
+      }
+      return runs;
+    })().finally(() => {
+      state.running = null;
+    });
+  }
+  return state.running;
+}
+
+// Start the periodic timer; a no-op when disabled or without enabled jobs
+export function startScheduler() {
+  if (!ENABLED || state.timer || enabledJobs().length === 0) return false;
+  const tick = () => runScheduledJobs().catch(error => console.error('Scheduler tick failed:', error));
+  state.timer = setInterval(tick, INTERVAL_MS);
+  state.timer.unref?.();
+  tick();
+  return true;
+}
+
+export function getSchedulerStatus() {
+  return {
+    enabled: ENABLED,
+    started: Boolean(state.timer),
+    owner: state.owner,
+    leader: state.leader,
+    leaseExpiresAt: state.leaseExpiresAt,
+    running: Boolean(state.running),
+    intervalMs: INTERVAL_MS,
+    batchSize: BATCH_SIZE,
+    jobs: SCHEDULED_JOBS.map(job => ({
+      name: job.name,
+      fromStatus: job.fromStatus,
+      toStatus: job.toStatus,
+      afterDays: job.afterDays,
+      enabled: job.afterDays > 0,
+      lastRun: state.lastRuns[job.name] || null
+    }))
+  };
+}
@@ -0,0 +1,139 @@
+// Field types, value coercion and validation of blueprint fields.
+//
+// A blueprint (head or version snapshot) is compiled once into a schema: an
+// id -> field index, the required field ids, the required signature field ids
+// used to guard signing, and per-field coercers. Schemas are cached in a
+// WeakMap keyed by the blueprint object, so they live exactly as long as the
+// shared documents of the blueprint and version caches they were built from;
+// edits produce new documents and therefore new schemas. Validating submitted
+// values only visits the submitted field ids.
+
+const isBlank = value => value === undefined || value === null || value === '';
+
+// Per field type: default value, coercion of a submitted value, and a check
+// returning an error message for values that cannot be coerced sensibly
+export const FIELD_TYPE_SPECS = {
+  text: {
+    empty: () => '',
+    coerce: value => (isBlank(value) ? '' : String(value)),
+    check: value =>
+      isBlank(value) || typeof value === 'string' || typeof value === 'number' ? null : 'must be text'
+  },
+  date: {
+    empty: () => null,
+    coerce: value => value || null,
+    check: value =>
+      isBlank(value) || (typeof value === 'string' && !Number.isNaN(Date.parse(value))) ? null : 'must be a date'
+  },
+  signature: {
+    empty: () => null,
+    coerce: value => value || null,
+    check: value => (isBlank(value) || typeof value === 'string' ? null : 'must be text')
+  },
+  checkbox: {
+    empty: () => false,
+    coerce: value => value === true || value === 'true',
+    check: value =>
+      isBlank(value) || typeof value === 'boolean' || value === 'true' || value === 'false'
+        ? null
+        : 'must be true or false'
+  }
+};
+
+function specFor(type) {
+  // Unknown types (never accepted by the blueprint routes) behave like text
+  return FIELD_TYPE_SPECS[type] || FIELD_TYPE_SPECS.text;
+}
+
+// Value of a field that has none yet
+export function defaultFieldValue(field) {
+  return specFor(field.type).empty();
+}
+
+// Validate the field definitions submitted to the blueprint routes. Returns a
+// list of { index, message } (empty when valid).
+export function validateBlueprintFields(fields) {
+  const errors = [];
+  fields.forEach((field, index) => {
+    if (!field || typeof field !== 'object') {
+      errors.push({ index, message: 'Field must be an object' });
+      return;
+    }
+    if (!field.type || !Object.hasOwn(FIELD_TYPE_SPECS, field.type)) {
+      errors.push({ index, message: `Invalid field type: ${field.type}` });
+    }
+    if (!field.label || typeof field.label !== 'string') {
+      errors.push({ index, message: 'Each field must have a label' });
+    }
+  });
+  return errors;
+}
+
+// Error response body for a non-empty list of field errors
+export function fieldErrorsBody(message, errors) {
+  return { error: errors.length === 1 ? errors[0].message : message, errors };
+}
+
+// Compile a blueprint into a schema without caching it (see getSchema)
+export function compileSchema(blueprint) {
+  const fields = blueprint.fields || [];
+  const byId = new Map(fields.map(field => [field.id, field]));
+  // Required fields are only enforced for signatures, when signing
+  const requiredIds = fields.filter(field => field.required).map(field => field.id);
+  const signatureIds = requiredIds.filter(fieldId => byId.get(fieldId).type === 'signature');
+
+  // Check and coerce submitted values; only visits the submitted ids.
+  // Returns { values, errors } with values keyed by field id.
+  function coerceSubmitted(fieldValues) {
+    const values = {};
+    const errors = [];
+    for (const [fieldId, value] of Object.entries(fieldValues || {})) {
+      const field = byId.get(fieldId);
+      if (!field) {
+        errors.push({ fieldId, message: `Unknown field: ${fieldId}` });
+        continue;
+      }
+      const spec = specFor(field.type);
+      const message = spec.check(value);
+      if (message) {
+        errors.push({ fieldId, label: field.label, message: `${field.label} ${message}` });
+        continue;
+      }
+      values[fieldId] = spec.coerce(value);
+    }
+    return { values, errors };
+  }
+
+  return {
+    fields,
+    byId,
+    requiredIds,
+    signatureIds,
+    coerceSubmitted,
+
+    // Values of a new contract: submitted values over the field defaults
+    initialValues(fieldValues) {
+      const { values, errors } = coerceSubmitted(fieldValues);
+      for (const field of fields) {
+        if (!Object.hasOwn(values, field.id)) values[field.id] = specFor(field.type).empty();
+      }
+      return { values, errors };
+    },
+
+    hasTextField(fieldIds) {
+      return fieldIds.some(fieldId => byId.get(fieldId)?.type === 'text');
+    }
+  };
+}
+
+const schemas = new WeakMap();
+
+// The compiled schema of a blueprint head or version snapshot (cached per object)
+export function getSchema(blueprint) {
+  let schema = schemas.get(blueprint);
+  if (!schema) {
+    schema = compileSchema(blueprint);
+    schemas.set(blueprint, schema);
+  }
+  return schema;
+}
@@ -0,0 +1,120 @@
+import { getCollection } from '@/lib/db';
+import { hydrateContracts } from '@/lib/blueprint-versions';
+
+// Contract search (?q= on GET /api/contracts).
+//
+// Every contract carries a maintained `search` subdocument:
+//   text   - values of its text fields, covered by the contract_text index
+//            together with name and blueprintName (used for ranking)
+//   tokens - lowercase words of name, blueprintName and text field values,
+//            covered by a multikey index (used for exact and prefix matching)
+// Every query word must match a token; the last word is matched as a prefix
+// so results update while the user is typing. Results are ranked by text
+// score when there are complete words, newest first otherwise.
+
+export const MAX_SEARCH_TOKENS = 100;
+const MAX_TOKEN_LENGTH = 64;
+
+// Offset pagination is used for ranked results; deeper pages are refused
+export const MAX_SEARCH_OFFSET = 10000;
+
+// Excludes the search subdocument from API responses
+export const HIDE_SEARCH_FIELDS = { search: 0 };
+
+export function tokenize(text) {
+  if (typeof text !== 'string') return [];
+  return text
+    .toLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean)
+    .map(token => token.slice(0, MAX_TOKEN_LENGTH));
+}
+
+// Build the search subdocument of a contract from its name and fields
+export function buildSearchFields({ name, blueprintName, fields }) {
+  const text = (fields || [])
+    .filter(field => field.type === 'text' && typeof field.value === 'string' && field.value.trim() !== '')
+    .map(field => field.value.trim())
+    .join(' ');
+  const tokens = [...new Set([...tokenize(name), ...tokenize(blueprintName), ...tokenize(text)])];
+  return { text, tokens: tokens.slice(0, MAX_SEARCH_TOKENS) };
+}
+
+function escapeRegex(value) {
+  return value.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
+// Turn ?q= into { filter, ranked }, or null when it contains no searchable words
+export function buildSearchQuery(q) {
+  const words = [...new Set(tokenize(q))];
+  if (words.length === 0) return null;
+
+  // A trailing space means the last word is complete
+  const prefix = /\s$/.test(q) ? null : words.pop();
+  const conditions = [];
+  if (words.length > 0) {
+    conditions.push({ 'search.tokens': { $all: words } });
+  }
+  if (prefix) {
+    conditions.push({ 'search.tokens': { $regex: `^${escapeRegex(prefix)}` } });
+  }
+
+  const filter = conditions.length === 1 ? conditions[0] : { $and: conditions };
+  if (words.length > 0) {
+    filter.$text = { $search: words.join(' ') };
+  }
+  return { filter, ranked: words.length > 0 };
+}
+
+export function encodeSearchCursor(offset) {
+  return Buffer.from(JSON.stringify(['offset', offset])).toString('base64url');
+}
+
+// Returns the offset or null if the cursor is malformed
+export function decodeSearchCursor(cursor) {
+  try {
+    const decoded = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+    if (!Array.isArray(decoded) || decoded[0] !== 'offset') return null;
+    const offset = decoded[1];
+    return Number.isInteger(offset) && offset >= 0 ? offset : null;
+  } catch {
+    return null;
+  }
+}
+
+// Backfill the search subdocument of contracts created before it existed
+export async function reindexContractSearch({ all = false } = {}) {
+  const contracts = await getCollection('contracts');
+  const filter = all ? {} : { search: { $exists: false } };
+  const cursor = contracts.find(filter, {
+    projection: {
+      _id: 0, id: 1, name: 1, blueprintName: 1, blueprintId: 1, blueprintVersion: 1, values: 1,
+      'fields.type': 1, 'fields.value': 1
+    }
+  });
+
+  let batch = [];
+  let contractsIndexed = 0;
+  const flush = async () => {
+    const hydrated = await hydrateContracts(batch);
+    await contracts.bulkWrite(
+      hydrated.map(contract => ({
+        updateOne: { filter: { id: contract.id }, update: { $set: { search: buildSearchFields(contract) } } }
+      })),
+      { ordered: false }
+    );
+    contractsIndexed += batch.length;
+    batch = [];
+  };
+
+  for await (const contract of cursor) {
+    batch.push(contract);
+    if (batch.length >= 1000) {
+      await flush();
+    }
+  }
+  if (batch.length > 0) {
+    await flush();
+  }
+  return { contractsIndexed };
+}
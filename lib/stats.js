@@ -0,0 +1,173 @@
+import { getCollection } from '@/lib/db';
+import { CONTRACT_STATES } from '@/lib/lifecycle';
+
+// Dashboard counters kept in a single `stats` document and updated with $inc
+// by every write path that changes a contract's status or the blueprint count.
+// A reconcile rebuilds the document from the live collections. Reads rebuild
+// inline only when the document is missing; once it is older than the
+// tolerance they serve it as is and start one background reconcile per process.
+//
+// Every $inc also bumps `version`; a reconcile only replaces the document if
+// the version it read before aggregating is unchanged, so increments landing
+// while it runs are never overwritten.
+
+const STATS_ID = 'dashboard';
+
+// How long counters may go without a reconcile before reads rebuild them (ms)
+export const STATS_MAX_STALENESS_MS = Number.parseInt(process.env.STATS_MAX_STALENESS_MS || '3600000', 10);
+
+function emptyByStatus() {
+  const byStatus = {};
+  Object.values(CONTRACT_STATES).forEach(status => {
+    byStatus[status] = 0;
+  });
+  return byStatus;
+}
+
+async function applyDelta(inc) {
+  try {
+    const stats = await getCollection('stats');
+    await stats.updateOne(
+      { _id: STATS_ID },
+      { $inc: { ...inc, version: 1 }, $set: { updatedAt: new Date().toISOString() } },
+      { upsert: true }
+    );
+  } catch (error) {
+    // Counters drift until the next reconcile; never fail the originating write
+    console.error('Error updating stats counters:', error);
+  }
+}
+
+export function recordContractsCreated(count = 1) {
+  return applyDelta({ [`byStatus.${CONTRACT_STATES.CREATED}`]: count });
+}
+
+export function recordContractDeleted(status) {
+  return applyDelta({ [`byStatus.${status}`]: -1 });
+}
+
+export function recordTransition(fromStatus, toStatus, count = 1) {
+  return applyDelta({
+    [`byStatus.${fromStatus}`]: -count,
+    [`byStatus.${toStatus}`]: count
+  });
+}
+
+export function recordBlueprintsChanged(delta) {
+  return applyDelta({ totalBlueprints: delta });
+}
+
+const RECONCILE_ATTEMPTS = 3;
+
+if (!global._statsReconcile) {
+  global._statsReconcile = { inFlight: null };
+}
+const reconcileState = global._statsReconcile;
+
+// Rebuild the counters from scratch with the live aggregate. Concurrent calls
+// in one process share a single rebuild.
+export function reconcileStats() {
+  if (!reconcileState.inFlight) {
+    reconcileState.inFlight = rebuildStats().finally(() => {
+      reconcileState.inFlight = null;
+    });
+  }
+  return reconcileState.inFlight;
+}
+
+async function rebuildStats() {
+  const stats = await getCollection('stats');
+  for (let attempt = 1; ; attempt++) {
+    const current = await stats.findOne({ _id: STATS_ID }, { projection: { version: 1 } });
+    const doc = await aggregateStats(current?.version || 0);
+    // Documents written before versioning have no version field
+    const filter = current?.version === undefined
+      ? { _id: STATS_ID, version: { $exists: false } }
+      : { _id: STATS_ID, version: current.version };
+    try {
+      const result = await stats.replaceOne(filter, doc, { upsert: !current });
+      if (result.matchedCount > 0 || result.upsertedCount > 0) return doc;
+    } catch (error) {
+      // Another writer created the document first
+      if (error?.code !== 11000) throw error;
+    }
+    if (attempt >= RECONCILE_ATTEMPTS) {
+      // Counters keep moving; leave them as they are and report the aggregate
+      return doc;
+    }
+  }
+}
+
+async function aggregateStats(version) {
+  const contracts = await getCollection('contracts');
+  const blueprints = await getCollection('blueprints');
+
+  const [contractStats, blueprintCount] = await Promise.all([
+    contracts.aggregate([
+      {
+        $group: {
+          _id: '$status',
+          count: { $sum: 1 }
+        }
+      }
+    ]).toArray(),
+    blueprints.countDocuments({})
+  ]);
+
+  const byStatus = emptyByStatus();
+  contractStats.forEach(stat => {
+    byStatus[stat._id] = stat.count;
+  });
+
+  const now = new Date().toISOString();
+  const doc = {
+    byStatus,
+    totalBlueprints: blueprintCount,
+    version: version + 1,
+    updatedAt: now,
+    reconciledAt: now
+  };
+  return doc;
+}
+
+// Point read of the counters document. A missing document (or maxStalenessMs
+// of 0) waits for a rebuild; a stale one is returned while a rebuild runs in
+// the background.
+export async function readStats({ maxStalenessMs = STATS_MAX_STALENESS_MS } = {}) {
+  const stats = await getCollection('stats');
+  const doc = await stats.findOne({ _id: STATS_ID });
+  if (!doc || maxStalenessMs === 0) {
+    return reconcileStats();
+  }
+
+  const reconciledAt = doc.reconciledAt ? Date.parse(doc.reconciledAt) : NaN;
+  if (Number.isNaN(reconciledAt) || Date.now() - reconciledAt > maxStalenessMs) {
+    reconcileStats().catch(error => {
+      console.error('Error reconciling stats in the background:', error);
+    });
+  }
+  return doc;
+}
+
+// Shape a counters document into the /api/stats response
+export function formatStats(doc) {
+  const statsByStatus = { ...emptyByStatus(), ...(doc.byStatus || {}) };
+  const totalContracts = Object.values(statsByStatus).reduce((a, b) => a + b, 0);
+
+  // Calculate category counts
+  const categories = {
+    active: statsByStatus[CONTRACT_STATES.SENT] || 0,
+    pending: (statsByStatus[CONTRACT_STATES.CREATED] || 0) + (statsByStatus[CONTRACT_STATES.APPROVED] || 0),
+    signed: (statsByStatus[CONTRACT_STATES.SIGNED] || 0) + (statsByStatus[CONTRACT_STATES.LOCKED] || 0),
+    revoked: statsByStatus[CONTRACT_STATES.REVOKED] || 0
+  };
+
+  return {
+    totalContracts,
+    totalBlueprints: doc.totalBlueprints || 0,
+    byStatus: statsByStatus,
+    byCategory: categories,
+    updatedAt: doc.updatedAt,
+    reconciledAt: doc.reconciledAt
+  };
+}
@@ -0,0 +1,277 @@
+import { getCollection } from '@/lib/db';
+import { CONTRACT_STATES } from '@/lib/lifecycle';
+
+// Throughput and time-in-state analytics over contract_events.
+//
+// Daily buckets are materialized in `stats_daily` (one document per UTC day)
+// and updated with $inc whenever events are recorded, so long day ranges are a
+// handful of point reads. Hourly buckets are aggregated live from
+// contract_events over the { timestamp, status } index and are limited to
+// MAX_HOUR_RANGE_MS. Time-in-state is kept per transition (previous status
+// and the status it moved to, so e.g. sent -> signed and sent -> revoked are
+// separate) as a log-scale histogram (four buckets per doubling, ~19% wide) so
+// daily rollups can be merged; medians are estimated from the merged
+// histogram. Per-status figures merge the transitions out of each status.
+// Deleting a contract's events subtracts them from the rollups again.
+
+export const BUCKETS = {
+  hour: { length: 13, stepMs: 3600 * 1000, defaultRangeMs: 48 * 3600 * 1000 },
+  day: { length: 10, stepMs: 24 * 3600 * 1000, defaultRangeMs: 30 * 24 * 3600 * 1000 }
+};
+
+export const MAX_HOUR_RANGE_MS = 31 * 24 * 3600 * 1000;
+export const MAX_DAY_RANGE_MS = 3660 * 24 * 3600 * 1000;
+
+const HISTOGRAM_STEPS_PER_DOUBLING = 4;
+
+// Aggregation equivalent of histogramKey's step number
+const HISTOGRAM_STEP_EXPR = {
+  $floor: {
+    $multiply: [HISTOGRAM_STEPS_PER_DOUBLING, { $log: [{ $max: ['$durationInPreviousMs', 1] }, 2] }]
+  }
+};
+
+const WITH_DURATION = { $match: { previousStatus: { $exists: true }, durationInPreviousMs: { $gte: 0 } } };
+
+function histogramKey(durationMs) {
+  return `b${Math.floor(HISTOGRAM_STEPS_PER_DOUBLING * Math.log2(Math.max(durationMs, 1)))}`;
+}
+
+// Geometric midpoint of a histogram bucket
+function histogramValue(key) {
+  return Math.round(2 ** ((Number(key.slice(1)) + 0.5) / HISTOGRAM_STEPS_PER_DOUBLING));
+}
+
+function emptyCounts() {
+  const counts = {};
+  Object.values(CONTRACT_STATES).forEach(status => {
+    counts[status] = 0;
+  });
+  return counts;
+}
+
+// Fold events into per-day $inc documents (sign -1 removes them again)
+function rollupDeltas(events, sign) {
+  const days = new Map();
+  for (const event of events) {
+    const day = event.timestamp.slice(0, BUCKETS.day.length);
+    const inc = days.get(day) || {};
+    inc[`transitions.${event.status}`] = (inc[`transitions.${event.status}`] || 0) + sign;
+    if (event.previousStatus && Number.isFinite(event.durationInPreviousMs)) {
+      const path = `timeInTransition.${event.previousStatus}.${event.status}.${histogramKey(event.durationInPreviousMs)}`;
+      inc[path] = (inc[path] || 0) + sign;
+    }
+    days.set(day, inc);
+  }
+  return days;
+}
+
+// Called for every batch of recorded contract events, and with sign -1 for
+// the events of deleted contracts
+export async function rollupEvents(events, sign = 1) {
+  if (events.length === 0) return;
+  try {
+    const daily = await getCollection('stats_daily');
+    const updatedAt = new Date().toISOString();
+    const operations = [...rollupDeltas(events, sign)].map(([day, inc]) => ({
+      updateOne: { filter: { _id: day }, update: { $inc: inc, $set: { updatedAt } }, upsert: true }
+    }));
+    await daily.bulkWrite(operations, { ordered: false });
+  } catch (error) {
+    // Rollups drift until the next rebuild; never fail the originating write
+    console.error('Error updating daily rollups:', error);
+  }
+}
+
+// Events between from (inclusive) and to (exclusive), as a $match stage
+function rangeMatch(from, to) {
+  return { $match: { timestamp: { $gte: from, $lt: to } } };
+}
+
+// Counts and duration histograms of [from, to) grouped by a timestamp prefix
+async function aggregateBuckets(from, to, length, options = {}) {
+  const events = await getCollection('contract_events');
+  const bucketExpr = { $substrCP: ['$timestamp', 0, length] };
+  const [counts, durations] = await Promise.all([
+    events.aggregate([
+      rangeMatch(from, to),
+      { $group: { _id: { bucket: bucketExpr, status: '$status' }, count: { $sum: 1 } } }
+    ], options).toArray(),
+    events.aggregate([
+      rangeMatch(from, to),
+      WITH_DURATION,
+      {
+        $group: {
+          _id: { bucket: bucketExpr, from: '$previousStatus', to: '$status', step: HISTOGRAM_STEP_EXPR },
+          count: { $sum: 1 }
+        }
+      }
+    ], options).toArray()
+  ]);
+
+  const buckets = new Map();
+  const bucketFor = label => {
+    if (!buckets.has(label)) buckets.set(label, { transitions: {}, timeInTransition: {} });
+    return buckets.get(label);
+  };
+  for (const { _id, count } of counts) {
+    bucketFor(_id.bucket).transitions[_id.status] = count;
+  }
+  for (const { _id, count } of durations) {
+    const byTarget = (bucketFor(_id.bucket).timeInTransition[_id.from] ||= {});
+    (byTarget[_id.to] ||= {})[`b${_id.step}`] = count;
+  }
+  return buckets;
+}
+
+// Parse an optional date/time parameter into an ISO timestamp; undefined if absent, null if invalid
+export function parseTimestampParam(value) {
+  if (value === null || value === '') return undefined;
+  const time = Date.parse(value);
+  return Number.isNaN(time) ? null : new Date(time).toISOString();
+}
+
+// Widen [from, to) to whole buckets (UTC hours or days)
+export function alignRange(bucket, from, to) {
+  const { length, stepMs } = BUCKETS[bucket];
+  const floor = timestamp => new Date(Date.parse(timestamp.slice(0, length) + (bucket === 'hour' ? ':00:00.000Z' : 'T00:00:00.000Z'))).toISOString();
+  const start = floor(from);
+  let end = floor(to);
+  if (end < to) end = new Date(Date.parse(end) + stepMs).toISOString();
+  return { from: start, to: end };
+}
+
+// Recompute the daily rollups of every UTC day touching [from, to) from contract_events
+export async function rebuildDailyRollups(from, to) {
+  const { from: start, to: end } = alignRange('day', from, to);
+
+  const buckets = await aggregateBuckets(start, end, BUCKETS.day.length, { allowDiskUse: true });
+  const daily = await getCollection('stats_daily');
+  const now = new Date().toISOString();
+
+  const operations = [...buckets].map(([day, doc]) => ({
+    replaceOne: { filter: { _id: day }, replacement: { ...doc, updatedAt: now }, upsert: true }
+  }));
+  operations.push({
+    deleteMany: {
+      filter: {
+        _id: { $gte: start.slice(0, BUCKETS.day.length), $lt: end.slice(0, BUCKETS.day.length), $nin: [...buckets.keys()] }
+      }
+    }
+  });
+  await daily.bulkWrite(operations, { ordered: false });
+
+  let eventsScanned = 0;
+  for (const doc of buckets.values()) {
+    eventsScanned += Object.values(doc.transitions).reduce((sum, count) => sum + count, 0);
+  }
+  return { from: start, to: end, daysRebuilt: buckets.size, eventsScanned };
+}
+
+function mergeHistogram(target, histogram) {
+  for (const [key, count] of Object.entries(histogram || {})) {
+    target[key] = (target[key] || 0) + count;
+  }
+}
+
+// { count, medianMs, p90Ms } estimated from a merged histogram
+function summarizeHistogram(histogram) {
+  const entries = Object.entries(histogram)
+    .map(([key, count]) => [Number(key.slice(1)), key, count])
+    .sort((a, b) => a[0] - b[0]);
+  const count = entries.reduce((sum, [, , n]) => sum + n, 0);
+  const quantile = q => {
+    let seen = 0;
+    for (const [, key, n] of entries) {
+      seen += n;
+      if (seen >= q * count) return histogramValue(key);
+    }
+    return null;
+  };
+  return { count, medianMs: count ? quantile(0.5) : null, p90Ms: count ? quantile(0.9) : null };
+}
+
+// Add a bucket's { from: { to: histogram } } to the merged per-transition
+// and per-status histograms
+function mergeTransitions(histograms, timeInTransition) {
+  for (const [from, byTarget] of Object.entries(timeInTransition || {})) {
+    for (const [to, histogram] of Object.entries(byTarget)) {
+      mergeHistogram((histograms.byState[from] ||= {}), histogram);
+      mergeHistogram(((histograms.byTransition[from] ||= {})[to] ||= {}), histogram);
+    }
+  }
+}
+
+function emptyHistograms() {
+  return { byState: {}, byTransition: {} };
+}
+
+function summarizeTimeInState({ byState, byTransition }) {
+  const timeInState = {};
+  for (const [status, histogram] of Object.entries(byState)) {
+    timeInState[status] = summarizeHistogram(histogram);
+  }
+  const timeInTransition = {};
+  for (const [from, byTarget] of Object.entries(byTransition)) {
+    timeInTransition[from] = {};
+    for (const [to, histogram] of Object.entries(byTarget)) {
+      timeInTransition[from][to] = summarizeHistogram(histogram);
+    }
+  }
+  return { timeInState, timeInTransition };
+}
+
+// All bucket labels in an aligned [from, to) so empty buckets are reported as zeros
+function bucketLabels(bucket, from, to) {
+  const { length, stepMs } = BUCKETS[bucket];
+  const labels = [];
+  for (let t = Date.parse(from); t < Date.parse(to); t += stepMs) {
+    labels.push(new Date(t).toISOString().slice(0, length));
+  }
+  return labels;
+}
+
+async function dailySeries(from, to) {
+  const daily = await getCollection('stats_daily');
+  const docs = await daily
+    .find({ _id: { $gte: from.slice(0, BUCKETS.day.length), $lt: to.slice(0, BUCKETS.day.length) } })
+    .toArray();
+  const countsByBucket = new Map();
+  const histograms = emptyHistograms();
+  for (const doc of docs) {
+    countsByBucket.set(doc._id, doc.transitions || {});
+    mergeTransitions(histograms, doc.timeInTransition);
+    // Rollups written before time-in-state was split by transition
+    for (const [status, histogram] of Object.entries(doc.timeInState || {})) {
+      mergeHistogram((histograms.byState[status] ||= {}), histogram);
+    }
+  }
+  return { countsByBucket, histograms };
+}
+
+async function hourlySeries(from, to) {
+  const buckets = await aggregateBuckets(from, to, BUCKETS.hour.length);
+  const countsByBucket = new Map();
+  const histograms = emptyHistograms();
+  for (const [hour, doc] of buckets) {
+    countsByBucket.set(hour, doc.transitions);
+    mergeTransitions(histograms, doc.timeInTransition);
+  }
+  return { countsByBucket, histograms };
+}
+
+// Throughput per bucket and time-in-state over [from, to) (ISO timestamps),
+// widened to whole buckets
+export async function readTimeseries(bucket, requestedFrom, requestedTo) {
+  const { from, to } = alignRange(bucket, requestedFrom, requestedTo);
+  const { countsByBucket, histograms } = bucket === 'day'
+    ? await dailySeries(from, to)
+    : await hourlySeries(from, to);
+
+  const series = bucketLabels(bucket, from, to).map(label => ({
+    bucket: label,
+    counts: { ...emptyCounts(), ...(countsByBucket.get(label) || {}) }
+  }));
+
+  return { bucket, from, to, series, ...summarizeTimeInState(histograms) };
+}
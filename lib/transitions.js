@@ -0,0 +1,199 @@
+import { getCollection } from '@/lib/db';
+import { isValidTransition, isImmutable, getValidNextStates, CONTRACT_STATES } from '@/lib/lifecycle';
+import { recordTransition } from '@/lib/stats';
+import {
+  appendHistoryStage,
+  buildContractEvent,
+  historyEntry,
+  recordContractEvents
+} from '@/lib/contract-events';
+import { getBlueprintVersions, hydrateContracts, versionKey } from '@/lib/blueprint-versions';
+import { getSchema } from '@/lib/schema';
+
+// Matches legacy contracts that still have a required signature field without a value
+const MISSING_SIGNATURE = {
+  $elemMatch: { type: 'signature', required: true, value: { $in: [null, ''] } }
+};
+
+// Projection with everything checkTransition needs (after hydration)
+export const TRANSITION_CHECK_PROJECTION = {
+  _id: 0,
+  id: 1,
+  blueprintId: 1,
+  blueprintVersion: 1,
+  status: 1,
+  values: 1,
+  'fields.type': 1,
+  'fields.label': 1,
+  'fields.required': 1,
+  'fields.value': 1,
+  // When the contract entered its current status, for time-in-state analytics
+  statusHistory: { $slice: -1 }
+};
+
+// Filter that only matches the contract while it is still in fromStatus
+// (and, for signing, while every required signature is filled in). Versioned
+// contracts only store values, so signing them needs the required signature
+// field ids of their blueprint version (getSchema(version).signatureIds); pass
+// null for legacy contracts.
+export function transitionFilter(id, fromStatus, newStatus, signatureFieldIds = null) {
+  const filter = { id, status: fromStatus };
+  if (newStatus === CONTRACT_STATES.SIGNED) {
+    if (signatureFieldIds) {
+      for (const fieldId of signatureFieldIds) {
+        filter[`values.${fieldId}`] = { $nin: [null, ''] };
+      }
+    } else {
+      filter.fields = { $not: MISSING_SIGNATURE };
+    }
+  }
+  return filter;
+}
+
+export function transitionEntry(fromStatus, newStatus, note, timestamp) {
+  return historyEntry(newStatus, fromStatus, note || `Status changed to ${newStatus}`, timestamp);
+}
+
+// Pipeline update: set the status and append the entry to the history tail.
+// The full history is written to contract_events by the caller.
+export function transitionUpdate(entry) {
+  return [
+    {
+      $set: {
+        status: entry.status,
+        // When the contract entered its status; scheduled jobs range over it
+        statusChangedAt: entry.timestamp,
+        updatedAt: entry.timestamp,
+        version: { $add: [{ $ifNull: ['$version', 0] }, 1] }
+      }
+    },
+    appendHistoryStage(entry)
+  ];
+}
+
+export function invalidTransitionMessage(currentStatus, newStatus) {
+  const validNextStates = getValidNextStates(currentStatus);
+  return `Invalid transition from ${currentStatus} to ${newStatus}. Valid transitions: ${validNextStates.join(', ') || 'none'}`;
+}
+
+// Check a contract against the lifecycle rules; returns an error message or null
+export function checkTransition(contract, newStatus) {
+  // Check if contract is already in a terminal state
+  if (isImmutable(contract.status)) {
+    return `Contract is ${contract.status} and cannot be modified`;
+  }
+
+  if (!isValidTransition(contract.status, newStatus)) {
+    return invalidTransitionMessage(contract.status, newStatus);
+  }
+
+  // For signing, check that all required signature fields have values
+  if (newStatus === CONTRACT_STATES.SIGNED) {
+    const unsignedFields = (contract.fields || []).filter(
+      f => f.type === 'signature' && f.required && !f.value
+    );
+    if (unsignedFields.length > 0) {
+      return `Cannot sign contract. Missing required signatures: ${unsignedFields.map(f => f.label).join(', ')}`;
+    }
+  }
+
+  return null;
+}
+
+// Required signature field ids of a versioned contract, null for legacy ones
+function signatureFieldIds(contract, versions) {
+  if (contract.blueprintVersion === undefined) return null;
+  const version = versions.get(versionKey(contract.blueprintId, contract.blueprintVersion));
+  return version ? getSchema(version).signatureIds : [];
+}
+
+// Apply one transition to many contracts with a single unordered bulkWrite.
+// Every update is guarded like the single-contract route, so a contract that
+// changes underneath us is reported as a conflict instead of being overwritten.
+// Returns per-contract results with outcome applied | conflict | rejected | not_found.
+export async function applyBulkTransition(ids, newStatus, { note } = {}) {
+  const contracts = await getCollection('contracts');
+  const existing = await hydrateContracts(
+    await contracts.find({ id: { $in: ids } }, { projection: TRANSITION_CHECK_PROJECTION }).toArray()
+  );
+  const byId = new Map(existing.map(contract => [contract.id, contract]));
+  // Signing guards use the compiled schemas of the versions (already cached by hydration)
+  const versions = newStatus === CONTRACT_STATES.SIGNED
+    ? await getBlueprintVersions(
+      existing
+        .filter(contract => contract.blueprintVersion !== undefined)
+        .map(contract => ({ blueprintId: contract.blueprintId, version: contract.blueprintVersion }))
+    )
+    : new Map();
+
+  const timestamp = new Date().toISOString();
+  const results = new Map();
+  const operations = [];
+  const attempted = [];
+
+  for (const id of ids) {
+    const contract = byId.get(id);
+    if (!contract) {
+      results.set(id, { id, outcome: 'not_found', error: 'Contract not found' });
+      continue;
+    }
+    const error = checkTransition(contract, newStatus);
+    if (error) {
+      results.set(id, { id, outcome: 'rejected', previousStatus: contract.status, error });
+      continue;
+    }
+    operations.push({
+      updateOne: {
+        filter: transitionFilter(id, contract.status, newStatus, signatureFieldIds(contract, versions)),
+        update: transitionUpdate(transitionEntry(contract.status, newStatus, note, timestamp))
+      }
+    });
+    attempted.push(contract);
+  }
+
+  if (operations.length > 0) {
+    const { modifiedCount } = await contracts.bulkWrite(operations, { ordered: false });
+
+    let appliedIds;
+    if (modifiedCount === operations.length) {
+      appliedIds = new Set(attempted.map(contract => contract.id));
+    } else {
+      // Some guards missed; find out which updates actually landed
+      const landed = await contracts
+        .find(
+          { id: { $in: attempted.map(contract => contract.id) }, status: newStatus, updatedAt: timestamp },
+          { projection: { _id: 0, id: 1 } }
+        )
+        .toArray();
+      appliedIds = new Set(landed.map(contract => contract.id));
+    }
+
+    const appliedBySource = {};
+    const events = [];
+    for (const contract of attempted) {
+      if (appliedIds.has(contract.id)) {
+        results.set(contract.id, { id: contract.id, outcome: 'applied', previousStatus: contract.status });
+        appliedBySource[contract.status] = (appliedBySource[contract.status] || 0) + 1;
+        events.push(buildContractEvent(
+          contract,
+          transitionEntry(contract.status, newStatus, note, timestamp),
+          contract.statusHistory?.[0]?.timestamp
+        ));
+      } else {
+        results.set(contract.id, {
+          id: contract.id,
+          outcome: 'conflict',
+          previousStatus: contract.status,
+          error: 'Contract status changed concurrently'
+        });
+      }
+    }
+
+    await recordContractEvents(events);
+    for (const [fromStatus, count] of Object.entries(appliedBySource)) {
+      await recordTransition(fromStatus, newStatus, count);
+    }
+  }
+
+  return { timestamp, results: ids.map(id => results.get(id)) };
+}
@@ -6,6 +6,8 @@ const nextConfig = {
   experimental: {
     // Remove if not using Server Components
     serverComponentsExternalPackages: ['mongodb'],
+    // Connect to MongoDB and build indexes at startup (instrumentation.js)
+    instrumentationHook: true,
   },
   webpack(config, { dev }) {
     if (dev) {
@@ -0,0 +1,26 @@
+"""
+Python client for the AgreementHub API.
+
+    from agreementhub_client import AgreementHubClient, AsyncAgreementHubClient
+
+Both flavours share one keep-alive connection pool per client, follow
+nextCursor pagination, retry 5xx responses of idempotent methods with
+backoff (never a 409 by default), and report every HTTP attempt to timing
+hooks.
+"""
+
+from .aio import AsyncAgreementHubClient
+from .client import NO_RETRY, AgreementHubClient, APIError, RetryPolicy
+from .models import Blueprint, Contract, Field, RequestTiming
+
+__all__ = [
+    "AgreementHubClient",
+    "AsyncAgreementHubClient",
+    "APIError",
+    "Blueprint",
+    "Contract",
+    "Field",
+    "NO_RETRY",
+    "RequestTiming",
+    "RetryPolicy",
+]
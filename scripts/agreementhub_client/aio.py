@@ -0,0 +1,133 @@
+"""
+asyncio flavour of the client.
+
+requests is the only HTTP library the project depends on, so coroutines run
+the synchronous client's calls on worker threads. All of them share that
+client's keep-alive connection pool, and a semaphore bounds how many
+requests are in flight, so `asyncio.gather` over many calls never opens more
+than `concurrency` connections.
+"""
+
+import asyncio
+
+from .client import DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT, AgreementHubClient, APIError
+from .models import Contract
+
+
+class AsyncAgreementHubClient:
+    """
+    async with AsyncAgreementHubClient("http://localhost:3001/api") as client:
+        contracts = await client.create_contracts(blueprint_id, pairs)
+        async for contract in client.iter_contracts(status="created"):
+            ...
+    """
+
+    def __init__(self, base_url, *, timeout=DEFAULT_TIMEOUT, concurrency=DEFAULT_CONCURRENCY,
+                 retry=None, hooks=None):
+        self.sync = AgreementHubClient(
+            base_url, timeout=timeout, concurrency=concurrency, retry=retry, hooks=hooks
+        )
+        self.concurrency = concurrency
+        self._slots = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.sync.close()
+
+    def add_hook(self, hook):
+        self.sync.add_hook(hook)
+
+    async def _run(self, function, *args, **kwargs):
+        async with self._slots:
+            return await asyncio.to_thread(function, *args, **kwargs)
+
+    # Same methods as AgreementHubClient, as coroutines
+
+    async def request(self, method, path, **kwargs):
+        return await self._run(self.sync.request, method, path, **kwargs)
+
+    async def call(self, method, path, **kwargs):
+        return await self._run(self.sync.call, method, path, **kwargs)
+
+    async def list_blueprints(self, fields=None):
+        return await self._run(self.sync.list_blueprints, fields)
+
+    async def get_blueprint(self, blueprint_id, version=None):
+        return await self._run(self.sync.get_blueprint, blueprint_id, version)
+
+    async def create_blueprint(self, name, fields, description=""):
+        return await self._run(self.sync.create_blueprint, name, fields, description)
+
+    async def update_blueprint(self, blueprint_id, **changes):
+        return await self._run(self.sync.update_blueprint, blueprint_id, **changes)
+
+    async def delete_blueprint(self, blueprint_id):
+        return await self._run(self.sync.delete_blueprint, blueprint_id)
+
+    async def get_contract(self, contract_id):
+        return await self._run(self.sync.get_contract, contract_id)
+
+    async def create_contract(self, blueprint_id, name, field_values=None):
+        return await self._run(self.sync.create_contract, blueprint_id, name, field_values)
+
+    async def bulk_create_contracts(self, blueprint_id, items):
+        return await self._run(self.sync.bulk_create_contracts, blueprint_id, list(items))
+
+    async def update_contract(self, contract_id, field_values, if_match=None):
+        return await self._run(self.sync.update_contract, contract_id, field_values, if_match)
+
+    async def delete_contract(self, contract_id):
+        return await self._run(self.sync.delete_contract, contract_id)
+
+    async def transition(self, contract_id, new_status, **kwargs):
+        return await self._run(self.sync.transition, contract_id, new_status, **kwargs)
+
+    async def bulk_transition(self, ids, new_status, note=None):
+        return await self._run(self.sync.bulk_transition, list(ids), new_status, note)
+
+    async def stats(self, max_staleness=None):
+        return await self._run(self.sync.stats, max_staleness)
+
+    # Pagination
+
+    async def iter_contract_pages(self, limit=100, **filters):
+        cursor = None
+        while True:
+            params = dict(filters, limit=limit)
+            if cursor:
+                params["cursor"] = cursor
+            page = await self.call("GET", "/contracts", params=params)
+            yield page
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
+
+    async def iter_contracts(self, limit=100, **filters):
+        async for page in self.iter_contract_pages(limit, **filters):
+            for contract in page["contracts"]:
+                yield Contract.from_json(contract)
+
+    # Fan-out
+
+    async def gather(self, coroutines):
+        """Await coroutines concurrently (bounded by the client's semaphore).
+
+        Returns results in input order; a failed call yields its exception instead.
+        """
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, (APIError, OSError)):
+                raise result
+        return results
+
+    async def create_contracts(self, blueprint_id, items):
+        """Create contracts from (name, field_values) pairs concurrently."""
+        return await self.gather(self.create_contract(blueprint_id, name, values) for name, values in items)
+
+    async def transition_contracts(self, ids, new_status, **kwargs):
+        return await self.gather(self.transition(i, new_status, **kwargs) for i in ids)
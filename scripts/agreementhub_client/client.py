@@ -0,0 +1,315 @@
+"""
+Synchronous AgreementHub API client.
+
+One client holds one requests.Session whose connection pool is sized for
+the client's concurrency, so sequential calls and the fan-out helpers reuse
+keep-alive connections instead of opening one per request.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .models import Blueprint, Contract, RequestTiming
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_CONCURRENCY = 8
+# Methods safe to repeat after a server error
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+SERVER_ERRORS = frozenset({500, 502, 503, 504})
+
+
+class APIError(Exception):
+    """A response with an unexpected status; `body` is the decoded error payload."""
+
+    def __init__(self, method, path, status, body):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.body = body
+        message = body.get("error") if isinstance(body, dict) else body
+        super().__init__(f"{method} {path} -> {status}: {message}")
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter on 5xx and connection errors (idempotent methods only).
+
+    409 is not retried by default. The server answers it when a guarded write
+    lost a race: the status changed under a transition, or another edit won a
+    blueprint's version compare-and-swap. Sending the same body again either
+    fails the same way or overwrites the other writer's change. Set
+    on_conflict=True only for calls whose retry is safe by construction.
+    """
+
+    __slots__ = ("attempts", "backoff", "max_backoff", "on_conflict", "on_server_error")
+
+    def __init__(self, attempts=3, backoff=0.1, max_backoff=2.0, on_conflict=False, on_server_error=True):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.on_conflict = on_conflict
+        self.on_server_error = on_server_error
+
+    def should_retry(self, method, status, attempt):
+        if attempt >= self.attempts:
+            return False
+        if status == 409:
+            return self.on_conflict
+        if status is None or status in SERVER_ERRORS:
+            return self.on_server_error and method in IDEMPOTENT_METHODS
+        return False
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+NO_RETRY = RetryPolicy(attempts=1)
+
+
+def _decode(response):
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+class AgreementHubClient:
+    """
+    client = AgreementHubClient("http://localhost:3001/api")
+    blueprint = client.create_blueprint("NDA", [{"type": "text", "label": "Party"}])
+    contract = client.create_contract(blueprint.id, "NDA - Acme")
+    client.transition(contract.id, "approved")
+    for contract in client.iter_contracts(status="approved"):
+        ...
+    """
+
+    def __init__(self, base_url, *, timeout=DEFAULT_TIMEOUT, concurrency=DEFAULT_CONCURRENCY,
+                 retry=None, hooks=None, session=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.retry = retry or RetryPolicy()
+        self.hooks = list(hooks or [])
+        self.session = session or requests.Session()
+        if session is None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_hook(self, hook):
+        """Call hook(RequestTiming) after every HTTP attempt."""
+        self.hooks.append(hook)
+
+    # Raw requests
+
+    def request(self, method, path, *, params=None, json=None, headers=None, retry=None, timeout=None):
+        """Send a request (with retries) and return the last requests.Response."""
+        method = method.upper()
+        retry = retry or self.retry
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, url, params=params, json=json, headers=headers, timeout=timeout or self.timeout
+                )
+            except requests.ConnectionError as e:
+                self._emit(RequestTiming(method, path, None, self._ms(started), attempt, error=e))
+                if not retry.should_retry(method, None, attempt):
+                    raise
+                time.sleep(retry.delay(attempt))
+                continue
+            self._emit(RequestTiming(method, path, response.status_code, self._ms(started), attempt))
+            if not retry.should_retry(method, response.status_code, attempt):
+                return response
+            time.sleep(retry.delay(attempt))
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def call(self, method, path, *, expect=(200,), **kwargs):
+        """Send a request and return its decoded body; raises APIError on other statuses."""
+        response = self.request(method, path, **kwargs)
+        if response.status_code not in expect:
+            raise APIError(method.upper(), path, response.status_code, _decode(response))
+        return response.json()
+
+    @staticmethod
+    def _ms(started):
+        return (time.perf_counter() - started) * 1000
+
+    def _emit(self, timing):
+        for hook in self.hooks:
+            hook(timing)
+
+    # Blueprints
+
+    def list_blueprints(self, fields=None):
+        params = {"fields": fields} if fields else None
+        return [Blueprint.from_json(b) for b in self.call("GET", "/blueprints", params=params)]
+
+    def get_blueprint(self, blueprint_id, version=None):
+        params = {"version": version} if version is not None else None
+        return Blueprint.from_json(self.call("GET", f"/blueprints/{blueprint_id}", params=params))
+
+    def create_blueprint(self, name, fields, description=""):
+        payload = {"name": name, "description": description, "fields": _field_payload(fields)}
+        return Blueprint.from_json(self.call("POST", "/blueprints", json=payload, expect=(201,)))
+
+    def update_blueprint(self, blueprint_id, *, name=None, description=None, fields=None):
+        payload = {}
+        if name is not None:
+            payload["name"] = name
+        if description is not None:
+            payload["description"] = description
+        if fields is not None:
+            payload["fields"] = _field_payload(fields)
+        return Blueprint.from_json(self.call("PUT", f"/blueprints/{blueprint_id}", json=payload))
+
+    def delete_blueprint(self, blueprint_id):
+        self.call("DELETE", f"/blueprints/{blueprint_id}")
+
+    # Contracts
+
+    def get_contract(self, contract_id):
+        response = self.request("GET", f"/contracts/{contract_id}")
+        if response.status_code != 200:
+            raise APIError("GET", f"/contracts/{contract_id}", response.status_code, _decode(response))
+        return Contract.from_json(response.json(), etag=response.headers.get("ETag"))
+
+    def create_contract(self, blueprint_id, name, field_values=None):
+        payload = {"blueprintId": blueprint_id, "name": name, "fieldValues": field_values or {}}
+        return Contract.from_json(self.call("POST", "/contracts", json=payload, expect=(201,)))
+
+    def bulk_create_contracts(self, blueprint_id, items):
+        """POST /contracts/bulk; items are {"name", "fieldValues"} dicts. Returns the raw result."""
+        return self.call(
+            "POST", "/contracts/bulk", json={"blueprintId": blueprint_id, "contracts": list(items)},
+            expect=(201, 207),
+        )
+
+    def update_contract(self, contract_id, field_values, if_match=None):
+        """Update the submitted field values; with if_match (an ETag) a concurrent edit raises a 412."""
+        headers = {"If-Match": if_match} if if_match else None
+        # A conditional write must not be repeated blindly
+        retry = NO_RETRY if if_match else None
+        response = self.request(
+            "PUT", f"/contracts/{contract_id}", json={"fieldValues": field_values}, headers=headers, retry=retry
+        )
+        if response.status_code != 200:
+            raise APIError("PUT", f"/contracts/{contract_id}", response.status_code, _decode(response))
+        return Contract.from_json(response.json(), etag=response.headers.get("ETag"))
+
+    def delete_contract(self, contract_id):
+        self.call("DELETE", f"/contracts/{contract_id}")
+
+    def transition(self, contract_id, new_status, *, expected_status=None, note=None, retry=None):
+        payload = {"newStatus": new_status}
+        if expected_status is not None:
+            payload["expectedStatus"] = expected_status
+        if note is not None:
+            payload["note"] = note
+        return Contract.from_json(
+            self.call("POST", f"/contracts/{contract_id}/transition", json=payload, retry=retry)
+        )
+
+    def bulk_transition(self, ids, new_status, note=None):
+        """POST /contracts/transition/bulk; returns {applied, failed, results}."""
+        payload = {"ids": list(ids), "newStatus": new_status}
+        if note is not None:
+            payload["note"] = note
+        return self.call("POST", "/contracts/transition/bulk", json=payload)
+
+    # Pagination
+
+    def iter_contract_pages(self, limit=100, **filters):
+        """Yield each page (the decoded body) of GET /contracts, following nextCursor."""
+        cursor = None
+        while True:
+            params = dict(filters, limit=limit)
+            if cursor:
+                params["cursor"] = cursor
+            page = self.call("GET", "/contracts", params=params)
+            yield page
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
+
+    def iter_contracts(self, limit=100, **filters):
+        """Yield every contract matching the filters (status, category, blueprintId, q, fields)."""
+        for page in self.iter_contract_pages(limit, **filters):
+            for contract in page["contracts"]:
+                yield Contract.from_json(contract)
+
+    def iter_history(self, contract_id, limit=100):
+        """Yield the lifecycle events of a contract, oldest first."""
+        cursor = None
+        while True:
+            params = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
+            page = self.call("GET", f"/contracts/{contract_id}/history", params=params)
+            yield from page["events"]
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return
+
+    # Stats
+
+    def stats(self, max_staleness=None):
+        params = {"maxStaleness": max_staleness} if max_staleness is not None else None
+        return self.call("GET", "/stats", params=params)
+
+    # Fan-out
+
+    def map_concurrent(self, function, items, concurrency=None):
+        """Apply function to every item on at most `concurrency` threads sharing the pool.
+
+        Returns results in input order; a failed item yields its exception instead.
+        """
+        def guarded(item):
+            try:
+                return function(item)
+            except (APIError, requests.RequestException) as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=concurrency or self.concurrency) as pool:
+            return list(pool.map(guarded, items))
+
+    def create_contracts(self, blueprint_id, items, concurrency=None):
+        """Create contracts from (name, field_values) pairs concurrently."""
+        return self.map_concurrent(
+            lambda item: self.create_contract(blueprint_id, item[0], item[1]), items, concurrency
+        )
+
+    def transition_contracts(self, ids, new_status, concurrency=None, **kwargs):
+        """Transition contracts one request each, concurrently (see bulk_transition for one request)."""
+        return self.map_concurrent(lambda i: self.transition(i, new_status, **kwargs), ids, concurrency)
+
+
+def _field_payload(fields):
+    return [f.to_json() if hasattr(f, "to_json") else f for f in fields]
@@ -0,0 +1,150 @@
+"""
+Typed views of API responses.
+
+Models use __slots__ so that large result sets (pagination walks, fan-out
+creates) stay compact. Attributes missing from a response (e.g. lists
+requested with ?fields=summary) are None; `raw` keeps the decoded JSON.
+"""
+
+
+class Field:
+    __slots__ = ("id", "type", "label", "required", "position", "value")
+
+    def __init__(self, id, type, label=None, required=False, position=None, value=None):
+        self.id = id
+        self.type = type
+        self.label = label
+        self.required = required
+        self.position = position
+        self.value = value
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            data.get("id"),
+            data.get("type"),
+            label=data.get("label"),
+            required=data.get("required", False),
+            position=data.get("position"),
+            value=data.get("value"),
+        )
+
+    def to_json(self):
+        data = {"type": self.type, "label": self.label, "required": self.required}
+        if self.id is not None:
+            data["id"] = self.id
+        if self.position is not None:
+            data["position"] = self.position
+        return data
+
+    def __repr__(self):
+        return f"Field(id={self.id!r}, type={self.type!r}, label={self.label!r})"
+
+
+class Blueprint:
+    __slots__ = ("id", "name", "description", "version", "fields", "created_at", "updated_at", "raw")
+
+    def __init__(self, id, name, description="", version=None, fields=None, created_at=None,
+                 updated_at=None, raw=None):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.version = version
+        self.fields = fields
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.raw = raw
+
+    @classmethod
+    def from_json(cls, data):
+        fields = data.get("fields")
+        return cls(
+            data["id"],
+            data.get("name"),
+            description=data.get("description", ""),
+            version=data.get("version"),
+            fields=[Field.from_json(f) for f in fields] if fields is not None else None,
+            created_at=data.get("createdAt"),
+            updated_at=data.get("updatedAt"),
+            raw=data,
+        )
+
+    def field(self, label):
+        """The first field with this label, or None."""
+        return next((f for f in self.fields or [] if f.label == label), None)
+
+    def __repr__(self):
+        return f"Blueprint(id={self.id!r}, name={self.name!r}, version={self.version!r})"
+
+
+class Contract:
+    __slots__ = (
+        "id", "name", "status", "blueprint_id", "blueprint_version", "blueprint_name", "fields",
+        "status_history", "history_count", "version", "created_at", "updated_at", "etag", "raw",
+    )
+
+    def __init__(self, id, name=None, status=None, blueprint_id=None, blueprint_version=None,
+                 blueprint_name=None, fields=None, status_history=None, history_count=None,
+                 version=None, created_at=None, updated_at=None, etag=None, raw=None):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.blueprint_id = blueprint_id
+        self.blueprint_version = blueprint_version
+        self.blueprint_name = blueprint_name
+        self.fields = fields
+        self.status_history = status_history
+        self.history_count = history_count
+        self.version = version
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.etag = etag
+        self.raw = raw
+
+    @classmethod
+    def from_json(cls, data, etag=None):
+        fields = data.get("fields")
+        return cls(
+            data["id"],
+            name=data.get("name"),
+            status=data.get("status"),
+            blueprint_id=data.get("blueprintId"),
+            blueprint_version=data.get("blueprintVersion"),
+            blueprint_name=data.get("blueprintName"),
+            fields=[Field.from_json(f) for f in fields] if isinstance(fields, list) else None,
+            status_history=data.get("statusHistory"),
+            history_count=data.get("historyCount"),
+            version=data.get("version"),
+            created_at=data.get("createdAt"),
+            updated_at=data.get("updatedAt"),
+            etag=etag,
+            raw=data,
+        )
+
+    @property
+    def values(self):
+        """Field values by field id."""
+        return {f.id: f.value for f in self.fields or []}
+
+    def __repr__(self):
+        return f"Contract(id={self.id!r}, name={self.name!r}, status={self.status!r})"
+
+
+class RequestTiming:
+    """Passed to timing hooks once per HTTP attempt."""
+
+    __slots__ = ("method", "path", "status", "elapsed_ms", "attempt", "error")
+
+    def __init__(self, method, path, status, elapsed_ms, attempt, error=None):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.elapsed_ms = elapsed_ms
+        self.attempt = attempt
+        self.error = error
+
+    def __repr__(self):
+        return (
+            f"RequestTiming({self.method} {self.path} -> {self.status}, "
+            f"{self.elapsed_ms:.1f}ms, attempt {self.attempt})"
+        )
@@ -0,0 +1,136 @@
+"""
+Cold-start probe for AgreementHub.
+
+Starts the server process, then measures how long it takes until it accepts
+connections and until the first GET /contracts?limit=1 succeeds, and how slow
+that first request is compared with warm ones. Run it against a production
+build with different pool settings to see what eager warm-up buys.
+
+Usage (via the backend test entry point; the server must not be running):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py cold-start --command "yarn start -p 3001"
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py cold-start --runs 5 --env MONGO_MIN_POOL_SIZE=10
+"""
+
+import os
+import shlex
+import signal
+import subprocess
+import time
+
+import requests
+
+from load_test import percentile
+
+PROBE_PATH = "/contracts?limit=1"
+POLL_INTERVAL = 0.05
+WARM_REQUESTS = 20
+
+
+def start_server(command, env):
+    return subprocess.Popen(
+        shlex.split(command),
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def stop_server(process):
+    if process.poll() is not None:
+        return
+    os.killpg(process.pid, signal.SIGTERM)
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def measure_cold_start(base_url, command, env, timeout):
+    """Spawn the server and time its first successful response."""
+    session = requests.Session()
+    process = start_server(command, env)
+    spawned = time.perf_counter()
+    listening_at = None
+    try:
+        while True:
+            elapsed = time.perf_counter() - spawned
+            if elapsed > timeout:
+                raise RuntimeError(f"no successful response within {timeout}s")
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with code {process.returncode}")
+            started = time.perf_counter()
+            try:
+                response = session.get(f"{base_url}{PROBE_PATH}", timeout=timeout)
+            except requests.ConnectionError:
+                time.sleep(POLL_INTERVAL)
+                continue
+            if listening_at is None:
+                listening_at = started - spawned
+            if response.status_code == 200:
+                first_ms = (time.perf_counter() - started) * 1000
+                ready_s = time.perf_counter() - spawned
+                break
+            time.sleep(POLL_INTERVAL)
+
+        warm = []
+        for _ in range(WARM_REQUESTS):
+            started = time.perf_counter()
+            session.get(f"{base_url}{PROBE_PATH}").raise_for_status()
+            warm.append((time.perf_counter() - started) * 1000)
+        warm.sort()
+
+        health = session.get(f"{base_url}/health")
+        pool = health.json().get("mongo", {}).get("pool") if health.ok else None
+        return {
+            "listeningSeconds": listening_at,
+            "firstSuccessSeconds": ready_s,
+            "firstRequestMs": first_ms,
+            "warmP50Ms": percentile(warm, 50),
+            "pool": pool,
+        }
+    finally:
+        stop_server(process)
+
+
+def add_arguments(parser):
+    # dest must not clash with the subcommand name stored in args.command
+    parser.add_argument(
+        "--command", dest="server_command", default="yarn start -p 3001", help="command that starts the server"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="cold starts to measure")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds to wait for each start")
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="extra environment for the server, e.g. MONGO_MIN_POOL_SIZE=10 (repeatable)",
+    )
+
+
+def run(base_url, args):
+    env = dict(item.split("=", 1) for item in args.env)
+    print("🧊 Cold-start probe")
+    print(f"📍 Base URL: {base_url}")
+    print(f"▶️  Command: {args.server_command}" + (f" ({', '.join(args.env)})" if args.env else ""))
+    print(f"\n{'RUN':<6}{'LISTEN s':>10}{'FIRST OK s':>12}{'FIRST ms':>10}{'WARM P50 ms':>13}  POOL (open/inUse)")
+    results = []
+    for run_index in range(1, args.runs + 1):
+        try:
+            result = measure_cold_start(base_url, args.server_command, env, args.timeout)
+        except RuntimeError as e:
+            print(f"{run_index:<6}❌ {e}")
+            return False
+        results.append(result)
+        pool = result["pool"]
+        pool_text = f"{pool['open']}/{pool['inUse']}" if pool else "-"
+        print(
+            f"{run_index:<6}{result['listeningSeconds']:>10.2f}{result['firstSuccessSeconds']:>12.2f}"
+            f"{result['firstRequestMs']:>10.1f}{result['warmP50Ms']:>13.1f}  {pool_text}"
+        )
+    if results:
+        firsts = sorted(r["firstSuccessSeconds"] for r in results)
+        print(f"\nMedian time to first successful response: {percentile(firsts, 50):.2f}s")
+    return True
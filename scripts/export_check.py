@@ -0,0 +1,158 @@
+"""
+Streaming consumer for GET /contracts/export.
+
+Reads the export incrementally (never holding it in memory), counts rows,
+compares the count with the live dashboard totals and samples the server's
+RSS from GET /health while the export runs, so memory growth with dataset
+size shows up.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py export --format csv
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py export --format ndjson --category signed
+"""
+
+import csv
+import io
+import json
+import threading
+import time
+
+import requests
+
+RSS_SAMPLE_INTERVAL = 0.1
+
+
+class RssSampler(threading.Thread):
+    """Polls the server's resident set size until stopped."""
+
+    def __init__(self, base_url):
+        super().__init__(daemon=True)
+        self.url = f"{base_url}/health"
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def sample(self, session):
+        try:
+            response = session.get(self.url, timeout=5)
+            if response.ok:
+                self.samples.append(response.json()["memory"]["rssBytes"])
+        except (requests.RequestException, ValueError, KeyError):
+            pass
+
+    def run(self):
+        session = requests.Session()
+        while not self._stop_event.is_set():
+            self.sample(session)
+            self._stop_event.wait(RSS_SAMPLE_INTERVAL)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def expected_rows(base_url, status=None, category=None):
+    """Matching contract count from the live stats aggregate."""
+    stats = requests.get(f"{base_url}/stats", params={"maxStaleness": 0}, timeout=60).json()
+    if status:
+        return stats["byStatus"].get(status, 0)
+    if category:
+        return stats["byCategory"].get(category, 0)
+    return stats["totalContracts"]
+
+
+class _ChunkReader(io.RawIOBase):
+    """Minimal file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(target), len(self._buffer))
+        target[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def count_rows(response, export_format):
+    """Count exported rows while streaming; returns (rows, bytes)."""
+    counter = {"bytes": 0}
+
+    def chunks():
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            counter["bytes"] += len(chunk)
+            yield chunk
+
+    raw = _ChunkReader(chunks())
+    text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    rows = 0
+    if export_format == "csv":
+        reader = csv.reader(text)
+        next(reader, None)  # header
+        for _ in reader:
+            rows += 1
+    else:
+        for line in text:
+            if line.strip():
+                json.loads(line)
+                rows += 1
+    return rows, counter["bytes"]
+
+
+def add_arguments(parser):
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson", help="export format")
+    parser.add_argument("--status", help="export only this status")
+    parser.add_argument("--category", help="export only this dashboard category")
+    parser.add_argument("--blueprint-id", help="export only contracts of this blueprint (count not checked)")
+    parser.add_argument(
+        "--max-rss-growth-mb", type=float, default=100, help="fail if server RSS grows more than this"
+    )
+
+
+def run(base_url, args):
+    params = {"format": args.format}
+    if args.status:
+        params["status"] = args.status
+    if args.category:
+        params["category"] = args.category
+    if args.blueprint_id:
+        params["blueprintId"] = args.blueprint_id
+    expected = None if args.blueprint_id else expected_rows(base_url, args.status, args.category)
+
+    print(f"📦 Streaming /contracts/export ({', '.join(f'{k}={v}' for k, v in params.items())})")
+    sampler = RssSampler(base_url)
+    sampler.sample(requests.Session())
+    baseline = sampler.samples[0] if sampler.samples else None
+    sampler.start()
+    started = time.perf_counter()
+    try:
+        with requests.get(f"{base_url}/contracts/export", params=params, stream=True, timeout=(5, 300)) as response:
+            response.raise_for_status()
+            rows, size = count_rows(response, args.format)
+    finally:
+        sampler.stop()
+    seconds = time.perf_counter() - started
+
+    print(f"  rows:    {rows}" + (f" (expected {expected})" if expected is not None else ""))
+    print(f"  bytes:   {size / 1e6:.1f} MB in {seconds:.1f}s ({rows / seconds if seconds else 0:.0f} rows/s)")
+    ok = expected is None or rows == expected
+    if baseline is not None and sampler.samples:
+        peak = max(sampler.samples)
+        growth_mb = (peak - baseline) / 1e6
+        print(
+            f"  server RSS: {baseline / 1e6:.0f} MB before, peak {peak / 1e6:.0f} MB "
+            f"(+{growth_mb:.0f} MB, {len(sampler.samples)} samples)"
+        )
+        ok = ok and growth_mb <= args.max_rss_growth_mb
+    else:
+        print("  server RSS: unavailable (GET /health did not answer)")
+    print("✅ Export check passed" if ok else "❌ Export check failed")
+    return ok
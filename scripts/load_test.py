@@ -0,0 +1,374 @@
+"""
+Concurrent load generator for AgreementHub.
+
+Replays the blueprint -> contract -> transition scenario from many virtual
+users (one thread and one keep-alive session each) and reports per-endpoint
+p50/p95/p99 latency, throughput and error rate. GET /metrics is scraped
+before and after the run to split each route's server time into MongoDB and
+handler time. A machine-readable JSON summary is written so runs can be
+compared between releases.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py load --users 20 --duration 60
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py load --users 50 --requests 5000 --output load.json
+"""
+
+import json
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+LOAD_BLUEPRINT = {
+    "name": "Load Test Template",
+    "description": "Created by the load generator",
+    "fields": [
+        {"type": "text", "label": "Counterparty", "required": True},
+        {"type": "date", "label": "Effective Date", "required": True},
+        {"type": "signature", "label": "Counterparty Signature", "required": True},
+        {"type": "checkbox", "label": "Accepts Terms", "required": False},
+    ],
+}
+
+LIFECYCLE = ["approved", "sent", "signed", "locked"]
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def field_values_for(blueprint, suffix):
+    values = {}
+    for field in blueprint["fields"]:
+        if field["type"] == "text":
+            values[field["id"]] = f"Counterparty {suffix}"
+        elif field["type"] == "date":
+            values[field["id"]] = "2024-01-15"
+        elif field["type"] == "checkbox":
+            values[field["id"]] = True
+        elif field["type"] == "signature":
+            values[field["id"]] = f"Signed {suffix}"
+    return values
+
+
+class LatencyRecorder:
+    """Thread-safe per-endpoint latency, error and byte counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    def record(self, endpoint, elapsed_ms, ok, size):
+        with self._lock:
+            bucket = self.samples.setdefault(
+                endpoint, {"latencies": [], "errors": 0, "bytes": 0}
+            )
+            bucket["latencies"].append(elapsed_ms)
+            bucket["bytes"] += size
+            if not ok:
+                bucket["errors"] += 1
+
+    def total_requests(self):
+        with self._lock:
+            return sum(len(b["latencies"]) for b in self.samples.values())
+
+    def summarize(self, wall_seconds):
+        endpoints = {}
+        total = 0
+        total_errors = 0
+        with self._lock:
+            for endpoint, bucket in sorted(self.samples.items()):
+                latencies = sorted(bucket["latencies"])
+                count = len(latencies)
+                total += count
+                total_errors += bucket["errors"]
+                endpoints[endpoint] = {
+                    "count": count,
+                    "errors": bucket["errors"],
+                    "errorRate": bucket["errors"] / count if count else 0.0,
+                    "throughputRps": count / wall_seconds if wall_seconds else 0.0,
+                    "bytes": bucket["bytes"],
+                    "latencyMs": {
+                        "p50": percentile(latencies, 50),
+                        "p95": percentile(latencies, 95),
+                        "p99": percentile(latencies, 99),
+                        "mean": sum(latencies) / count if count else 0.0,
+                        "max": latencies[-1] if latencies else 0.0,
+                    },
+                }
+        return {
+            "totalRequests": total,
+            "totalErrors": total_errors,
+            "errorRate": total_errors / total if total else 0.0,
+            "throughputRps": total / wall_seconds if wall_seconds else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+class LoadGenerator:
+    def __init__(self, base_url, users=10, duration=None, max_requests=None, timeout=30):
+        if duration is None and max_requests is None:
+            duration = 30
+        self.base_url = base_url
+        self.users = users
+        self.duration = duration
+        self.max_requests = max_requests
+        self.timeout = timeout
+        self.recorder = LatencyRecorder()
+        self._deadline = None
+
+    def _should_stop(self):
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return True
+        if self.max_requests is not None and self.recorder.total_requests() >= self.max_requests:
+            return True
+        return False
+
+    def _call(self, session, method, endpoint, path, payload=None):
+        start = time.perf_counter()
+        try:
+            response = session.request(
+                method, f"{self.base_url}{path}", json=payload, timeout=self.timeout
+            )
+        except requests.RequestException:
+            self.recorder.record(endpoint, (time.perf_counter() - start) * 1000, False, 0)
+            return None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.recorder.record(endpoint, elapsed_ms, response.ok, len(response.content))
+        return response
+
+    def _virtual_user(self, user_index):
+        session = requests.Session()
+        session.headers.update(
+            {"Content-Type": "application/json", "Accept": "application/json"}
+        )
+        response = self._call(
+            session, "POST", "POST /blueprints", "/blueprints", LOAD_BLUEPRINT
+        )
+        if response is None or response.status_code != 201:
+            return
+        blueprint = response.json()
+
+        iteration = 0
+        while not self._should_stop():
+            iteration += 1
+            suffix = f"u{user_index}-{iteration}"
+            response = self._call(
+                session,
+                "POST",
+                "POST /contracts",
+                "/contracts",
+                {
+                    "name": f"Load Contract {suffix}",
+                    "blueprintId": blueprint["id"],
+                    "fieldValues": field_values_for(blueprint, suffix),
+                },
+            )
+            if response is None or response.status_code != 201:
+                continue
+            contract_id = response.json()["id"]
+
+            for status in LIFECYCLE:
+                if self._should_stop():
+                    return
+                response = self._call(
+                    session,
+                    "POST",
+                    "POST /contracts/{id}/transition",
+                    f"/contracts/{contract_id}/transition",
+                    {"newStatus": status, "note": "load test"},
+                )
+                if response is None or not response.ok:
+                    break
+
+            if self._should_stop():
+                return
+            self._call(session, "GET", "GET /contracts", "/contracts")
+            self._call(session, "GET", "GET /stats", "/stats")
+
+    def run(self):
+        started_at = datetime.now().isoformat()
+        start = time.monotonic()
+        if self.duration is not None:
+            self._deadline = start + self.duration
+        with ThreadPoolExecutor(max_workers=self.users) as pool:
+            futures = [pool.submit(self._virtual_user, i) for i in range(self.users)]
+            for future in futures:
+                future.result()
+        wall_seconds = time.monotonic() - start
+
+        summary = {
+            "baseUrl": self.base_url,
+            "startedAt": started_at,
+            "users": self.users,
+            "durationLimitSeconds": self.duration,
+            "requestLimit": self.max_requests,
+            "wallSeconds": wall_seconds,
+        }
+        summary.update(self.recorder.summarize(wall_seconds))
+        return summary
+
+
+def print_summary(summary):
+    print("\n" + "=" * 96)
+    print("📈 LOAD SUMMARY")
+    print("=" * 96)
+    print(
+        f"{'ENDPOINT':<36}{'COUNT':>8}{'ERR%':>8}{'RPS':>9}"
+        f"{'P50 ms':>10}{'P95 ms':>10}{'P99 ms':>10}{'MAX ms':>10}"
+    )
+    for endpoint, stats in summary["endpoints"].items():
+        latency = stats["latencyMs"]
+        print(
+            f"{endpoint:<36}{stats['count']:>8}{stats['errorRate'] * 100:>7.1f}%"
+            f"{stats['throughputRps']:>9.1f}{latency['p50']:>10.1f}{latency['p95']:>10.1f}"
+            f"{latency['p99']:>10.1f}{latency['max']:>10.1f}"
+        )
+    print("-" * 96)
+    print(
+        f"TOTAL: {summary['totalRequests']} requests in {summary['wallSeconds']:.1f}s "
+        f"({summary['throughputRps']:.1f} req/s, {summary['errorRate'] * 100:.2f}% errors)"
+    )
+    cache = summary.get("blueprintCache")
+    if cache:
+        print(
+            f"BLUEPRINT CACHE: {cache['hits']} hits, {cache['misses']} misses "
+            f"({cache['hitRate'] * 100:.1f}% hit rate, single server process)"
+        )
+    print("=" * 96)
+
+
+def add_arguments(parser):
+    parser.add_argument("--users", type=int, default=10, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, help="run time in seconds (default 30)")
+    parser.add_argument("--requests", type=int, dest="max_requests", help="stop after N requests")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument(
+        "--output", default="load_summary.json", help="path of the JSON summary to write"
+    )
+
+
+def fetch_json(url):
+    """GET a JSON document, or None when the endpoint is unavailable."""
+    try:
+        response = requests.get(url, timeout=10)
+        return response.json() if response.ok else None
+    except (requests.RequestException, ValueError):
+        return None
+
+
+METRIC_LINE = re.compile(r"^agreementhub_(\w+?)_(sum|count)\{(.*)\} (\S+)$")
+LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def fetch_metrics(base_url):
+    """Histogram sums and counts from GET /metrics keyed by (metric, labels), or None."""
+    try:
+        response = requests.get(f"{base_url}/metrics", timeout=10)
+        if not response.ok:
+            return None
+    except requests.RequestException:
+        return None
+    samples = {}
+    for line in response.text.splitlines():
+        match = METRIC_LINE.match(line)
+        if match:
+            name, kind, labels, value = match.groups()
+            key = (name, kind, tuple(sorted(LABEL.findall(labels))))
+            samples[key] = float(value)
+    return samples
+
+
+def attribute_latency(before, after):
+    """Per-route handler vs MongoDB time accumulated between two /metrics scrapes."""
+
+    def delta(key):
+        return after.get(key, 0.0) - before.get(key, 0.0)
+
+    routes = {}
+    for name, kind, labels in after:
+        if kind != "sum" or name not in ("http_request_duration_seconds", "http_request_db_seconds"):
+            continue
+        label_map = dict(labels)
+        route = routes.setdefault(
+            f"{label_map['method']} {label_map['route']}", {"requests": 0, "handlerSeconds": 0.0, "dbSeconds": 0.0}
+        )
+        if name == "http_request_duration_seconds":
+            route["requests"] += int(delta((name, "count", labels)))
+            route["handlerSeconds"] += delta((name, "sum", labels))
+        else:
+            route["dbSeconds"] += delta((name, "sum", labels))
+
+    commands = {}
+    for name, kind, labels in after:
+        if name == "mongodb_command_duration_seconds" and kind == "sum":
+            label_map = dict(labels)
+            count = int(delta((name, "count", labels)))
+            if count:
+                commands[f"{label_map['command']} {label_map['collection']}"] = {
+                    "count": count,
+                    "seconds": delta((name, "sum", labels)),
+                }
+    return {
+        "routes": {key: value for key, value in routes.items() if value["requests"] > 0},
+        "commands": commands,
+    }
+
+
+def print_attribution(attribution):
+    print("\n⏱️  SERVER TIME (from /metrics, single server process)")
+    print(f"{'ROUTE':<44}{'REQS':>8}{'HANDLER ms':>12}{'DB ms':>10}{'DB %':>8}")
+    for route, stats in sorted(attribution["routes"].items(), key=lambda item: -item[1]["handlerSeconds"]):
+        handler_ms = stats["handlerSeconds"] * 1000 / stats["requests"]
+        db_ms = stats["dbSeconds"] * 1000 / stats["requests"]
+        share = stats["dbSeconds"] / stats["handlerSeconds"] * 100 if stats["handlerSeconds"] else 0.0
+        print(f"{route:<44}{stats['requests']:>8}{handler_ms:>12.1f}{db_ms:>10.1f}{share:>7.0f}%")
+    print(f"\n{'MONGODB COMMAND':<44}{'COUNT':>8}{'MEAN ms':>12}{'TOTAL s':>10}")
+    for command, stats in sorted(attribution["commands"].items(), key=lambda item: -item[1]["seconds"])[:15]:
+        print(
+            f"{command:<44}{stats['count']:>8}{stats['seconds'] * 1000 / stats['count']:>12.2f}"
+            f"{stats['seconds']:>10.2f}"
+        )
+
+
+def run(base_url, args):
+    print("🚀 Starting AgreementHub load run")
+    print(f"📍 Base URL: {base_url}")
+    print(f"👥 Virtual users: {args.users}")
+    generator = LoadGenerator(
+        base_url,
+        users=args.users,
+        duration=args.duration,
+        max_requests=args.max_requests,
+        timeout=args.timeout,
+    )
+    cache_before = fetch_json(f"{base_url}/blueprints/cache")
+    metrics_before = fetch_metrics(base_url)
+    summary = generator.run()
+    metrics_after = fetch_metrics(base_url)
+    cache_after = fetch_json(f"{base_url}/blueprints/cache")
+    if cache_before and cache_after:
+        hits = cache_after["hits"] - cache_before["hits"]
+        misses = cache_after["misses"] - cache_before["misses"]
+        summary["blueprintCache"] = {
+            "hits": hits,
+            "misses": misses,
+            "hitRate": hits / (hits + misses) if hits + misses else 0.0,
+        }
+    if metrics_before is not None and metrics_after is not None:
+        summary["serverTime"] = attribute_latency(metrics_before, metrics_after)
+    print_summary(summary)
+    if "serverTime" in summary:
+        print_attribution(summary["serverTime"])
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(summary, fh, indent=2)
+    print(f"💾 Summary written to {args.output}")
+    return summary["totalErrors"] == 0
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Maintenance commands for a running AgreementHub deployment.
+
+Usage:
+  BASE_URL=http://localhost:3001/api python scripts/maintenance.py reconcile-stats
+  BASE_URL=http://localhost:3001/api python scripts/maintenance.py repair-blueprint-counts
+  BASE_URL=http://localhost:3001/api python scripts/maintenance.py migrate-history
+  BASE_URL=http://localhost:3001/api python scripts/maintenance.py rebuild-timeseries
+  BASE_URL=http://localhost:3001/api python scripts/maintenance.py reindex-search
+  BASE_URL=http://localhost:3001/api python scripts/maintenance.py migrate-blueprint-versions
+
+The maintenance routes are disabled unless the server has ADMIN_TOKEN set;
+export the same ADMIN_TOKEN here.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import requests
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3001/api")
+
+
+def admin_headers():
+    """Authorization header for the maintenance routes (from ADMIN_TOKEN)."""
+    token = os.environ.get("ADMIN_TOKEN")
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def post(path):
+    response = requests.post(f"{BASE_URL}{path}", headers=admin_headers(), timeout=600)
+    if not response.ok:
+        print(f"❌ {path}: {response.status_code} {response.text}")
+        return None
+    return response.json()
+
+
+def reconcile_stats(args):
+    result = post("/stats/reconcile")
+    if result is None:
+        return False
+    print("✅ Dashboard counters rebuilt")
+    print(json.dumps(result, indent=2))
+    return True
+
+
+def repair_blueprint_counts(args):
+    result = post("/blueprints/repair-counts")
+    if result is None:
+        return False
+    print(
+        f"✅ Checked {result['blueprintsChecked']} blueprints, "
+        f"repaired {result['blueprintsRepaired']} contract counts"
+    )
+    return True
+
+
+def migrate_history(args):
+    result = post("/contracts/migrate-history")
+    if result is None:
+        return False
+    print(
+        f"✅ Migrated {result['contractsMigrated']} contracts "
+        f"({result['entriesCopied']} history entries) into contract_events"
+    )
+    return True
+
+
+def rebuild_timeseries(args):
+    result = post("/stats/timeseries/rebuild")
+    if result is None:
+        return False
+    print(
+        f"✅ Rebuilt {result['daysRebuilt']} daily rollups from {result['eventsScanned']} events"
+    )
+    return True
+
+
+def reindex_search(args):
+    result = post("/contracts/reindex-search")
+    if result is None:
+        return False
+    print(f"✅ Built search keys for {result['contractsIndexed']} contracts")
+    return True
+
+
+def migrate_blueprint_versions(args):
+    result = post("/blueprints/migrate-versions")
+    if result is None:
+        return False
+    print(
+        f"✅ Versioned {result['blueprintsVersioned']} blueprints, "
+        f"converted {result['contractsMigrated']} contracts to field values"
+    )
+    if result["contractsSkipped"]:
+        print(
+            f"⚠️  {result['contractsSkipped']} contracts no longer match their blueprint's fields "
+            "and keep their embedded field definitions"
+        )
+    return True
+
+
+COMMANDS = {
+    "reconcile-stats": (reconcile_stats, "rebuild the /api/stats counters from the live collections"),
+    "repair-blueprint-counts": (
+        repair_blueprint_counts,
+        "recompute blueprint contractCount from the contracts collection",
+    ),
+    "migrate-history": (
+        migrate_history,
+        "move embedded statusHistory of legacy contracts into contract_events",
+    ),
+    "rebuild-timeseries": (
+        rebuild_timeseries,
+        "recompute the /api/stats/timeseries daily rollups from contract_events",
+    ),
+    "reindex-search": (
+        reindex_search,
+        "build ?q= search keys for contracts created before search existed",
+    ),
+    "migrate-blueprint-versions": (
+        migrate_blueprint_versions,
+        "snapshot blueprint versions and store legacy contracts' field values by field id",
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AgreementHub maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text)
+    args = parser.parse_args(argv)
+    handler, _ = COMMANDS[args.command]
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,49 @@
+"""
+Compare two result files of the performance suite (tests/test_perf.py) and
+fail on regressions beyond a threshold, so a change can be checked against a
+baseline recorded on the same machine. The suite itself runs under pytest:
+
+  DB_NAME=agreementhub_perf python -m pytest tests --perf --perf-scales 10k,100k,1m --perf-output baseline.json
+
+Usage (via the backend test entry point):
+  python scripts/backend_test.py perf-compare baseline.json current.json --threshold 15
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests import perf_results  # noqa: E402
+
+
+def add_arguments(parser):
+    parser.add_argument("baseline", help="results file of the reference run")
+    parser.add_argument("current", help="results file of the run to check")
+    parser.add_argument(
+        "--threshold", type=float, default=20, help="allowed slowdown in percent before flagging a regression"
+    )
+    parser.add_argument("--metric", choices=perf_results.METRICS, default="p50", help="latency to compare")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this (timer noise)"
+    )
+
+
+def run(args):
+    baseline = perf_results.load_report(args.baseline)
+    current = perf_results.load_report(args.current)
+    if not perf_results.same_dataset(baseline, current):
+        print("⚠️  The runs used different datasets (seed / blueprints); timings may not be comparable")
+
+    rows = perf_results.compare(
+        baseline, current, threshold=args.threshold, metric=args.metric, min_delta_ms=args.min_delta_ms
+    )
+    for line in perf_results.format_comparison(rows):
+        print(line)
+
+    regressions = sum(1 for row in rows if row[-1])
+    if regressions:
+        print(f"\n❌ {regressions} {args.metric} regression(s) beyond {args.threshold:.0f}%")
+        return False
+    print(f"\n✅ No {args.metric} regressions beyond {args.threshold:.0f}%")
+    return True
@@ -0,0 +1,146 @@
+"""
+Backlog check for the lifecycle scheduler (lib/scheduler.js).
+
+Creates contracts, signs them through the bulk transition API, then triggers
+POST /scheduler until the auto-lock backlog is drained while a probe keeps
+timing GET /contracts. Prints job throughput and API latency before and
+during the run.
+
+The server must run with a tiny auto-lock age and a long interval, so the
+signed contracts become eligible at once and only this check runs the job:
+  SCHEDULER_AUTO_LOCK_DAYS=0.00001 SCHEDULER_INTERVAL_MS=3600000 yarn start -p 3001
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py scheduler --count 100000
+"""
+
+import threading
+import time
+
+import requests
+
+import seed_data
+from load_test import percentile
+from maintenance import admin_headers
+from transition_bench import bulk, create_contracts
+
+PROBE_PATH = "/contracts?limit=20&fields=summary"
+MAX_WAIT_SECONDS = 60
+
+
+class LatencyProbe(threading.Thread):
+    """Times sequential GET /contracts requests until stopped."""
+
+    def __init__(self, base_url):
+        super().__init__(daemon=True)
+        self.url = f"{base_url}{PROBE_PATH}"
+        self.samples = []
+        self.errors = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        session = requests.Session()
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            try:
+                ok = session.get(self.url, timeout=30).ok
+            except requests.RequestException:
+                ok = False
+            if ok:
+                self.samples.append((time.perf_counter() - started) * 1000)
+            else:
+                self.errors += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def summary(self):
+        samples = sorted(self.samples)
+        return len(samples), percentile(samples, 50), percentile(samples, 95)
+
+
+def probe_for(base_url, seconds):
+    probe = LatencyProbe(base_url)
+    probe.start()
+    time.sleep(seconds)
+    probe.stop()
+    return probe
+
+
+def auto_lock_job(base_url):
+    status = requests.get(f"{base_url}/scheduler", timeout=30).json()
+    return next((job for job in status["jobs"] if job["name"] == "auto-lock"), None)
+
+
+def add_arguments(parser):
+    parser.add_argument("--count", type=int, default=10000, help="signed contracts to put in the backlog")
+    parser.add_argument("--baseline-seconds", type=float, default=5, help="latency sampling before the run")
+    parser.add_argument(
+        "--max-p95-ms", type=float, help="fail if GET /contracts p95 during the run exceeds this"
+    )
+
+
+def run(base_url, args):
+    job = auto_lock_job(base_url)
+    if not job or not job["enabled"]:
+        print("❌ The auto-lock job is disabled; start the server with SCHEDULER_AUTO_LOCK_DAYS set (see module docstring)")
+        return False
+    wait_seconds = job["afterDays"] * 86400
+    if wait_seconds > MAX_WAIT_SECONDS:
+        print(f"❌ SCHEDULER_AUTO_LOCK_DAYS={job['afterDays']} is too long to wait for; use e.g. 0.00001")
+        return False
+
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+    blueprint = seed_data.create_blueprint(base_url, session)
+    print(f"🌱 Creating and signing {args.count} contracts")
+    ids = create_contracts(session, base_url, blueprint, args.count)
+    for status in ("approved", "sent", "signed"):
+        applied, seconds = bulk(session, base_url, ids, status)
+        print(f"  … {applied} {status} in {seconds:.1f}s")
+    time.sleep(wait_seconds + 1)
+
+    print(f"📏 Baseline GET {PROBE_PATH} for {args.baseline_seconds:.0f}s")
+    baseline = probe_for(base_url, args.baseline_seconds).summary()
+
+    probe = LatencyProbe(base_url)
+    probe.start()
+    started = time.perf_counter()
+    runs = []
+    try:
+        while True:
+            response = session.post(f"{base_url}/scheduler", headers=admin_headers(), timeout=600)
+            if response.status_code == 409:
+                print("❌ Another instance holds the scheduler lease")
+                return False
+            response.raise_for_status()
+            run_summary = response.json()["runs"]["auto-lock"]
+            runs.append(run_summary)
+            if run_summary.get("error") or run_summary["complete"] or run_summary["outcomes"]["applied"] == 0:
+                break
+    finally:
+        probe.stop()
+    seconds = time.perf_counter() - started
+
+    applied = sum(r["outcomes"]["applied"] for r in runs)
+    batches = sum(r["batches"] for r in runs)
+    print(f"\n🔒 auto-lock: {applied} locked in {len(runs)} run(s), {batches} batches, {seconds:.1f}s")
+    print(f"  throughput: {applied / seconds if seconds else 0:.0f} contracts/s")
+    job_times = ", ".join(f"{r['durationMs'] / 1000:.1f}s" for r in runs)
+    print(f"  job time:   {job_times}")
+    if runs and runs[-1].get("error"):
+        print(f"  error:      {runs[-1]['error']}")
+
+    during = probe.summary()
+    print(f"\n{'GET /contracts':<16}{'REQUESTS':>10}{'P50 ms':>10}{'P95 ms':>10}")
+    print(f"{'baseline':<16}{baseline[0]:>10}{baseline[1]:>10.1f}{baseline[2]:>10.1f}")
+    print(f"{'during run':<16}{during[0]:>10}{during[1]:>10.1f}{during[2]:>10.1f}")
+    if probe.errors:
+        print(f"  {probe.errors} probe request(s) failed during the run")
+
+    ok = applied >= len(ids) and not runs[-1].get("error") and probe.errors == 0
+    if args.max_p95_ms is not None:
+        ok = ok and during[2] <= args.max_p95_ms
+    print("✅ Scheduler backlog drained" if ok else "❌ Scheduler check failed")
+    return ok
@@ -0,0 +1,96 @@
+"""
+Latency benchmark for contract search (GET /contracts?q=).
+
+Seeds contracts with varied counterparty names through the bulk API, then
+times a mix of prefix, whole-word, multi-word, filtered and rare-term queries
+and checks p95 against the target.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py search --count 1000000
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py search --skip-seed --repeat 100
+"""
+
+import random
+import time
+
+import requests
+
+import seed_data
+from load_test import percentile
+
+COMPANIES = [
+    "Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Wonka", "Hooli", "Vandelay",
+    "Northwind", "Contoso", "Tyrell", "Cyberdyne", "Soylent", "Aperture", "Gringotts",
+]
+SECTORS = [
+    "Logistics", "Holdings", "Labs", "Industries", "Capital", "Foods", "Energy", "Media",
+    "Robotics", "Pharma", "Retail", "Systems",
+]
+FIRST_NAMES = ["Ada", "Grace", "Alan", "Linus", "Margaret", "Dennis", "Barbara", "Ken", "Radia", "Edsger"]
+LAST_NAMES = ["Lovelace", "Hopper", "Turing", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson", "Perlman", "Dijkstra"]
+
+# (label, params) - the last word of q is matched as a prefix unless q ends with a space
+QUERIES = [
+    ("prefix", {"q": "nort"}),
+    ("word", {"q": "globex "}),
+    ("two words", {"q": "acme logist"}),
+    ("text field", {"q": "hopper "}),
+    ("word + status", {"q": "initech ", "status": "created"}),
+    ("word + category", {"q": "stark ", "category": "pending"}),
+    ("rare term", {"q": "ref0004242 "}),
+    ("no match", {"q": "zzzzzz "}),
+]
+
+
+def search_item(blueprint, index):
+    rng = random.Random(index)
+    counterparty = f"{rng.choice(COMPANIES)} {rng.choice(SECTORS)}"
+    values = seed_data.field_values_for(blueprint, index)
+    for field in blueprint["fields"]:
+        if field["type"] == "text":
+            values[field["id"]] = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} for {counterparty}"
+    return {"name": f"{counterparty} Agreement REF{index:07d}", "fieldValues": values}
+
+
+def time_query(session, base_url, params, repeat, limit):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = session.get(f"{base_url}/contracts", params={**params, "fields": "summary", "limit": limit})
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    latencies.sort()
+    return latencies, len(response.json()["contracts"])
+
+
+def add_arguments(parser):
+    parser.add_argument("--count", type=int, default=100000, help="contracts to seed")
+    parser.add_argument("--batch-size", type=int, default=1000, help="contracts per bulk request")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent bulk requests")
+    parser.add_argument("--skip-seed", action="store_true", help="benchmark the existing data")
+    parser.add_argument("--repeat", type=int, default=30, help="requests per query")
+    parser.add_argument("--limit", type=int, default=50, help="page size")
+    parser.add_argument("--target-ms", type=float, default=50, help="p95 latency target")
+
+
+def run(base_url, args):
+    if not args.skip_seed:
+        seed_data.bulk_seed_contracts(
+            base_url, args.count, args.batch_size, args.workers, make_item=search_item
+        )
+
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    print(f"\n🔎 GET /contracts?q= (target p95 ≤ {args.target_ms:.0f} ms)")
+    print(f"{'QUERY':<18}{'HITS':>6}{'P50 ms':>10}{'P95 ms':>10}{'P99 ms':>10}")
+    ok = True
+    for label, params in QUERIES:
+        latencies, hits = time_query(session, base_url, params, args.repeat, args.limit)
+        p95 = percentile(latencies, 95)
+        marker = "✅" if p95 <= args.target_ms else "❌"
+        ok = ok and p95 <= args.target_ms
+        print(
+            f"{label:<18}{hits:>6}{percentile(latencies, 50):>10.1f}{p95:>10.1f}"
+            f"{percentile(latencies, 99):>10.1f}  {marker}"
+        )
+    return ok
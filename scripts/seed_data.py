@@ -0,0 +1,170 @@
+"""
+Dataset seeding helpers for AgreementHub pagination and load checks.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py seed --count 50000
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py bulk-seed --count 500000
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from load_test import LOAD_BLUEPRINT, field_values_for
+
+
+def _session():
+    session = requests.Session()
+    session.headers.update(
+        {"Content-Type": "application/json", "Accept": "application/json"}
+    )
+    return session
+
+
+def create_blueprint(base_url, session=None):
+    session = session or _session()
+    response = session.post(f"{base_url}/blueprints", json=LOAD_BLUEPRINT)
+    response.raise_for_status()
+    return response.json()
+
+
+def seed_contracts(base_url, count, workers=16, blueprint=None):
+    """Create `count` contracts from one blueprint using `workers` threads.
+
+    Returns (blueprint, created, failed).
+    """
+    blueprint = blueprint or create_blueprint(base_url)
+    lock = threading.Lock()
+    progress = {"next": 0, "created": 0, "failed": 0}
+    local = threading.local()
+
+    def claim():
+        with lock:
+            if progress["next"] >= count:
+                return None
+            progress["next"] += 1
+            return progress["next"]
+
+    def worker():
+        local.session = _session()
+        while True:
+            index = claim()
+            if index is None:
+                return
+            payload = {
+                "name": f"Seeded Contract {index:07d}",
+                "blueprintId": blueprint["id"],
+                "fieldValues": field_values_for(blueprint, index),
+            }
+            try:
+                ok = local.session.post(f"{base_url}/contracts", json=payload).status_code == 201
+            except requests.RequestException:
+                ok = False
+            with lock:
+                progress["created" if ok else "failed"] += 1
+                done = progress["created"] + progress["failed"]
+            if done % 5000 == 0:
+                print(f"  … {done}/{count} contracts submitted")
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(worker) for _ in range(workers)]:
+            future.result()
+    elapsed = time.monotonic() - start
+    print(
+        f"🌱 Seeded {progress['created']} contracts ({progress['failed']} failed) "
+        f"in {elapsed:.1f}s ({progress['created'] / elapsed if elapsed else 0:.0f}/s)"
+    )
+    return blueprint, progress["created"], progress["failed"]
+
+
+def default_contract_item(blueprint, index):
+    return {
+        "name": f"Seeded Contract {index + 1:07d}",
+        "fieldValues": field_values_for(blueprint, index + 1),
+    }
+
+
+def bulk_seed_contracts(
+    base_url, count, batch_size=1000, workers=4, blueprint=None, make_item=default_contract_item
+):
+    """Create `count` contracts through POST /contracts/bulk in `batch_size` chunks.
+
+    `make_item(blueprint, index)` builds each { name, fieldValues } item.
+    Returns (blueprint, created, failed).
+    """
+    blueprint = blueprint or create_blueprint(base_url)
+    batches = [
+        range(start, min(start + batch_size, count)) for start in range(0, count, batch_size)
+    ]
+    lock = threading.Lock()
+    progress = {"created": 0, "failed": 0}
+    local = threading.local()
+
+    def send(batch):
+        if not hasattr(local, "session"):
+            local.session = _session()
+        payload = {
+            "blueprintId": blueprint["id"],
+            "contracts": [make_item(blueprint, index) for index in batch],
+        }
+        try:
+            response = local.session.post(f"{base_url}/contracts/bulk", json=payload)
+            if response.status_code in (201, 207):
+                result = response.json()
+                created, failed = result["created"], result["failed"]
+            else:
+                created, failed = 0, len(batch)
+        except requests.RequestException:
+            created, failed = 0, len(batch)
+        with lock:
+            progress["created"] += created
+            progress["failed"] += failed
+            print(f"  … {progress['created'] + progress['failed']}/{count} contracts submitted")
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(send, batches))
+    elapsed = time.monotonic() - start
+    print(
+        f"🌱 Bulk-seeded {progress['created']} contracts ({progress['failed']} failed) "
+        f"in {elapsed:.1f}s ({progress['created'] / elapsed if elapsed else 0:.0f}/s)"
+    )
+    return blueprint, progress["created"], progress["failed"]
+
+
+def add_arguments(parser):
+    parser.add_argument("--count", type=int, default=50000, help="contracts to create")
+    parser.add_argument("--workers", type=int, default=16, help="concurrent request threads")
+    parser.add_argument("--blueprint-id", help="seed from an existing blueprint")
+
+
+def add_bulk_arguments(parser):
+    parser.add_argument("--count", type=int, default=50000, help="contracts to create")
+    parser.add_argument("--batch-size", type=int, default=1000, help="contracts per bulk request")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent bulk requests")
+    parser.add_argument("--blueprint-id", help="seed from an existing blueprint")
+
+
+def _load_blueprint(base_url, blueprint_id):
+    if not blueprint_id:
+        return None
+    response = _session().get(f"{base_url}/blueprints/{blueprint_id}")
+    response.raise_for_status()
+    return response.json()
+
+
+def run(base_url, args):
+    blueprint = _load_blueprint(base_url, args.blueprint_id)
+    _, _, failed = seed_contracts(base_url, args.count, args.workers, blueprint)
+    return failed == 0
+
+
+def run_bulk(base_url, args):
+    blueprint = _load_blueprint(base_url, args.blueprint_id)
+    _, _, failed = bulk_seed_contracts(
+        base_url, args.count, args.batch_size, args.workers, blueprint
+    )
+    return failed == 0
@@ -0,0 +1,122 @@
+"""
+Fan-out latency probe for GET /contracts/events.
+
+Opens several SSE consumers, fires concurrent lifecycle transitions and
+measures how long each delta takes to reach every consumer.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py sse --consumers 10 --transitions 200
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import seed_data
+from load_test import percentile
+from transition_bench import create_contracts
+
+
+class SseConsumer(threading.Thread):
+    def __init__(self, url):
+        super().__init__(daemon=True)
+        self.url = url
+        self.ready = threading.Event()
+        self.received = []  # ((contract id, status), perf_counter)
+        self.error = None
+        self._response = None
+        self._stopping = False
+
+    def run(self):
+        try:
+            self._response = requests.get(
+                self.url, stream=True, headers={"Accept": "text/event-stream"}, timeout=(5, None)
+            )
+            self._response.raise_for_status()
+            event = None
+            for raw in self._response.iter_lines(decode_unicode=True):
+                if not self.ready.is_set():
+                    self.ready.set()
+                if raw.startswith("event:"):
+                    event = raw[6:].strip()
+                elif raw.startswith("data:") and event == "contract":
+                    delta = json.loads(raw[5:].strip())
+                    self.received.append(((delta["id"], delta["status"]), time.perf_counter()))
+                elif raw == "":
+                    event = None
+        except Exception as e:  # noqa: BLE001 - surfaced in the report
+            if not self._stopping:
+                self.error = str(e)
+        finally:
+            self.ready.set()
+
+    def stop(self):
+        self._stopping = True
+        if self._response is not None:
+            self._response.close()
+
+
+def add_arguments(parser):
+    parser.add_argument("--consumers", type=int, default=10, help="concurrent SSE clients")
+    parser.add_argument("--transitions", type=int, default=200, help="transitions to fire")
+    parser.add_argument("--workers", type=int, default=16, help="concurrent transition senders")
+    parser.add_argument("--settle", type=float, default=5.0, help="seconds to wait for stragglers")
+
+
+def run(base_url, args):
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+    blueprint = seed_data.create_blueprint(base_url, session)
+    ids = create_contracts(session, base_url, blueprint, args.transitions)
+
+    consumers = [
+        SseConsumer(f"{base_url}/contracts/events?blueprintId={blueprint['id']}")
+        for _ in range(args.consumers)
+    ]
+    for consumer in consumers:
+        consumer.start()
+    for consumer in consumers:
+        consumer.ready.wait(timeout=10)
+
+    sent_at = {}
+    local = threading.local()
+
+    def transition(contract_id):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        sent_at[(contract_id, "approved")] = time.perf_counter()
+        response = local.session.post(
+            f"{base_url}/contracts/{contract_id}/transition", json={"newStatus": "approved"}
+        )
+        return response.status_code == 200
+
+    print(f"📡 {args.consumers} consumers, firing {len(ids)} transitions")
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        applied = sum(pool.map(transition, ids))
+    time.sleep(args.settle)
+    for consumer in consumers:
+        consumer.stop()
+
+    latencies = []
+    delivered = 0
+    for consumer in consumers:
+        for key, received_at in consumer.received:
+            if key in sent_at:
+                delivered += 1
+                latencies.append((received_at - sent_at[key]) * 1000)
+    latencies.sort()
+    expected = applied * len(consumers)
+    errors = [c.error for c in consumers if c.error]
+
+    print(f"  delivered {delivered}/{expected} deltas ({applied} transitions applied)")
+    print(
+        f"  fan-out latency ms: p50={percentile(latencies, 50):.1f} "
+        f"p95={percentile(latencies, 95):.1f} p99={percentile(latencies, 99):.1f} "
+        f"max={latencies[-1] if latencies else 0:.1f}"
+    )
+    for error in errors:
+        print(f"  ❌ consumer error: {error}")
+    return delivered == expected and not errors
@@ -0,0 +1,183 @@
+"""
+Seeds months of synthetic lifecycle history and times GET /stats/timeseries
+across range sizes.
+
+Lifecycle events cannot be back-dated through the API, so the seeding step
+writes contract_events directly (requires pymongo and the app's MONGO_URL /
+DB_NAME) and then asks the API to rebuild the daily rollups for the seeded
+range. Synthetic events use contractId "synthetic-..." and are removed with
+--cleanup.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py timeseries --days 180 --per-day 500
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py timeseries --skip-seed --repeat 50
+"""
+
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from load_test import percentile
+from maintenance import admin_headers
+
+SYNTHETIC_PREFIX = "synthetic-"
+SYNTHETIC_BLUEPRINT_ID = "synthetic-timeseries"
+# (status, mean hours spent in the previous status before this transition)
+SYNTHETIC_LIFECYCLE = [("approved", 6), ("sent", 12), ("signed", 48), ("locked", 2)]
+RANGE_DAYS = [1, 7, 30, 90, 180, 365]
+HOUR_BUCKET_MAX_DAYS = 31
+
+
+def _events_collection():
+    try:
+        from pymongo import MongoClient
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise SystemExit("pymongo is required to seed synthetic history (pip install pymongo)") from e
+    client = MongoClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    return client[os.environ.get("DB_NAME", "contract_management")]["contract_events"]
+
+
+def _iso(moment):
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def synthetic_contract_events(created_at, rng):
+    contract_id = f"{SYNTHETIC_PREFIX}{uuid.uuid4()}"
+    events = [
+        {
+            "id": str(uuid.uuid4()),
+            "contractId": contract_id,
+            "blueprintId": SYNTHETIC_BLUEPRINT_ID,
+            "status": "created",
+            "timestamp": _iso(created_at),
+            "note": "Synthetic history",
+        }
+    ]
+    previous, entered_at = "created", created_at
+    for status, mean_hours in SYNTHETIC_LIFECYCLE:
+        if status != "approved" and rng.random() < 0.1:
+            break  # some contracts stall part way
+        moment = entered_at + timedelta(hours=rng.expovariate(1 / mean_hours))
+        events.append(
+            {
+                "id": str(uuid.uuid4()),
+                "contractId": contract_id,
+                "blueprintId": SYNTHETIC_BLUEPRINT_ID,
+                "status": status,
+                "previousStatus": previous,
+                "timestamp": _iso(moment),
+                "durationInPreviousMs": int((moment - entered_at).total_seconds() * 1000),
+                "note": "Synthetic history",
+            }
+        )
+        previous, entered_at = status, moment
+    return events
+
+
+def seed_history(base_url, days, per_day, seed=7):
+    collection = _events_collection()
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    now_iso = _iso(now)
+    start = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    print(f"🌱 Seeding {days} days x {per_day} synthetic contracts of lifecycle history")
+    started = time.perf_counter()
+    batch = []
+    inserted = 0
+    for day in range(days):
+        day_start = start + timedelta(days=day)
+        for _ in range(per_day):
+            created_at = day_start + timedelta(seconds=rng.uniform(0, 86400))
+            batch.extend(e for e in synthetic_contract_events(created_at, rng) if e["timestamp"] < now_iso)
+            if len(batch) >= 10000:
+                collection.insert_many(batch, ordered=False)
+                inserted += len(batch)
+                batch = []
+    if batch:
+        collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    print(f"  inserted {inserted} events in {time.perf_counter() - started:.1f}s")
+
+    rebuild_rollups(base_url, _iso(start), now_iso)
+
+
+def rebuild_rollups(base_url, start, end):
+    started = time.perf_counter()
+    response = requests.post(
+        f"{base_url}/stats/timeseries/rebuild", params={"from": start, "to": end},
+        headers=admin_headers(), timeout=600,
+    )
+    response.raise_for_status()
+    result = response.json()
+    print(
+        f"  rebuilt {result['daysRebuilt']} daily rollups from {result['eventsScanned']} events "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+
+
+def cleanup(base_url):
+    collection = _events_collection()
+    result = collection.delete_many({"contractId": {"$regex": f"^{SYNTHETIC_PREFIX}"}})
+    print(f"🧹 Removed {result.deleted_count} synthetic events")
+    rebuild_rollups(base_url, "1970-01-01T00:00:00.000Z", _iso(datetime.now(timezone.utc)))
+
+
+def time_range(session, base_url, bucket, days, repeat):
+    end = datetime.now(timezone.utc)
+    params = {"bucket": bucket, "from": _iso(end - timedelta(days=days)), "to": _iso(end)}
+    latencies = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = session.get(f"{base_url}/stats/timeseries", params=params)
+        latencies.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        size = len(response.content)
+    latencies.sort()
+    body = response.json()
+    sent = body["timeInState"].get("sent", {})
+    return {
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "buckets": len(body["series"]),
+        "bytes": size,
+        "sentMedianMs": sent.get("medianMs"),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument("--days", type=int, default=180, help="days of synthetic history to seed")
+    parser.add_argument("--per-day", type=int, default=500, help="synthetic contracts started per day")
+    parser.add_argument("--repeat", type=int, default=20, help="requests per range size")
+    parser.add_argument("--skip-seed", action="store_true", help="time the endpoint without seeding")
+    parser.add_argument("--cleanup", action="store_true", help="remove synthetic events and exit")
+
+
+def run(base_url, args):
+    if args.cleanup:
+        cleanup(base_url)
+        return True
+    if not args.skip_seed:
+        seed_history(base_url, args.days, args.per_day)
+
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    print("\n⏱️  GET /stats/timeseries")
+    print(f"{'BUCKET':<8}{'RANGE':>8}{'BUCKETS':>9}{'P50 ms':>10}{'P95 ms':>10}{'BYTES':>10}  SENT→SIGNED MEDIAN")
+    for bucket in ("day", "hour"):
+        for days in RANGE_DAYS:
+            if bucket == "hour" and days > HOUR_BUCKET_MAX_DAYS:
+                continue
+            result = time_range(session, base_url, bucket, days, args.repeat)
+            median = result["sentMedianMs"]
+            median_text = f"{median / 3600000:.1f}h" if median else "-"
+            print(
+                f"{bucket:<8}{str(days) + 'd':>8}{result['buckets']:>9}{result['p50']:>10.1f}"
+                f"{result['p95']:>10.1f}{result['bytes']:>10}  {median_text}"
+            )
+    return True
@@ -0,0 +1,88 @@
+"""
+Throughput comparison of the per-id transition loop (what the dashboard does)
+against POST /contracts/transition/bulk.
+
+Usage (via the backend test entry point):
+  BASE_URL=http://localhost:3001/api python scripts/backend_test.py bench-transitions --count 1000
+"""
+
+import time
+
+import requests
+
+import seed_data
+from load_test import field_values_for
+
+BULK_CREATE_LIMIT = 10000
+BULK_TRANSITION_LIMIT = 5000
+
+
+def create_contracts(session, base_url, blueprint, count):
+    ids = []
+    for start in range(0, count, BULK_CREATE_LIMIT):
+        batch = range(start, min(start + BULK_CREATE_LIMIT, count))
+        response = session.post(
+            f"{base_url}/contracts/bulk",
+            json={
+                "blueprintId": blueprint["id"],
+                "contracts": [
+                    {
+                        "name": f"Transition Bench {index:07d}",
+                        "fieldValues": field_values_for(blueprint, index),
+                    }
+                    for index in batch
+                ],
+            },
+        )
+        response.raise_for_status()
+        ids.extend(r["id"] for r in response.json()["results"] if "id" in r)
+    return ids
+
+
+def per_id_loop(session, base_url, ids, new_status):
+    start = time.perf_counter()
+    applied = 0
+    for contract_id in ids:
+        response = session.post(
+            f"{base_url}/contracts/{contract_id}/transition", json={"newStatus": new_status}
+        )
+        applied += response.status_code == 200
+    return applied, time.perf_counter() - start
+
+
+def bulk(session, base_url, ids, new_status):
+    start = time.perf_counter()
+    applied = 0
+    for offset in range(0, len(ids), BULK_TRANSITION_LIMIT):
+        response = session.post(
+            f"{base_url}/contracts/transition/bulk",
+            json={"ids": ids[offset:offset + BULK_TRANSITION_LIMIT], "newStatus": new_status},
+        )
+        response.raise_for_status()
+        applied += response.json()["applied"]
+    return applied, time.perf_counter() - start
+
+
+def add_arguments(parser):
+    parser.add_argument("--count", type=int, default=1000, help="contracts per strategy")
+    parser.add_argument("--status", default="approved", help="target status from created")
+
+
+def run(base_url, args):
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+    blueprint = seed_data.create_blueprint(base_url, session)
+    ids = create_contracts(session, base_url, blueprint, args.count * 2)
+    loop_ids, bulk_ids = ids[: args.count], ids[args.count:]
+
+    print(f"⏱️  Transitioning {args.count} contracts to '{args.status}' per strategy")
+    loop_applied, loop_seconds = per_id_loop(session, base_url, loop_ids, args.status)
+    bulk_applied, bulk_seconds = bulk(session, base_url, bulk_ids, args.status)
+
+    loop_rate = loop_applied / loop_seconds if loop_seconds else 0.0
+    bulk_rate = bulk_applied / bulk_seconds if bulk_seconds else 0.0
+    print(f"  per-id loop: {loop_applied} applied in {loop_seconds:.2f}s ({loop_rate:.0f}/s)")
+    print(f"  bulk:        {bulk_applied} applied in {bulk_seconds:.2f}s ({bulk_rate:.0f}/s)")
+    if loop_rate:
+        print(f"  speedup:     {bulk_rate / loop_rate:.1f}x")
+    return loop_applied == len(loop_ids) and bulk_applied == len(bulk_ids)
@@ -0,0 +1,186 @@
+"""
+pytest options, fixtures and result hooks of the performance suite.
+
+The suite runs against a live server and the MongoDB it uses (point both at
+a dedicated database) and is skipped unless --perf is given:
+
+  DB_NAME=agreementhub_perf python -m pytest tests --perf --perf-scales 10k,100k,1m \\
+      --perf-output baseline.json
+  DB_NAME=agreementhub_perf python -m pytest tests --perf --perf-scales 10k,100k,1m \\
+      --perf-output current.json --perf-baseline baseline.json --perf-threshold 20
+
+Every timed test records a latency summary; at the end of the session they
+are written to --perf-output and, with --perf-baseline, compared against a
+previous result file. A regression beyond the threshold fails the session.
+"""
+
+import os
+
+import pytest
+
+from tests import perf_results
+
+RESULTS_KEY = pytest.StashKey()
+COMPARISON_KEY = pytest.StashKey()
+
+
+class Dataset:
+    """The loaded synthetic dataset of one scale."""
+
+    __slots__ = ("contracts", "blueprint_id", "sample_ids")
+
+    def __init__(self, contracts, blueprint_id, sample_ids):
+        self.contracts = contracts
+        self.blueprint_id = blueprint_id
+        self.sample_ids = sample_ids
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance suite")
+    group.addoption("--perf", action="store_true", help="run the performance suite against a live server")
+    group.addoption(
+        "--base-url", default=os.environ.get("BASE_URL", "http://localhost:3001/api"), help="API base URL"
+    )
+    group.addoption(
+        "--perf-scales", default="10k", help="comma-separated contract counts to load and time, e.g. 10k,100k,1m"
+    )
+    group.addoption("--perf-blueprints", type=int, default=50, help="synthetic blueprints per dataset")
+    group.addoption("--perf-seed", type=int, default=42, help="generator seed")
+    group.addoption("--perf-repeat", type=int, default=50, help="timed requests per endpoint")
+    group.addoption("--perf-output", default="perf-results.json", help="where to write the results")
+    group.addoption("--perf-cleanup", action="store_true", help="remove the synthetic dataset after the run")
+    group.addoption("--perf-baseline", default=None, help="results file to compare against")
+    group.addoption(
+        "--perf-threshold", type=float, default=20, help="allowed slowdown in percent before failing"
+    )
+    group.addoption("--perf-metric", choices=perf_results.METRICS, default="p50", help="latency to compare")
+    group.addoption(
+        "--perf-min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this (timer noise)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: timed endpoint benchmark against a live server (needs --perf)")
+    config.stash[RESULTS_KEY] = {}
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("perf"):
+        return
+    skip = pytest.mark.skip(reason="performance suite; run with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc):
+    if "perf_dataset" in metafunc.fixturenames:
+        scales = [perf_results.parse_scale(s) for s in metafunc.config.getoption("perf_scales").split(",")]
+        metafunc.parametrize("perf_dataset", scales, indirect=True, scope="session", ids=str)
+
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig):
+    return pytestconfig.getoption("base_url").rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def http():
+    requests = pytest.importorskip("requests")
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def perf_repeat(pytestconfig):
+    return pytestconfig.getoption("perf_repeat")
+
+
+@pytest.fixture(scope="session")
+def perf_dataset(request, base_url):
+    """Load the synthetic dataset at the scale of this parametrization (replacing any previous one)."""
+    pytest.importorskip("pymongo")
+    from tests import synthetic_dataset
+
+    config = request.config
+    contracts = request.param
+    sample_ids = synthetic_dataset.load_dataset(
+        base_url,
+        contracts,
+        config.getoption("perf_blueprints"),
+        seed=config.getoption("perf_seed"),
+        sample_size=config.getoption("perf_repeat") + perf_results.WARMUP_REQUESTS,
+    )
+    yield Dataset(contracts, synthetic_dataset.blueprint_id(0), sample_ids)
+    if config.getoption("perf_cleanup"):
+        synthetic_dataset.cleanup(base_url)
+
+
+@pytest.fixture
+def record(request, perf_dataset):
+    """record(endpoint, summary) stores a latency summary for the result file."""
+    results = request.config.stash[RESULTS_KEY]
+
+    def store(name, summary):
+        results.setdefault(perf_dataset.contracts, {})[name] = summary
+
+    return store
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    results = config.stash[RESULTS_KEY]
+    if not results:
+        return
+    report = perf_results.build_report(
+        results,
+        seed=config.getoption("perf_seed"),
+        blueprints=config.getoption("perf_blueprints"),
+        repeat=config.getoption("perf_repeat"),
+    )
+    perf_results.write_report(config.getoption("perf_output"), report)
+
+    baseline_path = config.getoption("perf_baseline")
+    if not baseline_path:
+        return
+    baseline = perf_results.load_report(baseline_path)
+    rows = perf_results.compare(
+        baseline,
+        report,
+        threshold=config.getoption("perf_threshold"),
+        metric=config.getoption("perf_metric"),
+        min_delta_ms=config.getoption("perf_min_delta_ms"),
+    )
+    config.stash[COMPARISON_KEY] = (baseline, report, rows)
+    if any(row[-1] for row in rows) and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash[RESULTS_KEY]
+    if not results:
+        return
+    terminalreporter.section("performance")
+    for contracts, endpoints in sorted(results.items()):
+        for line in perf_results.format_results(contracts, endpoints):
+            terminalreporter.write_line(line)
+        terminalreporter.write_line("")
+    terminalreporter.write_line(f"💾 Results written to {config.getoption('perf_output')}")
+
+    comparison = config.stash.get(COMPARISON_KEY, None)
+    if comparison is None:
+        return
+    baseline, report, rows = comparison
+    terminalreporter.section(f"compared with {config.getoption('perf_baseline')}")
+    if not perf_results.same_dataset(baseline, report):
+        terminalreporter.write_line("⚠️  The runs used different datasets (seed / blueprints)")
+    for line in perf_results.format_comparison(rows):
+        terminalreporter.write_line(line)
+    regressions = sum(1 for row in rows if row[-1])
+    metric, threshold = config.getoption("perf_metric"), config.getoption("perf_threshold")
+    if regressions:
+        terminalreporter.write_line(f"❌ {regressions} {metric} regression(s) beyond {threshold:.0f}%")
+    else:
+        terminalreporter.write_line(f"✅ No {metric} regressions beyond {threshold:.0f}%")
@@ -0,0 +1,118 @@
+"""
+Result files of the performance suite (test_perf.py) and their comparison.
+
+A result file holds, per contract scale, the latency summary of every timed
+endpoint. `compare` diffs two of them; it backs both the suite's
+--perf-baseline option and `scripts/backend_test.py perf-compare`.
+"""
+
+import json
+import math
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+METRICS = ("p50", "p95", "mean")
+# Untimed requests sent before each timed series
+WARMUP_REQUESTS = 3
+
+
+def parse_scale(text):
+    """'10k' -> 10000, '1m' -> 1000000, '2500' -> 2500."""
+    text = text.strip().lower()
+    multiplier = {"k": 1000, "m": 1000000}.get(text[-1:], 1)
+    number = text[:-1] if multiplier > 1 else text
+    return int(float(number) * multiplier)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, errors):
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50": round(percentile(latencies, 50), 2),
+        "p95": round(percentile(latencies, 95), 2),
+        "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(scales, seed, blueprints, repeat):
+    """scales: {contract count: {endpoint: summary}}."""
+    return {
+        "createdAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "host": platform.node(),
+        "seed": seed,
+        "blueprints": blueprints,
+        "repeat": repeat,
+        "scales": {str(contracts): results for contracts, results in sorted(scales.items())},
+    }
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_report(path, report):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def same_dataset(baseline, current):
+    return (baseline.get("seed"), baseline.get("blueprints")) == (current.get("seed"), current.get("blueprints"))
+
+
+def compare(baseline, current, threshold=20.0, metric="p50", min_delta_ms=1.0):
+    """Rows (scale, endpoint, before, after, change %, regressed) for every endpoint in both reports."""
+    rows = []
+    for scale, results in current["scales"].items():
+        reference = baseline["scales"].get(scale)
+        if reference is None:
+            continue
+        for name, result in results.items():
+            if name not in reference:
+                continue
+            before, after = reference[name][metric], result[metric]
+            change = (after - before) / before * 100 if before else 0.0
+            regressed = change > threshold and after - before >= min_delta_ms
+            rows.append((scale, name, before, after, change, regressed))
+    return rows
+
+
+def format_comparison(rows):
+    lines = [f"{'SCALE':>9}  {'ENDPOINT':<28}{'BASE ms':>10}{'NOW ms':>10}{'CHANGE':>9}"]
+    for scale, name, before, after, change, regressed in rows:
+        marker = "  ❌" if regressed else ""
+        lines.append(f"{scale:>9}  {name:<28}{before:>10.1f}{after:>10.1f}{change:>+8.0f}%{marker}")
+    return lines
+
+
+def format_results(contracts, results):
+    lines = [
+        f"⏱️  {contracts} contracts",
+        f"{'ENDPOINT':<28}{'REQUESTS':>10}{'ERRORS':>8}{'P50 ms':>10}{'P95 ms':>10}{'MEAN ms':>10}",
+    ]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<28}{result['requests']:>10}{result['errors']:>8}{result['p50']:>10.1f}"
+            f"{result['p95']:>10.1f}{result['mean']:>10.1f}"
+        )
+    return lines
@@ -0,0 +1,293 @@
+"""
+Deterministic synthetic dataset for the performance suite (test_perf.py).
+
+Builds N blueprints and M contracts spread over every lifecycle status, with
+the history each status implies, and bulk-loads them straight into MongoDB
+(requires pymongo and the app's MONGO_URL / DB_NAME). Documents have the same
+shape as the ones the API writes: versioned blueprints with a snapshot in
+blueprint_versions, contracts with `values` by field id, the statusHistory
+tail, historyCount, statusChangedAt and search keys, and one contract_events
+entry per lifecycle step. The same seed and scale always produce the same
+documents: timestamps count back from the fixed EPOCH, not from the day of
+the run.
+
+Synthetic documents use ids starting with "perf-"; loading a dataset first
+removes the previous one. Use a dedicated database (DB_NAME) so timings are
+not skewed by other data.
+"""
+
+import os
+import random
+import re
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+PERF_PREFIX = "perf-"
+INSERT_BATCH_SIZE = 5000
+HISTORY_TAIL_SIZE = 5
+MAX_SEARCH_TOKENS = 100
+MAX_TOKEN_LENGTH = 64
+HISTORY_DAYS = 365
+# Newest timestamp of the dataset; every other one is derived from it and the seed
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Final status -> share of contracts; every status of CONTRACT_STATES is present
+STATUS_WEIGHTS = {
+    "created": 0.15,
+    "approved": 0.12,
+    "sent": 0.18,
+    "signed": 0.2,
+    "locked": 0.25,
+    "revoked": 0.1,
+}
+LIFECYCLE = ["created", "approved", "sent", "signed", "locked"]
+# Mean hours spent in a status before moving on
+MEAN_HOURS_IN_STATUS = {"created": 6, "approved": 12, "sent": 48, "signed": 72}
+STATUS_NOTES = {
+    "created": "Contract created",
+    "approved": "Approved for sending",
+    "sent": "Sent to counterparty",
+    "signed": "Signed by counterparty",
+    "locked": "Locked",
+    "revoked": "Revoked",
+}
+
+FIELD_SETS = [
+    [("text", "Counterparty"), ("date", "Effective Date"), ("signature", "Counterparty Signature")],
+    [("text", "Client Name"), ("text", "Scope"), ("date", "Start Date"), ("checkbox", "Accepts Terms"),
+     ("signature", "Client Signature")],
+    [("text", "Employee"), ("text", "Role"), ("date", "Start Date"), ("date", "End Date"),
+     ("checkbox", "Remote"), ("signature", "Employee Signature"), ("signature", "Manager Signature")],
+    [("text", "Supplier"), ("checkbox", "Confidential"), ("signature", "Supplier Signature")],
+]
+TEMPLATE_NAMES = ["Service Agreement", "Employment Contract", "Supply Agreement", "Consulting Contract",
+                  "Nondisclosure Agreement", "Lease Agreement", "Partnership Agreement", "Sales Contract"]
+COMPANY_WORDS = ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay",
+                 "Soylent", "Cyberdyne", "Tyrell", "Wonka", "Oscorp", "Gringotts", "Monarch", "Aperture"]
+COMPANY_SUFFIXES = ["Ltd", "GmbH", "Inc", "Holdings", "Partners", "Group", "Labs", "Industries"]
+SCOPE_WORDS = ["maintenance", "consulting", "delivery", "licensing", "support", "audit", "design",
+               "hosting", "training", "logistics", "research", "migration"]
+
+
+def _database():
+    try:
+        from pymongo import MongoClient
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise SystemExit("pymongo is required to load the synthetic dataset (pip install pymongo)") from e
+    client = MongoClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    return client[os.environ.get("DB_NAME", "contract_management")]
+
+
+def _iso(moment):
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def tokenize(text):
+    """Same tokens as lib/search.js tokenize()."""
+    if not isinstance(text, str):
+        return []
+    return [token[:MAX_TOKEN_LENGTH] for token in re.findall(r"[^\W_]+", text.lower())]
+
+
+def search_fields(name, blueprint_name, fields, values):
+    text = " ".join(
+        values[field["id"]].strip()
+        for field in fields
+        if field["type"] == "text" and isinstance(values[field["id"]], str) and values[field["id"]].strip()
+    )
+    tokens = list(dict.fromkeys(tokenize(name) + tokenize(blueprint_name) + tokenize(text)))
+    return {"text": text, "tokens": tokens[:MAX_SEARCH_TOKENS]}
+
+
+def blueprint_id(index):
+    return f"{PERF_PREFIX}bp-{index:05d}"
+
+
+def build_blueprints(count, rng, now):
+    blueprints = []
+    for index in range(count):
+        field_set = FIELD_SETS[index % len(FIELD_SETS)]
+        created_at = _iso(now - timedelta(days=HISTORY_DAYS + 30 - index % 30))
+        blueprints.append(
+            {
+                "id": blueprint_id(index),
+                "name": f"{TEMPLATE_NAMES[index % len(TEMPLATE_NAMES)]} {index + 1}",
+                "description": "Synthetic performance dataset",
+                "fields": [
+                    {
+                        "id": f"f{position}-{_uuid(rng)[:8]}",
+                        "type": field_type,
+                        "label": label,
+                        "position": {"x": 0, "y": position * 60},
+                        "required": field_type == "signature" or position == 0,
+                    }
+                    for position, (field_type, label) in enumerate(field_set)
+                ],
+                "version": 1,
+                "contractCount": 0,
+                "createdAt": created_at,
+                "updatedAt": created_at,
+            }
+        )
+    return blueprints
+
+
+def version_snapshot(blueprint):
+    return {
+        "blueprintId": blueprint["id"],
+        "version": blueprint["version"],
+        "name": blueprint["name"],
+        "description": blueprint["description"],
+        "fields": blueprint["fields"],
+        "createdAt": blueprint["updatedAt"],
+    }
+
+
+def status_path(final_status, rng):
+    if final_status != "revoked":
+        return LIFECYCLE[: LIFECYCLE.index(final_status) + 1]
+    # Revoked from created, approved or sent
+    return LIFECYCLE[: rng.randint(1, 3)] + ["revoked"]
+
+
+def field_values(fields, rng, signed):
+    values = {}
+    company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    for field in fields:
+        if field["type"] == "text":
+            values[field["id"]] = f"{company} {rng.choice(SCOPE_WORDS)}"
+        elif field["type"] == "date":
+            values[field["id"]] = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        elif field["type"] == "checkbox":
+            values[field["id"]] = rng.random() < 0.5
+        else:
+            values[field["id"]] = f"Signed by {company}" if signed else None
+    return values, company
+
+
+def build_contract(index, blueprint, rng, now):
+    final_status = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+    path = status_path(final_status, rng)
+    values, company = field_values(blueprint["fields"], rng, signed="signed" in path)
+    name = f"{blueprint['name'].rsplit(' ', 1)[0]} - {company} {index:07d}"
+
+    contract_id = f"{PERF_PREFIX}{_uuid(rng)}"
+    moment = now - timedelta(seconds=rng.uniform(0, HISTORY_DAYS * 86400))
+    history, events = [], []
+    previous, entered_at = None, None
+    for status in path:
+        if previous is not None:
+            moment = min(now, moment + timedelta(hours=rng.expovariate(1 / MEAN_HOURS_IN_STATUS[previous])))
+        timestamp = _iso(moment)
+        entry = {"status": status, "timestamp": timestamp, "note": STATUS_NOTES[status]}
+        if previous:
+            entry["previousStatus"] = previous
+        history.append(entry)
+        event = {"id": _uuid(rng), "contractId": contract_id, "blueprintId": blueprint["id"], **entry}
+        if previous:
+            event["durationInPreviousMs"] = int((moment - entered_at).total_seconds() * 1000)
+        events.append(event)
+        previous, entered_at = status, moment
+
+    contract = {
+        "id": contract_id,
+        "name": name,
+        "blueprintId": blueprint["id"],
+        "blueprintVersion": blueprint["version"],
+        "blueprintName": blueprint["name"],
+        "status": final_status,
+        "values": values,
+        "statusHistory": history[-HISTORY_TAIL_SIZE:],
+        "historyCount": len(history),
+        "statusChangedAt": history[-1]["timestamp"],
+        "search": search_fields(name, blueprint["name"], blueprint["fields"], values),
+        "version": len(history),
+        "createdAt": history[0]["timestamp"],
+        "updatedAt": history[-1]["timestamp"],
+    }
+    return contract, events
+
+
+def remove_dataset(db):
+    prefix = {"$regex": f"^{PERF_PREFIX}"}
+    removed = db.contracts.delete_many({"id": prefix}).deleted_count
+    db.contract_events.delete_many({"contractId": prefix})
+    db.blueprint_versions.delete_many({"blueprintId": prefix})
+    db.blueprints.delete_many({"id": prefix})
+    return removed
+
+
+def _admin_headers():
+    token = os.environ.get("ADMIN_TOKEN")
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def rebuild_derived(base_url):
+    """Recompute the counters and rollups the API maintains incrementally (needs ADMIN_TOKEN)."""
+    for path in ("/stats/reconcile", "/stats/timeseries/rebuild"):
+        response = requests.post(f"{base_url}{path}", headers=_admin_headers(), timeout=3600)
+        response.raise_for_status()
+
+
+def load_dataset(base_url, contracts, blueprints, seed=42, sample_size=0):
+    """Replace the synthetic dataset with `contracts` contracts over `blueprints` blueprints.
+
+    Returns the ids of `sample_size` contracts picked by the seed, recorded
+    while generating so the dataset is never read back.
+    """
+    db = _database()
+    rng = random.Random(f"{seed}:{blueprints}:{contracts}")
+    # Separate stream, so the sample size does not change the documents
+    sample_indices = set(
+        random.Random(f"sample:{seed}:{contracts}").sample(range(contracts), min(sample_size, contracts))
+    )
+    sample_ids = []
+
+    started = time.perf_counter()
+    removed = remove_dataset(db)
+    if removed:
+        print(f"🧹 Removed {removed} synthetic contracts of the previous dataset")
+
+    print(f"🌱 Loading {blueprints} blueprints and {contracts} contracts (seed {seed})")
+    blueprint_docs = build_blueprints(blueprints, rng, EPOCH)
+    counts = {blueprint["id"]: 0 for blueprint in blueprint_docs}
+    contract_batch, event_batch = [], []
+    for index in range(contracts):
+        blueprint = blueprint_docs[rng.randrange(blueprints)]
+        contract, events = build_contract(index, blueprint, rng, EPOCH)
+        counts[blueprint["id"]] += 1
+        if index in sample_indices:
+            sample_ids.append(contract["id"])
+        contract_batch.append(contract)
+        event_batch.extend(events)
+        if len(contract_batch) >= INSERT_BATCH_SIZE:
+            db.contracts.insert_many(contract_batch, ordered=False)
+            db.contract_events.insert_many(event_batch, ordered=False)
+            contract_batch, event_batch = [], []
+            if (index + 1) % 100000 == 0:
+                print(f"  … {index + 1}/{contracts} contracts")
+    if contract_batch:
+        db.contracts.insert_many(contract_batch, ordered=False)
+        db.contract_events.insert_many(event_batch, ordered=False)
+
+    for blueprint in blueprint_docs:
+        blueprint["contractCount"] = counts[blueprint["id"]]
+    db.blueprints.insert_many(blueprint_docs, ordered=False)
+    db.blueprint_versions.insert_many([version_snapshot(b) for b in blueprint_docs], ordered=False)
+
+    rebuild_derived(base_url)
+    print(f"  loaded in {time.perf_counter() - started:.1f}s")
+    return sample_ids
+
+
+def cleanup(base_url):
+    removed = remove_dataset(_database())
+    rebuild_derived(base_url)
+    print(f"🧹 Removed {removed} synthetic contracts")
@@ -0,0 +1,126 @@
+"""
+Endpoint timings over the seeded synthetic dataset (see conftest.py).
+
+Each test times --perf-repeat requests of one endpoint after a short warm-up
+and records the latency summary; it fails if any request returned an
+unexpected status. Reads run first, then the writes, which change the
+dataset (it is reloaded on the next run).
+"""
+
+import time
+
+import pytest
+
+from tests.perf_results import WARMUP_REQUESTS, summarize
+
+pytestmark = pytest.mark.perf
+
+# Endpoint name -> path template, filled from the loaded dataset
+READS = {
+    "list": "/contracts?limit=20",
+    "list-status": "/contracts?limit=20&status=sent",
+    "list-category": "/contracts?limit=20&category=signed",
+    "list-blueprint": "/contracts?limit=20&blueprintId={blueprint_id}",
+    "list-summary": "/contracts?limit=50&fields=summary",
+    "stats": "/stats",
+}
+
+
+def timed(http, method, url, expected_status, **kwargs):
+    started = time.perf_counter()
+    response = http.request(method, url, timeout=60, **kwargs)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return elapsed_ms, response.status_code == expected_status, response
+
+
+def time_requests(http, requests_to_time, expected_status):
+    """Time (method, url, kwargs) requests; returns (summary, responses of the successful ones)."""
+    latencies, errors, responses = [], 0, []
+    for method, url, kwargs in requests_to_time:
+        elapsed_ms, ok, response = timed(http, method, url, expected_status, **kwargs)
+        latencies.append(elapsed_ms)
+        errors += not ok
+        if ok:
+            responses.append(response)
+    return summarize(latencies, errors), responses
+
+
+def time_reads(http, urls):
+    for warm_url in urls[:WARMUP_REQUESTS]:
+        http.get(warm_url, timeout=60)
+    summary, _ = time_requests(http, [("GET", url, {}) for url in urls[WARMUP_REQUESTS:]], 200)
+    return summary
+
+
+def check(record, name, summary):
+    record(name, summary)
+    assert summary["errors"] == 0, f"{name}: {summary['errors']} of {summary['requests']} requests failed"
+
+
+@pytest.mark.parametrize("name", list(READS))
+def test_read(name, perf_dataset, http, base_url, perf_repeat, record):
+    url = base_url + READS[name].format(blueprint_id=perf_dataset.blueprint_id)
+    check(record, name, time_reads(http, [url] * (perf_repeat + WARMUP_REQUESTS)))
+
+
+def test_get_by_id(perf_dataset, http, base_url, record):
+    # Ids sampled by the seed while the dataset was generated
+    urls = [f"{base_url}/contracts/{contract_id}" for contract_id in perf_dataset.sample_ids]
+    check(record, "get-by-id", time_reads(http, urls))
+
+
+def test_create(perf_dataset, http, base_url, perf_repeat, record):
+    blueprint = http.get(f"{base_url}/blueprints/{perf_dataset.blueprint_id}", timeout=60).json()
+    field_values = {field["id"]: "Perf Suite" for field in blueprint["fields"] if field["type"] == "text"}
+    summary, responses = time_requests(
+        http,
+        [
+            ("POST", f"{base_url}/contracts", {
+                "json": {
+                    "name": f"Perf Suite Contract {index:05d}",
+                    "blueprintId": blueprint["id"],
+                    "fieldValues": field_values,
+                }
+            })
+            for index in range(perf_repeat)
+        ],
+        201,
+    )
+    # Keep the dataset at its generated size
+    for response in responses:
+        http.delete(f"{base_url}/contracts/{response.json()['id']}", timeout=60)
+    check(record, "create", summary)
+
+
+def test_transition(perf_dataset, http, base_url, perf_repeat, record):
+    pending = http.get(
+        f"{base_url}/contracts", params={"status": "created", "limit": perf_repeat, "fields": "summary"}, timeout=60
+    ).json()["contracts"]
+    summary, _ = time_requests(
+        http,
+        [
+            ("POST", f"{base_url}/contracts/{contract['id']}/transition", {"json": {"newStatus": "approved"}})
+            for contract in pending
+        ],
+        200,
+    )
+    check(record, "transition", summary)
+
+
+def test_blueprint_update(perf_dataset, http, base_url, perf_repeat, record):
+    # Editing an in-use blueprint creates a new version
+    url = f"{base_url}/blueprints/{perf_dataset.blueprint_id}"
+    summary, _ = time_requests(
+        http,
+        [("PUT", url, {"json": {"description": f"Synthetic performance dataset ({index})"}})
+         for index in range(perf_repeat)],
+        200,
+    )
+    check(record, "blueprint-update", summary)
+
+
+def test_blueprint_delete_protected(perf_dataset, http, base_url, perf_repeat, record):
+    # Deleting it must be refused while contracts reference it
+    url = f"{base_url}/blueprints/{perf_dataset.blueprint_id}"
+    summary, _ = time_requests(http, [("DELETE", url, {})] * perf_repeat, 400)
+    check(record, "blueprint-delete-protected", summary)